@@ -0,0 +1,195 @@
+"""Aggregate accuracy figures for the prediction store, kept in NumPy columns.
+
+Every prediction is one row of a small float matrix (count, scored, score,
+weight, weighted score). Grouped totals by status, timeline segment,
+category and month of ``lastEvaluated`` are built with ``np.add.at`` over
+those rows, and afterwards kept current from ContentStore notifications.
+A save subtracts the record's old row from its groups and adds the new one
+instead of recomputing anything.
+
+"Weighted" means weighted by evidence: a score counts once per entry in
+``supportingEvidence`` (at least once), so well-documented assessments
+weigh more than bare ones.
+"""
+import datetime
+
+import numpy as np
+
+from tracing import span
+
+# Columns of a row's contribution to its groups
+COUNT, SCORED, SCORE, WEIGHT, WEIGHTED_SCORE = range(5)
+GROUPINGS = ('status', 'timelineSegment', 'categories', 'month')
+
+
+def score_of(record):
+    score = record.get('accuracyScore')
+    if isinstance(score, (int, float)) and not isinstance(score, bool):
+        return float(score)
+    return None
+
+
+def evaluated_month(record):
+    """``'2025-05'`` for a valid ``lastEvaluated`` date, else None."""
+    value = record.get('lastEvaluated')
+    if not isinstance(value, str):
+        return None
+    try:
+        return datetime.date.fromisoformat(value).strftime('%Y-%m')
+    except ValueError:
+        return None
+
+
+def group_labels(record, grouping):
+    if grouping == 'month':
+        month = evaluated_month(record)
+        return [month] if month is not None else []
+    value = record.get(grouping)
+    values = value if isinstance(value, list) else [value]
+    return [item for item in values if isinstance(item, str) or item is None]
+
+
+def row_values(record):
+    score = score_of(record)
+    if score is None:
+        return np.array([1.0, 0.0, 0.0, 0.0, 0.0])
+    evidence = record.get('supportingEvidence')
+    weight = float(max(1, len(evidence) if isinstance(evidence, list) else 0))
+    return np.array([1.0, 1.0, score, weight, weight * score])
+
+
+class GroupTotals:
+    """Running totals per group label, one matrix row per label."""
+
+    def __init__(self):
+        self.labels = []
+        self._codes = {}
+        self.totals = np.zeros((0, 5))
+
+    def codes(self, labels):
+        codes = []
+        for label in labels:
+            code = self._codes.get(label)
+            if code is None:
+                code = self._codes[label] = len(self.labels)
+                self.labels.append(label)
+            codes.append(code)
+        if len(self.labels) > len(self.totals):
+            self.totals = np.vstack([self.totals, np.zeros((len(self.labels) - len(self.totals), 5))])
+        return np.array(codes, dtype=np.intp)
+
+    def add(self, codes, values, sign=1.0):
+        """Add ``values`` (one row, or one row per code) into the groups ``codes``."""
+        np.add.at(self.totals, codes, sign * values)
+
+
+class AccuracyAnalytics:
+    def __init__(self, store):
+        self.store = store
+        self.built = False
+        self._values = np.zeros((0, 5)) # Per store row
+        self._codes = [] # Per store row: {grouping: codes}
+        self._groups = {}
+        store.add_listener(self)
+
+    def build(self):
+        with span('analytics.build', records=len(self.store)):
+            self._build()
+
+    def _build(self):
+        self._groups = {grouping: GroupTotals() for grouping in GROUPINGS}
+        records = list(self.store.iter_full())
+        self._values = np.array([row_values(record) for record in records]).reshape(-1, 5)
+        self._codes = [{grouping: self._groups[grouping].codes(group_labels(record, grouping)) for grouping in GROUPINGS}
+                       for record in records]
+        for grouping, groups in self._groups.items():
+            # One scatter-add per grouping over (row, group) pairs
+            rows = np.concatenate([np.full(len(codes[grouping]), row, dtype=np.intp)
+                                   for row, codes in enumerate(self._codes)] or [np.zeros(0, dtype=np.intp)])
+            codes = np.concatenate([codes[grouping] for codes in self._codes] or [np.zeros(0, dtype=np.intp)])
+            groups.add(codes, self._values[rows])
+        self.built = True
+
+    def _ensure_built(self):
+        if not self.built:
+            self.build()
+
+    # Queries
+    def overall(self):
+        self._ensure_built()
+        return _figures(self._values.sum(axis=0))
+
+    def by(self, grouping, order=None):
+        """Figures per group, most common first, or following ``order`` where given.
+
+        Each is ``{'label', 'count', 'scored', 'mean', 'weighted_mean'}``; means
+        are None where nothing in the group has a score. Empty groups are left out.
+        """
+        self._ensure_built()
+        groups = self._groups[grouping]
+        rows = [dict(label=label, **_figures(totals)) for label, totals in zip(groups.labels, groups.totals)
+                if totals[COUNT] > 0.5]
+        if order is not None:
+            rank = {label: position for position, label in enumerate(order)}
+            rows.sort(key=lambda row: (rank.get(row['label'], len(rank)), str(row['label'])))
+        elif grouping == 'month':
+            rows.sort(key=lambda row: row['label'])
+        else:
+            rows.sort(key=lambda row: (-row['count'], str(row['label'])))
+        return rows
+
+    def status_distribution(self, order=None):
+        """``(status, count, share)`` per status."""
+        rows = self.by('status', order)
+        total = sum(row['count'] for row in rows) or 1
+        return [(row['label'], row['count'], row['count'] / total) for row in rows]
+
+    def over_time(self):
+        """Scores by month of ``lastEvaluated``, with the running mean up to each month."""
+        rows = self.by('month')
+        scored = np.array([row['scored'] for row in rows], dtype=float)
+        sums = np.array([(row['mean'] or 0.0) * row['scored'] for row in rows])
+        with np.errstate(invalid='ignore', divide='ignore'):
+            running = np.cumsum(sums) / np.cumsum(scored)
+        for row, value in zip(rows, running):
+            row['cumulative_mean'] = None if np.isnan(value) else float(value)
+        return rows
+
+    # ContentStore listener interface
+    def record_changed(self, old, new):
+        if not self.built:
+            return
+        row = self.store.row_of(new['id'])
+        if old is None:
+            self._values = np.vstack([self._values, np.zeros((1, 5))])
+            self._codes.append({grouping: np.zeros(0, dtype=np.intp) for grouping in GROUPINGS})
+        else:
+            self._apply_row(row, -1.0) # Old contributions come from the row, not from ``old``, which may be a stub
+        self._values[row] = row_values(new)
+        self._codes[row] = {grouping: self._groups[grouping].codes(group_labels(new, grouping)) for grouping in GROUPINGS}
+        self._apply_row(row, 1.0)
+
+    def record_removed(self, record, row):
+        if not self.built:
+            return
+        self._apply_row(row, -1.0)
+        self._values = np.delete(self._values, row, axis=0)
+        del self._codes[row]
+
+    def store_reset(self, store):
+        self.built = False
+
+    def _apply_row(self, row, sign):
+        for grouping, codes in self._codes[row].items():
+            if len(codes):
+                self._groups[grouping].add(codes, self._values[row], sign)
+
+
+def _figures(totals):
+    scored = int(round(totals[SCORED]))
+    return {
+        'count': int(round(totals[COUNT])),
+        'scored': scored,
+        'mean': float(totals[SCORE] / totals[SCORED]) if scored else None,
+        'weighted_mean': float(totals[WEIGHTED_SCORE] / totals[WEIGHT]) if scored else None,
+    }
@@ -0,0 +1,93 @@
+"""Dashboard tab: accuracy by status, category, segment and over time (see analytics.py)."""
+from PyQt6.QtCore import Qt
+from PyQt6.QtWidgets import (
+    QGridLayout, QHeaderView, QLabel, QTableWidget, QTableWidgetItem, QVBoxLayout, QWidget
+)
+
+from analytics import AccuracyAnalytics
+
+GROUP_COLUMNS = (("Predictions", 'count'), ("Scored", 'scored'), ("Mean", 'mean'), ("Evidence-weighted", 'weighted_mean'))
+STATUS_COLUMNS = (("Predictions", 'count'), ("Share", 'share'))
+TIME_COLUMNS = (("Scored", 'scored'), ("Mean", 'mean'), ("Running mean", 'cumulative_mean'))
+
+
+def _format(value):
+    if value is None:
+        return "–"
+    if isinstance(value, float):
+        return f"{value:.1f}"
+    return str(value)
+
+
+def _table(label_title, columns):
+    table = QTableWidget(0, len(columns) + 1)
+    table.setHorizontalHeaderLabels([label_title] + [title for title, key in columns])
+    table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+    table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+    table.verticalHeader().setVisible(False)
+    return table
+
+
+def _fill(table, rows, columns):
+    table.setRowCount(len(rows))
+    for row, figures in enumerate(rows):
+        label = figures['label']
+        table.setItem(row, 0, QTableWidgetItem("(none)" if label is None else str(label)))
+        for column, (title, key) in enumerate(columns, start=1):
+            item = QTableWidgetItem(_format(figures.get(key)))
+            item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+            table.setItem(row, column, item)
+
+
+class AccuracyDashboard(QWidget):
+    def __init__(self, store, status_order=None, parent=None):
+        super().__init__(parent)
+        self.analytics = AccuracyAnalytics(store)
+        self.status_order = status_order
+        self.stale = True
+        layout = QVBoxLayout(self)
+
+        header = QLabel("Accuracy Dashboard")
+        header.setObjectName("HeaderLabel")
+        layout.addWidget(header)
+        self.summary_label = QLabel()
+        layout.addWidget(self.summary_label)
+
+        grid = QGridLayout()
+        self.status_table = _table("Status", STATUS_COLUMNS)
+        self.category_table = _table("Category", GROUP_COLUMNS)
+        self.segment_table = _table("Timeline segment", GROUP_COLUMNS)
+        self.time_table = _table("Evaluated", TIME_COLUMNS)
+        for position, (title, table) in enumerate((("By status", self.status_table), ("By category", self.category_table),
+                                                   ("By timeline segment", self.segment_table),
+                                                   ("Scores over time", self.time_table))):
+            label = QLabel(title)
+            label.setObjectName("SubHeaderLabel")
+            grid.addWidget(label, (position // 2) * 2, position % 2)
+            grid.addWidget(table, (position // 2) * 2 + 1, position % 2)
+        layout.addLayout(grid)
+
+    def showEvent(self, event):
+        if self.stale:
+            self.refresh()
+        super().showEvent(event)
+
+    def schedule_refresh(self):
+        """The figures are already current; redraw now if shown, else when next shown."""
+        self.stale = True
+        if self.isVisible():
+            self.refresh()
+
+    def refresh(self):
+        self.stale = False
+        analytics = self.analytics
+        overall = analytics.overall()
+        self.summary_label.setText(
+            f"{overall['count']} predictions, {overall['scored']} scored. "
+            f"Mean accuracy {_format(overall['mean'])}, evidence-weighted {_format(overall['weighted_mean'])}.")
+        _fill(self.status_table, [{'label': status, 'count': count, 'share': f"{share:.0%}"}
+                                  for status, count, share in analytics.status_distribution(self.status_order)],
+              STATUS_COLUMNS)
+        _fill(self.category_table, analytics.by('categories'), GROUP_COLUMNS)
+        _fill(self.segment_table, analytics.by('timelineSegment'), GROUP_COLUMNS)
+        _fill(self.time_table, analytics.over_time(), TIME_COLUMNS)
@@ -0,0 +1,151 @@
+"""Data file I/O off the GUI thread.
+
+``run_in_pool`` runs a function on a QThreadPool and reports back through
+signals, which Qt delivers on the GUI thread. ``BackgroundWriter`` queues
+saves for one JournaledJsonFile and writes them from the pool one batch at a
+time. Saves that arrive while a batch is being written, or within
+SAVE_COALESCE_MS of each other, go out together with a single fsync.
+Compaction writes a snapshot of the record list taken on the GUI thread, so
+the store can keep changing while the file is rewritten.
+"""
+from PyQt6.QtCore import QCoreApplication, QObject, QRunnable, QTimer, pyqtSignal
+
+from journal import FileChangedError
+
+SAVE_COALESCE_MS = 300
+
+
+class _TaskSignals(QObject):
+    finished = pyqtSignal(object)
+    failed = pyqtSignal(object)
+
+
+class _Task(QRunnable):
+    def __init__(self, func, args):
+        super().__init__()
+        self.func = func
+        self.args = args
+        self.signals = _TaskSignals()
+
+    def run(self):
+        try:
+            result = self.func(*self.args)
+        except Exception as e:
+            self.signals.failed.emit(e)
+        else:
+            self.signals.finished.emit(result)
+
+
+def run_in_pool(pool, func, *args, on_done=None, on_error=None):
+    """Run ``func(*args)`` on ``pool``; callbacks get the result or the exception."""
+    task = _Task(func, args)
+    if on_done is not None:
+        task.signals.finished.connect(on_done)
+    if on_error is not None:
+        task.signals.failed.connect(on_error)
+    pool.start(task)
+    return task
+
+
+class BackgroundWriter(QObject):
+    saved = pyqtSignal(int, bool) # Records written, whether the file was compacted
+    failed = pyqtSignal(str)
+    file_changed = pyqtSignal() # Compaction found the file replaced by another program
+
+    def __init__(self, data_file, store, pool, parent=None):
+        super().__init__(parent)
+        self.data_file = data_file
+        self.store = store
+        self.pool = pool
+        self.enabled = False # Set once the data has loaded; nothing is written before that
+        self._queued = [] # (record, previous_id) not yet handed to the pool
+        self._writing_ids = set() # Ids in the batch the pool is writing
+        self._compact_requested = False
+        self._task = None
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(SAVE_COALESCE_MS)
+        self._timer.timeout.connect(self._flush)
+
+    @property
+    def busy(self):
+        return self._task is not None or bool(self._queued) or self._compact_requested
+
+    def queued_ids(self):
+        """Ids of saves not yet in the journal."""
+        return self._writing_ids | {record.get('id') for record, previous_id in self._queued}
+
+    def save(self, record, previous_id=None):
+        self._queued.append((record, previous_id))
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def save_many(self, saves):
+        """Queue ``(record, previous_id)`` pairs to go out together as one journal write."""
+        self._queued.extend(saves)
+        self._timer.stop()
+        self._flush()
+
+    def request_compaction(self):
+        if not self.enabled or not (self.data_file.pending or self._queued):
+            return
+        self._compact_requested = True
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def _flush(self):
+        if self._task is not None or not self.enabled:
+            return # Picked up again when the running batch finishes
+        if not self._queued and not self._compact_requested:
+            return
+        saves, self._queued = self._queued, []
+        compact = self._compact_requested or self.data_file.pending + len(saves) >= self.data_file.compact_every
+        snapshot = list(self.store.records) if compact else None
+        # The file the snapshot matches; compaction refuses to replace any other
+        signature = self.data_file.signature
+        self._compact_requested = False
+        self._writing_ids = {record.get('id') for record, previous_id in saves}
+        self._task = run_in_pool(self.pool, self._write, saves, snapshot, signature,
+                                 on_done=self._on_written, on_error=lambda e: self._on_failed(e, saves))
+
+    def _write(self, saves, snapshot, signature):
+        # Runs on a pool thread; this writer never has two batches in flight
+        count = len(saves)
+        if saves:
+            self.data_file.append_many(saves)
+            saves.clear() # Journaled; a failed compaction must not queue them again
+        if snapshot is not None:
+            self.data_file.compact(snapshot, signature)
+        return count, snapshot is not None
+
+    def _on_written(self, result):
+        self._task = None
+        self._writing_ids = set()
+        self.saved.emit(*result)
+        if self._queued or self._compact_requested:
+            self._timer.start()
+
+    def _on_failed(self, error, saves):
+        self._task = None
+        self._writing_ids = set()
+        self._queued[:0] = saves # Retried with the next save or on exit
+        if isinstance(error, FileChangedError):
+            self.file_changed.emit() # Compacted again once the outside edits are merged in
+        else:
+            self.failed.emit(str(error))
+
+    def finish(self):
+        """Block until everything queued is on disk, then compact. Used on exit."""
+        self._timer.stop()
+        if self._task is not None:
+            self.pool.waitForDone()
+            QCoreApplication.sendPostedEvents() # Deliver its finished/failed signal
+            self._task = None
+        if not self.enabled:
+            return
+        if self._queued:
+            saves, self._queued = self._queued, []
+            self.data_file.append_many(saves)
+        self._compact_requested = False
+        if self.data_file.pending:
+            self.data_file.compact(self.store.records)
@@ -0,0 +1,147 @@
+"""Check link_checker against a local HTTP server, without touching the network.
+
+Starts a ThreadingHTTPServer on 127.0.0.1 whose paths behave like the sites
+the checker meets (fine, gone, refusing, HEAD not allowed, redirecting,
+redirecting forever), checks every path twice and compares what comes back
+with what the server saw: the health of each link, the GET fallback after a
+405, redirects followed, 304s on the second run, and connections reused
+rather than opened per request. Exits 1 if anything differs:
+
+    python -m benchmarks.check_link_checker
+"""
+import sys
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+from link_checker import MAX_REDIRECTS, LinkCache, LinkChecker
+
+PER_HOST = 2
+FINE_LINKS = 12 # Distinct URLs (by query) for the same fine page
+ETAG = '"v1"'
+LAST_MODIFIED = 'Mon, 05 Oct 2026 10:00:00 GMT'
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1' # Keep-alive, so the checker can reuse connections
+
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def log_message(self, format, *args):
+        pass
+
+    def _respond(self, status, headers=(), body=b''):
+        # Not send_error: that closes the connection, and reuse is part of what is checked
+        self.send_response(status)
+        for name, value in headers:
+            self.send_header(name, value)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        if self.command != 'HEAD':
+            self.wfile.write(body)
+
+    def _handle(self):
+        path = urlsplit(self.path).path # The query only makes URLs distinct
+        with self.server.lock:
+            self.server.requests.append((self.command, path, dict(self.headers)))
+        if path in ('/fine', '/moved-here'):
+            if self.headers.get('If-None-Match') == ETAG:
+                self._respond(304, [('ETag', ETAG)])
+            else:
+                self._respond(200, [('ETag', ETAG), ('Last-Modified', LAST_MODIFIED)], b'<html>fine</html>')
+        elif path == '/no-head':
+            if self.command == 'HEAD':
+                self._respond(405, [('Allow', 'GET')])
+            else:
+                self._respond(206, [('Content-Range', 'bytes 0-0/17')], b'<')
+        elif path == '/moved':
+            self._respond(301, [('Location', '/moved-here')])
+        elif path == '/loop':
+            self._respond(302, [('Location', '/loop')])
+        elif path == '/refused':
+            self._respond(403, body=b'no robots')
+        else:
+            self._respond(404, body=b'not found')
+
+    do_HEAD = do_GET = _handle
+
+
+def start_server():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+    server.daemon_threads = True
+    server.lock = threading.Lock()
+    server.connections = 0
+    server.requests = [] # (method, path, headers)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def problems(server, cache_path):
+    """What differs from the expected behaviour, as a list of messages."""
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    fine = [f"{base}/fine?n={n}" for n in range(FINE_LINKS)]
+    urls = fine + [f"{base}{path}" for path in ('/gone', '/refused', '/no-head', '/moved', '/loop')]
+    found = []
+
+    def expect(name, actual, expected):
+        if actual != expected:
+            found.append(f"{name}: got {actual!r}, expected {expected!r}")
+
+    # First run: everything is probed
+    cache = LinkCache(cache_path)
+    stats = LinkChecker(cache, per_host=PER_HOST).run(urls)
+    expect("first run probed", stats['probed'], len(urls))
+    expect("first run revalidated", stats['revalidated'], 0)
+    expect("first run connections as the server counted them", stats['connections'], server.connections)
+    if not 1 <= stats['connections'] <= PER_HOST:
+        found.append(f"first run opened {stats['connections']} connections for {len(server.requests)} requests; "
+                     f"at most {PER_HOST} (the per-host limit) should be needed")
+    health = {url: cache.health(url) for url in urls}
+    expect("fine links", {health[url] for url in fine}, {'ok'})
+    for path, expected in (('/gone', 'broken'), ('/refused', 'blocked'), ('/no-head', 'ok'), ('/moved', 'ok'),
+                           ('/loop', 'error')):
+        expect(f"{path} health", health[f"{base}{path}"], expected)
+    expect("/moved final URL", cache.get(f"{base}/moved")['finalUrl'], f"{base}/moved-here")
+    expect("/loop requests", sum(1 for method, path, headers in server.requests if path == '/loop'), MAX_REDIRECTS + 1)
+    fallback = [(method, headers.get('Range')) for method, path, headers in server.requests if path == '/no-head']
+    expect("/no-head requests", fallback, [('HEAD', None), ('GET', 'bytes=0-0')])
+
+    # Same links within the TTL: nothing to probe
+    stats = LinkChecker(LinkCache(cache_path), per_host=PER_HOST).run(urls)
+    expect("fresh run probed", stats['probed'], 0)
+
+    # Everything stale: the fine pages answer 304 to their ETag
+    before_requests, before_connections = len(server.requests), server.connections
+    cache = LinkCache(cache_path)
+    stats = LinkChecker(cache, ttl_days=0, failure_ttl_days=0, per_host=PER_HOST).run(urls)
+    expect("stale run probed", stats['probed'], len(urls))
+    expect("stale run revalidated", stats['revalidated'], FINE_LINKS + 1) # + /moved, via /moved-here
+    expect("stale run connections as the server counted them", stats['connections'],
+           server.connections - before_connections)
+    conditional = {path for method, path, headers in server.requests[before_requests:]
+                   if headers.get('If-None-Match') == ETAG and headers.get('If-Modified-Since') == LAST_MODIFIED}
+    expect("paths sent conditional requests", conditional, {'/fine', '/moved', '/moved-here'})
+    expect("health after revalidating", {url: cache.health(url) for url in urls}, health)
+    return found
+
+
+def main(argv=None):
+    server = start_server()
+    try:
+        with tempfile.TemporaryDirectory(prefix='link-check-') as scratch:
+            found = problems(server, f"{scratch}/links.json")
+    finally:
+        server.shutdown()
+        server.server_close()
+    for message in found:
+        print(f"Mismatch: {message}", file=sys.stderr)
+    print(f"{len(found)} problem{'s' if len(found) != 1 else ''} with link_checker against a local server")
+    return 1 if found else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
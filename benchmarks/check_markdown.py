@@ -0,0 +1,63 @@
+"""Check that the block-by-block preview renders exactly like converting the whole post.
+
+Runs BlockRenderer over the real blog posts, plus a few posts built around
+what reaches across blocks (reference links, loose lists), and compares each
+with one ``markdown.Markdown(...).convert`` of the same text. Exits 1 on any
+difference:
+
+    python -m benchmarks.check_markdown
+    python -m benchmarks.check_markdown path/to/blogPosts.json
+"""
+import json
+import os
+import sys
+
+import markdown
+
+from markdown_renderer import MARKDOWN_EXTENSIONS, BlockRenderer
+
+SCRIPT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BLOG_POSTS_FILE = os.path.join(SCRIPT_DIR, 'src', 'data', 'blogPosts.json')
+# (name, Markdown) for the cross-block cases
+CASES = (
+    ("reference links", "See [the report][r1], [this][] and [r1].\n\nMore text.\n\n"
+                        "[r1]: https://example.org/a \"Title\"\n[this]: https://example.org/b"),
+    ("loose lists", "- a\n\n- b\n\n    continued\n\n- c\n\nPara\n\n1. x\n\n2. y\n\n3. z\n\n- after"),
+    ("list kinds", "1. a\n2. b\n\n- c\n\n- d\n"),
+    ("gfm and raw html", "~~old~~ see https://example.org/a_(b).\n\n<div>\n\nraw <b>html</b>\n\n</div>\n\n"
+                         "- www.example.com\n\n- [x](javascript:alert(1))"),
+    ("definitions in code", "```\n[x]: not a definition\n```\n\n* one\n\n* two\n\nText [x] here.\n\n[x]: http://example.org"),
+)
+
+
+def full_render(md_text):
+    return markdown.Markdown(extensions=MARKDOWN_EXTENSIONS).convert(md_text)
+
+
+def mismatches(posts, renderer=None):
+    """Names of the ``(name, markdown)`` posts whose block render differs from a full one."""
+    renderer = renderer or BlockRenderer()
+    failed = []
+    for name, md_text in posts:
+        expected = full_render(md_text)
+        # Twice: converted, then from the cache
+        if renderer.render(md_text) != expected or renderer.render(md_text) != expected:
+            failed.append(name)
+    return failed
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    path = argv[0] if argv else BLOG_POSTS_FILE
+    with open(path, 'r', encoding='utf-8') as f:
+        posts = [(post.get('id', '?'), post.get('content') or '') for post in json.load(f)]
+    posts += CASES
+    failed = mismatches(posts)
+    for name in failed:
+        print(f"Mismatch: {name}", file=sys.stderr)
+    print(f"{len(posts) - len(failed)}/{len(posts)} posts render the same block by block")
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,231 @@
+"""Time the editor's hot paths on synthetic corpora, headless.
+
+Runs EditorWindow under Qt's offscreen platform against generated data files
+and writes latency summaries (see latency.LatencyRecorder) as JSON:
+
+    python -m benchmarks.run --sizes 1000 10000 100000 --output bench.json
+    python -m benchmarks.run --compare bench.json   # flag regressions vs an earlier run
+
+Modal dialogs are replaced with no-ops for the run, and the Markdown preview
+uses the QTextBrowser backend unless --preview-backend says otherwise.
+"""
+import argparse
+import datetime
+import json
+import os
+import platform
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PyQt6.QtCore import QT_VERSION_STR
+from PyQt6.QtWidgets import QApplication, QMessageBox
+
+import content_editor
+from benchmarks.synthetic import CorpusModel, generate
+from latency import LatencyRecorder
+
+DEFAULT_SIZES = (1000, 10000, 100000)
+REGRESSION_THRESHOLD = 1.2 # A p50 this many times slower counts as a regression
+
+
+def _silence_dialogs():
+    QMessageBox.information = staticmethod(lambda *args, **kwargs: QMessageBox.StandardButton.Ok)
+    QMessageBox.warning = staticmethod(lambda *args, **kwargs: QMessageBox.StandardButton.Ok)
+    QMessageBox.question = staticmethod(lambda *args, **kwargs: QMessageBox.StandardButton.Yes)
+    def critical(parent, title, text, *args, **kwargs):
+        print(f"Error during benchmark: {title}: {text}", file=sys.stderr)
+        return QMessageBox.StandardButton.Ok
+    QMessageBox.critical = staticmethod(critical)
+
+
+def _timed(recorder, func, *args):
+    with recorder.measure():
+        return func(*args)
+
+
+def bench_window(app, predictions_path, blog_posts_path, repeat, samples, preview_backend, seed):
+    """Run every measurement against one corpus; returns {metric: summary}."""
+    rng = random.Random(seed)
+    metrics = {name: LatencyRecorder() for name in (
+        'construct_window', 'load_all_data', 'list_population', 'display_prediction_details',
+        'get_data_from_widgets', 'save_data_to_file', 'save_drain', 'compact', 'update_markdown_preview_full',
+        'update_markdown_preview_edit')}
+
+    # The undo history is saved on close, so keep it with the scratch data rather than the real one
+    history_path = os.path.join(os.path.dirname(predictions_path), '.editor-history.json')
+    # Synchronous load, so construct_window and load_all_data measure the full parse
+    window = _timed(metrics['construct_window'], content_editor.EditorWindow, preview_backend, False,
+                    predictions_path, blog_posts_path, False, content_editor.STORAGE_BACKEND, history_path)
+    window.show()
+    app.processEvents()
+    for _ in range(repeat):
+        _timed(metrics['load_all_data'], window.load_all_data)
+
+    model = window.predictions_model
+    view = window.predictions_list_view
+    def populate():
+        model.set_visible_rows(None)
+        view.doItemsLayout()
+        app.processEvents()
+    for _ in range(repeat):
+        _timed(metrics['list_population'], populate)
+
+    store = window.predictions_store
+    rows = [rng.randrange(len(store)) for _ in range(samples)] if len(store) else []
+    for row in rows:
+        _timed(metrics['display_prediction_details'], window.display_prediction_details, model.index(row))
+        form = window.prediction_form
+        form.fill_all()
+        record = store.full_at(row)
+        _timed(metrics['get_data_from_widgets'], window._get_data_from_widgets, record, form.filled_widgets())
+
+    data_file = window.predictions_file
+    writer = window.predictions_writer
+    data_file.compact_every = samples + 1 # Keep compaction out of the per-save numbers
+    def drain():
+        while writer.busy:
+            app.processEvents()
+            time.sleep(0.0005)
+    for row in rows:
+        record = store.full_at(row)
+        _timed(metrics['save_data_to_file'], window._save_data_to_file, writer, record, "Predictions")
+        _timed(metrics['save_drain'], drain) # Until the coalesced batch is fsynced
+    _timed(metrics['compact'], data_file.compact, store.records)
+
+    if len(window.blog_posts_store):
+        window._create_markdown_preview()
+        editor = window.blog_content_edit
+        longest = max(window.blog_posts_store.iter_full(), key=lambda post: len(post.get('content') or ''))
+        for _ in range(repeat):
+            window.markdown_preview.renderer.clear_cache() # Cold render of every block
+            editor.setPlainText(longest.get('content') or '')
+            _timed(metrics['update_markdown_preview_full'], window.update_markdown_preview)
+        for _ in range(samples):
+            cursor = editor.textCursor()
+            cursor.movePosition(cursor.MoveOperation.End)
+            cursor.insertText('x')
+            _timed(metrics['update_markdown_preview_edit'], window.update_markdown_preview)
+
+    window.predictions_file.close()
+    window.blog_posts_file.close()
+    window.close()
+    window.deleteLater()
+    app.processEvents()
+    return {name: recorder.summary() for name, recorder in metrics.items()}
+
+
+def git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=content_editor.SCRIPT_DIR,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(sizes, data_dir=None, repeat=3, samples=50, preview_backend='textbrowser', seed=0):
+    app = QApplication.instance() or QApplication([sys.argv[0]])
+    _silence_dialogs()
+    corpus_model = CorpusModel()
+    scratch = tempfile.mkdtemp(prefix='editor-bench-')
+    results = {
+        "generated_at": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec='seconds'),
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "qt": QT_VERSION_STR,
+        "qpa_platform": os.environ.get('QT_QPA_PLATFORM'),
+        "preview_backend": preview_backend,
+        "seed": seed,
+        "runs": [],
+    }
+    try:
+        for size in sizes:
+            source_dir = os.path.join(data_dir or scratch, f"{size}-seed{seed}")
+            if not os.path.exists(os.path.join(source_dir, 'predictions.json')):
+                started = time.perf_counter()
+                generate(size, source_dir, seed, corpus_model)
+                print(f"Generated {size} records in {time.perf_counter() - started:.1f} s", file=sys.stderr)
+            # Benchmarks write to their files, so always work on a copy
+            work_dir = os.path.join(scratch, 'work')
+            shutil.rmtree(work_dir, ignore_errors=True)
+            shutil.copytree(source_dir, work_dir)
+            predictions_path = os.path.join(work_dir, 'predictions.json')
+            blog_posts_path = os.path.join(work_dir, 'blogPosts.json')
+            run_result = {
+                "records": size,
+                "predictions_mb": round(os.path.getsize(predictions_path) / 1e6, 2),
+                "blog_posts_mb": round(os.path.getsize(blog_posts_path) / 1e6, 2),
+                "metrics": bench_window(app, predictions_path, blog_posts_path, repeat, samples, preview_backend, seed),
+            }
+            results["runs"].append(run_result)
+            print(format_run(run_result), file=sys.stderr)
+    finally:
+        shutil.rmtree(scratch, ignore_errors=True)
+    return results
+
+
+def format_run(run_result):
+    lines = [f"{run_result['records']} records ({run_result['predictions_mb']} MB):"]
+    for name, stats in run_result["metrics"].items():
+        if stats["count"]:
+            lines.append(f"  {name:<30}p50 {stats['p50_ms']:9.2f} ms  p95 {stats['p95_ms']:9.2f} ms  (n={stats['count']})")
+    return "\n".join(lines)
+
+
+def compare(old, new, threshold=REGRESSION_THRESHOLD):
+    """Lines describing p50 changes between two result files, and the regression count."""
+    old_runs = {run_result["records"]: run_result["metrics"] for run_result in old.get("runs", ())}
+    lines = [f"Comparing {old.get('commit') or 'previous'} -> {new.get('commit') or 'current'}"]
+    regressions = 0
+    for run_result in new["runs"]:
+        previous = old_runs.get(run_result["records"])
+        if previous is None:
+            continue
+        lines.append(f"{run_result['records']} records:")
+        for name, stats in run_result["metrics"].items():
+            before = previous.get(name, {})
+            if not stats["count"] or not before.get("count"):
+                continue
+            ratio = stats["p50_ms"] / before["p50_ms"] if before["p50_ms"] else float('inf')
+            flag = ""
+            if ratio >= threshold:
+                flag = "  REGRESSION"
+                regressions += 1
+            lines.append(f"  {name:<30}{before['p50_ms']:9.2f} -> {stats['p50_ms']:9.2f} ms  ({ratio:.2f}x){flag}")
+    return lines, regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the content editor on synthetic data.")
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(DEFAULT_SIZES),
+                        help="Prediction counts to generate (e.g. 1000 10000 100000 1000000)")
+    parser.add_argument('--data-dir', help="Keep generated corpora here and reuse them across runs")
+    parser.add_argument('--repeat', type=int, default=3, help="Repetitions of the whole-file operations")
+    parser.add_argument('--samples', type=int, default=50, help="Records opened and saved per size")
+    parser.add_argument('--preview-backend', choices=content_editor.PREVIEW_BACKENDS, default='textbrowser')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', help="Write results JSON here (default: stdout)")
+    parser.add_argument('--compare', help="Earlier results JSON to compare against")
+    args = parser.parse_args(argv)
+
+    results = run(args.sizes, args.data_dir, args.repeat, args.samples, args.preview_backend, args.seed)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+    else:
+        print(json.dumps(results, indent=2))
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            lines, regressions = compare(json.load(f), results)
+        print("\n".join(lines), file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,82 @@
+"""Where ShardedDataFile.load spends its time, and what parsing in processes would cost.
+
+Splits a synthetic corpus into shards and times, separately: reading the
+shards on a thread pool (what load does), parsing them one after another
+(also what load does), parsing them on a process pool, and just unpickling
+the parsed records, which a process pool can't avoid since each worker's
+records have to come back to this process. When the unpickling alone is no
+cheaper than the serial parse, no number of processes makes the parse faster:
+
+    python -m benchmarks.sharded_load --size 50000
+"""
+import argparse
+import json
+import os
+import pickle
+import shutil
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from benchmarks.synthetic import CorpusModel, generate
+from sharded_storage import ShardedDataFile, split
+
+
+def _parse_chunk(raws):
+    return [json.loads(raw) for raw in raws]
+
+
+def _seconds(func, *args):
+    started = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - started, result
+
+
+def measure(path, workers=None):
+    """``{step: seconds}`` for the shards of the JSON file at ``path``."""
+    data_file = ShardedDataFile(path)
+    data_file.load() # Splits if needed, and warms the page cache
+    order = data_file._read_manifest()
+    timings = {}
+    def read():
+        with ThreadPoolExecutor() as pool:
+            return list(pool.map(data_file._read_shard, order))
+    timings['read (thread pool)'], raws = _seconds(read)
+    timings['parse (serial)'], records = _seconds(_parse_chunk, raws)
+    workers = workers or os.cpu_count() or 1
+    size = len(raws) // (4 * workers) + 1
+    chunks = [raws[start:start + size] for start in range(0, len(raws), size)]
+    def parse_in_processes():
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            return [record for chunk in pool.map(_parse_chunk, chunks) for record in chunk]
+    timings[f'parse ({workers} processes)'], parallel = _seconds(parse_in_processes)
+    pickled = pickle.dumps(records, protocol=pickle.HIGHEST_PROTOCOL)
+    timings['unpickle only'], _ = _seconds(pickle.loads, pickled)
+    assert parallel == records
+    timings['load'], _ = _seconds(data_file.load)
+    return timings
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Time the parts of loading sharded data.")
+    parser.add_argument('--size', type=int, default=50000, help="Predictions to generate")
+    parser.add_argument('--workers', type=int, default=None, help="Processes for the parallel parse")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+    scratch = tempfile.mkdtemp(prefix='sharded-bench-')
+    try:
+        generate(args.size, scratch, args.seed, CorpusModel())
+        path = os.path.join(scratch, 'predictions.json')
+        split(path)
+        timings = measure(path, args.workers)
+    finally:
+        shutil.rmtree(scratch, ignore_errors=True)
+    print(f"{args.size} records:")
+    for step, seconds in timings.items():
+        print(f"  {step:<24}{seconds * 1000:9.0f} ms")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
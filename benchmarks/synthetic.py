@@ -0,0 +1,110 @@
+"""Synthetic prediction and blog post corpora modelled on ``src/data``.
+
+Every generated record copies the shape of a real record (the same fields,
+list lengths, status, score and dates) and fills its text with words drawn
+from the real corpus, matching the original word counts. So field sizes and
+value distributions follow the real files at any scale. The output is
+deterministic for a given seed.
+
+    python -m benchmarks.synthetic 100000 /tmp/bench-100k
+"""
+import json
+import os
+import random
+import re
+import sys
+
+SCRIPT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATA_DIR = os.path.join(SCRIPT_DIR, 'src', 'data')
+BLOG_POSTS_PER_PREDICTION = 1 / 50 # Keeps the blog file proportionate
+
+_WORD = re.compile(r'\S+')
+
+
+class CorpusModel:
+    """Templates and vocabulary taken from the real data files."""
+
+    def __init__(self, data_dir=DATA_DIR):
+        with open(os.path.join(data_dir, 'predictions.json'), 'r', encoding='utf-8') as f:
+            self.predictions = json.load(f)
+        with open(os.path.join(data_dir, 'blogPosts.json'), 'r', encoding='utf-8') as f:
+            self.blog_posts = json.load(f)
+        words = []
+        for record in self.predictions + self.blog_posts:
+            for value in record.values():
+                if isinstance(value, str):
+                    words.extend(_WORD.findall(value))
+        self.vocabulary = words # Duplicates kept, so common words stay common
+        self.categories = sorted({c for p in self.predictions for c in p.get('categories') or ()})
+        self.tags = sorted({t for b in self.blog_posts for t in b.get('tags') or ()})
+
+
+def _fake_text(rng, vocabulary, like):
+    """Text with about as many words (and the same line structure) as ``like``."""
+    lines = like.split('\n')
+    return '\n'.join(' '.join(rng.choices(vocabulary, k=len(_WORD.findall(line)))) for line in lines)
+
+
+def _fake_prediction(rng, model, template, number):
+    record = {}
+    for key, value in template.items():
+        if key == 'id':
+            record[key] = f"P{number:03d}"
+        elif key == 'categories':
+            record[key] = rng.sample(model.categories, min(len(value), len(model.categories)))
+        elif key == 'supportingEvidence':
+            record[key] = [{'text': _fake_text(rng, model.vocabulary, item.get('text', '')),
+                            'url': f"https://example.com/evidence/{number}/{position}"}
+                           for position, item in enumerate(value)]
+        elif key == 'analystCommentary':
+            record[key] = [{'date': item.get('date'), 'comment': _fake_text(rng, model.vocabulary, item.get('comment', ''))}
+                           for item in value if isinstance(item, dict)]
+        elif key in ('text', 'originalScenario', 'qualitativeAccuracy', 'actualOutcome') and isinstance(value, str):
+            record[key] = _fake_text(rng, model.vocabulary, value)
+        else:
+            record[key] = value # status, score, dates, segment: keep the real distribution
+    return record
+
+
+def _fake_blog_post(rng, model, template, number):
+    record = dict(template)
+    record['id'] = f"B{number:03d}"
+    for key in ('title', 'summary', 'content'):
+        if isinstance(template.get(key), str):
+            record[key] = _fake_text(rng, model.vocabulary, template[key])
+    record['tags'] = rng.sample(model.tags, min(len(template.get('tags') or ()), len(model.tags)))
+    return record
+
+
+def _write_array(path, records):
+    # Same layout as the editor writes (json.dump indent=2), one record at a time
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('[')
+        index = -1
+        for index, record in enumerate(records):
+            f.write(',\n  ' if index else '\n  ')
+            f.write(json.dumps(record, indent=2, ensure_ascii=False).replace('\n', '\n  '))
+        f.write('\n]' if index >= 0 else ']')
+
+
+def generate(record_count, out_dir, seed=0, model=None):
+    """Write predictions.json and blogPosts.json to ``out_dir``; returns their paths."""
+    model = model or CorpusModel()
+    rng = random.Random(seed)
+    os.makedirs(out_dir, exist_ok=True)
+    predictions_path = os.path.join(out_dir, 'predictions.json')
+    blog_posts_path = os.path.join(out_dir, 'blogPosts.json')
+    templates = model.predictions
+    _write_array(predictions_path, (_fake_prediction(rng, model, templates[n % len(templates)], n + 1)
+                                    for n in range(record_count)))
+    post_count = max(len(model.blog_posts), int(record_count * BLOG_POSTS_PER_PREDICTION))
+    _write_array(blog_posts_path, (_fake_blog_post(rng, model, model.blog_posts[n % len(model.blog_posts)], n + 1)
+                                   for n in range(post_count)))
+    return predictions_path, blog_posts_path
+
+
+if __name__ == '__main__':
+    if len(sys.argv) != 3:
+        sys.exit("usage: python -m benchmarks.synthetic RECORD_COUNT OUT_DIR")
+    for path in generate(int(sys.argv[1]), sys.argv[2]):
+        print(f"{path}: {os.path.getsize(path) / 1e6:.1f} MB")
@@ -0,0 +1,124 @@
+"""Pre-render the blog posts to HTML for the web build.
+
+Every post's Markdown is converted with the editor preview's extension set
+(markdown_renderer.MARKDOWN_EXTENSIONS) on a process pool and written as an
+HTML fragment under ``public/blog-html/``, named after its content hash so
+browsers can cache it forever. ``src/data/blogIndex.json`` gets everything
+but the content, compactly encoded, plus the fragment's name; the site loads
+only that up front and fetches a post's body when it is opened.
+The page injects a fragment as it is, so the extension set includes
+markdown_gfm, which escapes raw HTML and neutralises unsafe link schemes.
+
+The fragment directory doubles as the render cache: a post whose content
+hash (which also covers the renderer version and extensions) already has a
+fragment there is not rendered again.
+
+    python blog_export.py              # what `npm run dev` / `npm run build` run first
+    python blog_export.py --force      # re-render everything
+"""
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from journal import atomic_replace
+from markdown_renderer import MARKDOWN_EXTENSIONS
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+BLOG_POSTS_FILE = os.path.join(SCRIPT_DIR, 'src', 'data', 'blogPosts.json')
+INDEX_FILE = os.path.join(SCRIPT_DIR, 'src', 'data', 'blogIndex.json')
+FRAGMENT_DIR = os.path.join(SCRIPT_DIR, 'public', 'blog-html')
+EXPORT_VERSION = 1 # Bump when the output format changes, to re-render everything
+POOL_THRESHOLD = 4 # Fewer stale posts than this are rendered in-process
+
+_converter = None
+
+
+def _renderer_fingerprint():
+    import markdown
+    return f"{EXPORT_VERSION}|{markdown.__version__}|{','.join(MARKDOWN_EXTENSIONS)}"
+
+
+def render_markdown(text):
+    """Markdown to HTML; each process builds its converter once."""
+    global _converter
+    if _converter is None:
+        import markdown
+        _converter = markdown.Markdown(extensions=list(MARKDOWN_EXTENSIONS))
+    return _converter.reset().convert(text)
+
+
+def content_key(post, fingerprint):
+    text = f"{fingerprint}\n{post.get('content') or ''}"
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=8).hexdigest()
+
+
+def fragment_name(post_id, key):
+    safe_id = ''.join(c if c.isalnum() or c in '-_' else '_' for c in str(post_id))
+    return f"{safe_id}.{key}.html"
+
+
+def export(posts_path=BLOG_POSTS_FILE, index_path=INDEX_FILE, fragment_dir=FRAGMENT_DIR, jobs=None, force=False):
+    """Write the index and any stale fragments. Returns ``(posts, rendered)`` counts."""
+    with open(posts_path, 'r', encoding='utf-8') as f:
+        posts = json.load(f)
+    fingerprint = _renderer_fingerprint()
+    os.makedirs(fragment_dir, exist_ok=True)
+
+    index = []
+    stale = [] # (fragment name, content)
+    for post in posts:
+        key = content_key(post, fingerprint)
+        name = fragment_name(post.get('id'), key)
+        if force or not os.path.exists(os.path.join(fragment_dir, name)):
+            stale.append((name, post.get('content') or ''))
+        summary = {field: value for field, value in post.items() if field != 'content'}
+        summary['html'] = name
+        index.append(summary)
+
+    texts = [text for name, text in stale]
+    if len(stale) >= POOL_THRESHOLD and jobs != 1:
+        workers = jobs or os.cpu_count() or 1
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            rendered = list(pool.map(render_markdown, texts, chunksize=max(1, len(texts) // (4 * workers))))
+    else:
+        rendered = [render_markdown(text) for text in texts]
+    for (name, text), html in zip(stale, rendered):
+        with atomic_replace(os.path.join(fragment_dir, name)) as f:
+            f.write(html)
+
+    # Compact: this is what the site downloads before first paint
+    with atomic_replace(index_path) as f:
+        json.dump(index, f, ensure_ascii=False, separators=(',', ':'))
+    wanted = {summary['html'] for summary in index}
+    for name in os.listdir(fragment_dir):
+        if name.endswith('.html') and name not in wanted:
+            os.remove(os.path.join(fragment_dir, name))
+    return len(posts), len(stale)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Pre-render blog post Markdown to HTML for the web build.")
+    parser.add_argument('posts', nargs='?', default=BLOG_POSTS_FILE, help="blog posts JSON file")
+    parser.add_argument('--index', default=INDEX_FILE, help="where to write the summary index")
+    parser.add_argument('--out', default=FRAGMENT_DIR, help="directory for the HTML fragments")
+    parser.add_argument('--jobs', type=int, default=None, help="render processes (default: one per CPU)")
+    parser.add_argument('--force', action='store_true', help="re-render every post, even unchanged ones")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    try:
+        posts, rendered = export(args.posts, args.index, args.out, args.jobs, args.force)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    print(f"Exported {posts} posts ({rendered} rendered, {posts - rendered} cached) "
+          f"in {(time.perf_counter() - started) * 1000:.1f} ms")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,251 @@
+"""Apply a batch of field patches to predictions or blog posts without the GUI.
+
+Patches are read as a stream, one per JSONL line or CSV row, keyed by ``id``:
+
+    {"id": "P012", "status": "Confirmed Accurate", "accuracyScore": "85"}
+
+    id,status,accuracyScore
+    P012,Confirmed Accurate,85
+
+String values go through the same coercion as the editor form (so "85"
+becomes 85 when the field holds a number, or, where the record has no value
+yet, when other records' values there are numbers; list fields take JSON text);
+JSONL values that are already typed are used as they are. A patch must not
+break a check in validation.py that the record passed before, as with the
+editor's bulk edit. Empty CSV cells leave the field unchanged. Only the patched records are parsed, and the whole
+batch is committed with one compaction of whichever storage backend the
+editor uses (``--storage``, default $CONTENT_EDITOR_STORAGE or json), so
+shards or the database get the edits rather than just the exported JSON file.
+With the JSON backend that is one atomic rewrite, which also folds in any
+pending editor journal. Close the editor first so it doesn't keep journaling
+to the old file.
+
+    python bulk_update.py patches.jsonl
+    python bulk_update.py scores.csv --target blog --dry-run
+    python bulk_update.py scores.csv --storage sharded
+
+``apply_bulk_edit`` is the editor's bulk-edit panel: one value set on,
+appended to, or removed from a field of many selected records.
+"""
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+
+from coercion import coerce_field_text
+from content_store import ContentStore
+from storage import STORAGE_BACKENDS, open_data_file
+from validation import blog_post_validator, prediction_validator
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+# target -> (data file, id prefix, validator factory)
+TARGETS = {
+    'predictions': (os.path.join(SCRIPT_DIR, 'src', 'data', 'predictions.json'), 'P', prediction_validator),
+    'blog': (os.path.join(SCRIPT_DIR, 'src', 'data', 'blogPosts.json'), 'B', blog_post_validator),
+}
+DEFAULT_STORAGE = os.environ.get('CONTENT_EDITOR_STORAGE', 'json') # Same setting as the editor
+
+
+class PatchError(ValueError):
+    pass
+
+
+def read_patches(path, fmt=None):
+    """Yield ``(location, patch)`` pairs from a JSONL or CSV file, streaming."""
+    fmt = fmt or ('csv' if path.lower().endswith('.csv') else 'jsonl')
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        if fmt == 'csv':
+            reader = csv.reader(f)
+            header = next(reader, [])
+            for row in reader:
+                # Empty cells mean "no change"
+                yield f"line {reader.line_num}", {key: value for key, value in zip(header, row) if key and value != ''}
+            return
+        for line_number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                patch = json.loads(line)
+            except json.JSONDecodeError as e:
+                patch = PatchError(f"invalid JSON: {e.msg}")
+            yield f"line {line_number}", patch
+
+
+class FieldExamples:
+    """A value of each field from the store, for typing patches to records that lack the field.
+
+    Returns the first non-null value in file order, or None when no record
+    has one. Records are only parsed until a value turns up, and each field
+    is looked up once.
+    """
+
+    def __init__(self, store):
+        self.store = store
+        self._values = {}
+
+    def __call__(self, field):
+        if field not in self._values:
+            self._values[field] = next((record[field] for record in self.store.iter_full()
+                                        if record.get(field) is not None), None)
+        return self._values[field]
+
+
+def apply_patch(record, patch, examples=None):
+    """Return a patched copy of ``record``; raises PatchError on bad values.
+
+    Values are typed after the record's current ones. Where the record has
+    no value for a field (missing or null), ``examples(field)`` (see
+    FieldExamples) stands in, so "85" still becomes 85.
+    """
+    updated = dict(record)
+    errors = []
+    for key, value in patch.items():
+        if key == 'id':
+            continue
+        original_value = record.get(key)
+        if original_value is None and examples is not None and not (isinstance(value, str) and value.lower() == 'null'):
+            original_value = examples(key)
+        if isinstance(value, str):
+            try:
+                value = coerce_field_text(original_value, value,
+                                          multiline=isinstance(original_value, (list, dict)), strict=True)
+            except ValueError as e:
+                errors.append(f"{key}: {e}")
+                continue
+        elif original_value is not None and value is not None and type(value) is not type(original_value) \
+                and not (isinstance(original_value, float) and type(value) is int):
+            errors.append(f"{key}: expected {type(original_value).__name__}, got {type(value).__name__}")
+            continue
+        updated[key] = value
+    if errors:
+        raise PatchError("; ".join(errors))
+    return updated
+
+
+BULK_OPERATIONS = ('set', 'append', 'remove')
+
+
+def coerce_list_item(items, text):
+    """The list element ``text`` stands for: plain text in a list of strings, else JSON."""
+    if all(isinstance(item, str) for item in items) and not text.lstrip().startswith(('{', '[')):
+        return text.strip()
+    try:
+        return json.loads(text)
+    except json.JSONDecodeError as e:
+        raise PatchError(f"invalid JSON ({e.msg} at column {e.colno})")
+
+
+def apply_bulk_edit(record, field, operation, text, examples=None):
+    """Return a copy of ``record`` with ``text`` set on, appended to, or removed from ``field``.
+
+    ``set`` coerces like the editor form (see apply_patch, which also
+    explains ``examples``). ``append`` and ``remove`` work on list fields,
+    adding an element that isn't there yet or dropping every equal one;
+    ``remove`` on any other field deletes it when it holds that value.
+    Raises PatchError when the text can't be coerced.
+    """
+    if operation == 'set':
+        return apply_patch(record, {field: text}, examples)
+    current = record.get(field)
+    updated = dict(record)
+    if isinstance(current, list) or (current is None and operation == 'append'):
+        items = current or []
+        item = coerce_list_item(items, text)
+        if operation == 'append':
+            updated[field] = items if item in items else items + [item]
+        else:
+            updated[field] = [existing for existing in items if existing != item]
+    elif operation == 'append':
+        raise PatchError(f"{field}: can only append to a list field")
+    elif field in record and current == apply_patch(record, {field: text}).get(field):
+        del updated[field]
+    return updated
+
+
+def apply_patches(store, patches, validator=None):
+    """Apply ``(location, patch)`` pairs to ``store``.
+
+    Returns ``(changed_ids, errors)`` with errors as ``(location, id, message)``.
+    A patch with any bad field, or making the record fail a ``validator``
+    check it passed before, is skipped entirely.
+    """
+    changed = set()
+    errors = []
+    examples = FieldExamples(store)
+    for location, patch in patches:
+        if isinstance(patch, Exception):
+            errors.append((location, None, str(patch)))
+            continue
+        if not isinstance(patch, dict):
+            errors.append((location, None, "patch must be a JSON object"))
+            continue
+        record_id = patch.get('id')
+        if record_id is None:
+            errors.append((location, None, "missing 'id'"))
+            continue
+        if record_id not in store:
+            errors.append((location, record_id, "no record with this id"))
+            continue
+        original = store.full(record_id)
+        try:
+            updated = apply_patch(original, patch, examples)
+        except PatchError as e:
+            errors.append((location, record_id, str(e)))
+            continue
+        problems = ()
+        if validator is not None:
+            # Only what the patch breaks: a record that already fails a check can still be fixed up elsewhere
+            existing = validator.errors(original)
+            problems = [problem for problem in validator.errors(updated) if problem not in existing]
+        if problems:
+            errors.append((location, record_id, "; ".join(problems)))
+            continue
+        store.update(record_id, updated)
+        changed.add(record_id)
+    return changed, errors
+
+
+def run(patch_path, target='predictions', fmt=None, dry_run=False, strict=False, out=sys.stdout, storage=DEFAULT_STORAGE):
+    """Load the target file, apply the patches and commit them. Returns the error count."""
+    data_path, id_prefix, make_validator = TARGETS[target]
+    started = time.perf_counter()
+    data_file = open_data_file(data_path, storage)
+    store = ContentStore(id_prefix, records=data_file.load(('id',)), body_loader=data_file.read_body)
+    changed, errors = apply_patches(store, read_patches(patch_path, fmt), make_validator())
+    for location, record_id, message in errors:
+        print(f"{patch_path}:{location}: {record_id or '-'}: {message}", file=out)
+    committed = bool(changed) and not dry_run and not (strict and errors)
+    try:
+        if committed:
+            data_file.compact(store.records)
+    finally:
+        data_file.close()
+    elapsed = (time.perf_counter() - started) * 1000
+    outcome = "written to" if committed else "not written to"
+    print(f"{len(changed)} record{'s' if len(changed) != 1 else ''} updated, {len(errors)} error{'s' if len(errors) != 1 else ''} "
+          f"({outcome} {data_path}) in {elapsed:.0f} ms", file=out)
+    return len(errors)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Apply JSONL/CSV field patches keyed by id.")
+    parser.add_argument('patches', help="JSONL or CSV file of patches")
+    parser.add_argument('--target', choices=sorted(TARGETS), default='predictions')
+    parser.add_argument('--format', choices=('jsonl', 'csv'), help="Default: from the file extension")
+    parser.add_argument('--dry-run', action='store_true', help="Validate and report without writing")
+    parser.add_argument('--strict', action='store_true', help="Write nothing if any patch fails")
+    parser.add_argument('--storage', choices=STORAGE_BACKENDS, default=DEFAULT_STORAGE,
+                        help="Storage backend the editor uses (default: %(default)s)")
+    args = parser.parse_args(argv)
+    try:
+        error_count = run(args.patches, args.target, args.format, args.dry_run, args.strict, storage=args.storage)
+    except OSError as e: # Includes FileChangedError
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    return 1 if error_count else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,41 @@
+"""Turning edited text back into typed field values.
+
+These are the rules the editor form has always used: the type a field ends
+up with follows the type of its current value. They live here, without Qt,
+so command-line tools coerce values exactly like the GUI does.
+"""
+import json
+
+
+def coerce_field_text(original_value, text_value, multiline=False, strict=False):
+    """Return ``text_value`` converted to match ``original_value``'s type.
+
+    ``multiline`` mirrors the editor's text-area fields, where lists and dicts
+    are edited as JSON. Text that can't be converted is kept as a string,
+    unless ``strict`` is set, in which case ValueError is raised instead.
+    """
+    if multiline:
+        if isinstance(original_value, (list, dict)):
+            try:
+                return json.loads(text_value)
+            except json.JSONDecodeError as e:
+                if strict:
+                    raise ValueError(f"invalid JSON ({e.msg} at column {e.colno})")
+        return text_value
+    if isinstance(original_value, int):
+        try: return int(text_value)
+        except ValueError:
+            if strict:
+                raise ValueError(f"expected an integer, got {text_value!r}")
+            return text_value
+    if isinstance(original_value, float):
+        try: return float(text_value)
+        except ValueError:
+            if strict:
+                raise ValueError(f"expected a number, got {text_value!r}")
+            return text_value
+    if isinstance(original_value, bool):
+        return text_value.lower() in ['true', '1', 'yes']
+    if original_value is None and (text_value.lower() == 'null' or not text_value):
+        return None
+    return text_value
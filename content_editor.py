@@ -1,22 +1,57 @@
 import sys
 import json
 import os
+import time
+from collections import OrderedDict
+_IMPORT_STARTED = time.perf_counter()
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QTabWidget, QListWidget, QLineEdit, QTextEdit, QPushButton,
-    QLabel, QFormLayout, QMessageBox, QSplitter, QScrollArea
+    QTabWidget, QListView, QLineEdit, QTextEdit, QPushButton,
+    QLabel, QFormLayout, QMessageBox, QSplitter, QScrollArea, QStackedWidget,
+    QListWidget, QListWidgetItem, QComboBox, QSpinBox, QCheckBox, QTabBar
 )
-from PyQt6.QtCore import Qt, QSize
-from PyQt6.QtWebEngineWidgets import QWebEngineView
-from PyQt6.QtWebEngineCore import QWebEngineSettings
-from PyQt6.QtGui import QFont, QColor, QPalette, QIcon
+from PyQt6.QtCore import Qt, QSize, QTimer, QAbstractListModel, QModelIndex, QThreadPool, pyqtSignal
+from PyQt6.QtGui import QFont, QColor, QPalette, QIcon, QKeySequence
 
-import markdown
+from background_io import BackgroundWriter, run_in_pool
+from bulk_update import BULK_OPERATIONS, FieldExamples, PatchError, apply_bulk_edit
+from undo_history import HISTORY_FILE, HistoryConflict, UndoHistory, apply_diff, revert_target
+from coercion import coerce_field_text
+from content_store import ContentStore
+from facets import FacetIndex
+from file_watcher import DataFileWatcher
+from journal import FileChangedError
+from latency import LatencyRecorder
+from markdown_preview import PREVIEW_BACKENDS, create_markdown_preview
+from search_index import SearchIndex, blog_post_search_text, prediction_search_text
+from storage import STORAGE_BACKENDS, open_data_file
+from timeline_index import TimelineIndex, parse_period
+import tracing
+from tracing import span
+from validation import blog_post_validator, prediction_validator
+# QtWebEngine and markdown are imported only once the Blog Posts tab is opened, NumPy once the Dashboard or METR Points is
+IMPORT_MS = (time.perf_counter() - _IMPORT_STARTED) * 1000
 
 # Define paths (assuming script is in project root)
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 PREDICTIONS_FILE = os.path.join(SCRIPT_DIR, 'src', 'data', 'predictions.json')
 BLOG_POSTS_FILE = os.path.join(SCRIPT_DIR, 'src', 'data', 'blogPosts.json')
+STATUS_FILE = os.path.join(SCRIPT_DIR, 'Status.txt')
+
+# Fields read at startup (what the lists show and filter on); everything else is parsed when a record is opened
+PREDICTION_SUMMARY_FIELDS = ('id', 'text', 'status', 'categories', 'timelineSegment')
+BLOG_POST_SUMMARY_FIELDS = ('id', 'title', 'date', 'tags')
+# Fields offered by the bulk-edit panels
+PREDICTION_BULK_FIELDS = ('status', 'categories', 'timelineSegment', 'predictedDate', 'accuracyScore',
+                          'qualitativeAccuracy', 'lastEvaluated', 'supportingEvidence')
+BLOG_POST_BULK_FIELDS = ('tags', 'author', 'date')
+# Filter panel above the predictions list: (field, label)
+PREDICTION_FACETS = (('status', 'Status'), ('categories', 'Category'), ('timelineSegment', 'Segment'))
+
+COMPACT_INTERVAL_MS = 5 * 60 * 1000 # Fold save journals into the JSON files this often
+# Evidence link badge colors, by the worst health among a prediction's links (see link_checker.py)
+LINK_HEALTH_COLORS = {'broken': "#DC2626", 'error': "#EA580C", 'blocked': "#D97706", 'unchecked': "#D1D5DB",
+                      'ok': "#059669"}
 
 # Colors from the web app (approximate)
 COLOR_BACKGROUND = "#F8F5F2"
@@ -53,13 +88,13 @@ STYLESHEET = f"""
         margin-top: 10px;
         margin-bottom: 4px;
     }}
-    QListWidget {{
+    QListView {{
         background-color: {COLOR_CARD_BACKGROUND};
         border: 1px solid {COLOR_BORDER_MUTED};
         border-radius: 5px;
         font-size: 10pt; /* Adjusted for consistency */
     }}
-    QListWidget::item:selected {{
+    QListView::item:selected {{
         background-color: {COLOR_ACCENT_GREEN};
         color: white;
     }}
@@ -127,94 +162,747 @@ STYLESHEET = f"""
     }}
 """
 
-class MarkdownPreview(QWebEngineView):
+PREVIEW_HTML_SHELL = f"""
+<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="utf-8">
+    <style>
+        body {{
+            font-family: sans-serif;
+            line-height: 1.6;
+            background-color: {COLOR_CARD_BACKGROUND};
+            color: {COLOR_TEXT_PRIMARY};
+            padding: 15px;
+        }}
+        h1, h2, h3, h4, h5, h6 {{
+            color: {COLOR_TEXT_PRIMARY};
+            font-family: Georgia, Times, serif; /* Matching web app's serif headers */
+        }}
+        h1 {{ font-size: 2em; }}
+        h2 {{ font-size: 1.75em; }}
+        h3 {{ font-size: 1.5em; }}
+        code {{
+            background-color: #f0f0f0;
+            padding: 2px 4px;
+            border-radius: 3px;
+            font-family: "Courier New", monospace;
+        }}
+        pre {{
+            background-color: #f0f0f0;
+            padding: 10px;
+            border-radius: 3px;
+            overflow-x: auto;
+        }}
+        table {{
+            border-collapse: collapse;
+            width: 100%;
+            margin-bottom: 1em;
+        }}
+        th, td {{
+            border: 1px solid {COLOR_BORDER_MUTED};
+            padding: 8px;
+            text-align: left;
+        }}
+        th {{
+            background-color: #f2f2f2;
+        }}
+        blockquote {{
+            border-left: 4px solid {COLOR_ACCENT_GREEN};
+            padding-left: 10px;
+            color: {COLOR_TEXT_SECONDARY};
+            margin-left: 0;
+        }}
+        a {{
+            color: {COLOR_ACCENT_GREEN};
+            text-decoration: none;
+        }}
+        a:hover {{
+            text-decoration: underline;
+        }}
+    </style>
+</head>
+<body>
+    <div id="content"></div>
+</body>
+</html>
+"""
+
+FRAME_BUDGET_MS = 16 # Selection-to-display target
+MULTILINE_THRESHOLD = 70 # Longer strings get a QTextEdit
+MAX_OPEN_FORMS = 8 # Records kept open in their own form; older ones are evicted to drafts
+OPEN_FORMS_BUDGET_BYTES = 4 * 1024 * 1024 # Estimated memory for those forms
+FORM_BASE_BYTES = 64 * 1024 # Rough cost of one form's widgets before any text
+
+PREVIEW_DEBOUNCE_MS = 150 # Quiet period before re-rendering the preview
+PREVIEW_MAX_WAIT_MS = 600 # Upper bound on preview staleness while typing continuously
+# 'webengine' (default) or 'textbrowser' for low-memory machines; also --light-preview
+PREVIEW_BACKEND = os.environ.get('CONTENT_EDITOR_PREVIEW', 'webengine')
+# 'json' (default), 'sqlite' to keep records in src/data/content.sqlite (--sqlite),
+# or 'sharded' for one file per record under src/data/predictions/ etc. (--sharded)
+STORAGE_BACKEND = os.environ.get('CONTENT_EDITOR_STORAGE', 'json')
+
+def field_schema(record, excluded_keys=()):
+    """Field names plus widget kind, e.g. (('id', False), ('text', True), ...)."""
+    schema = []
+    for key, value in record.items():
+        if key in excluded_keys:
+            continue
+        if isinstance(value, str):
+            multiline = '\n' in value or len(value) > MULTILINE_THRESHOLD
+        else:
+            multiline = isinstance(value, list)
+        schema.append((key, multiline))
+    return tuple(schema)
+
+def widget_text(widget):
+    return widget.toPlainText() if isinstance(widget, QTextEdit) else widget.text()
+
+class RecordForm:
+    """One editor form (labels + inputs in a scroll area) for a field schema.
+
+    The widgets are built once and repopulated for every record with the same
+    schema. List fields (evidence, commentary) are only serialized into their
+    QTextEdit once they are scrolled into view.
+    Typing in a field flags it dirty; ``dirty_fields`` then keeps only those
+    whose text really differs from what was filled in.
+    """
+    def __init__(self, schema):
+        with span('form.build', fields=len(schema)):
+            self._build(schema)
+
+    def _build(self, schema):
+        self.schema = schema
+        self.widgets = {}
+        self._pending = {} # key -> value not yet written into its widget
+        self._shown = {} # key -> text as filled in, for telling real edits apart
+        self.dirty = set() # Keys typed into since the last populate or save
+        self.on_dirty = None # Called when the first key turns dirty
+        self._filling = False
+
+        form_layout = QFormLayout()
+        form_layout.setRowWrapPolicy(QFormLayout.RowWrapPolicy.WrapAllRows) 
+        form_layout.setLabelAlignment(Qt.AlignmentFlag.AlignLeft) 
+        for key, multiline in schema:
+            # Use the key directly, capitalized, for the label
+            label = QLabel(f"{key[0].upper() + key[1:]}:")
+            if multiline:
+                widget = QTextEdit()
+                widget.setMinimumHeight(60) 
+                widget.setMaximumHeight(150)
+            else:
+                widget = QLineEdit()
+            form_layout.addRow(label, widget)
+            self.widgets[key] = widget
+            widget.textChanged.connect(lambda *args, key=key: self._mark_dirty(key))
+
+        scroll_widget_content = QWidget()
+        scroll_widget_content.setLayout(form_layout)
+        self.scroll_area = QScrollArea()
+        self.scroll_area.setWidget(scroll_widget_content)
+        self.scroll_area.setWidgetResizable(True)
+        scroll_bar = self.scroll_area.verticalScrollBar()
+        scroll_bar.valueChanged.connect(self._fill_visible)
+        scroll_bar.rangeChanged.connect(self._fill_visible) # Fires after layout/resize
+
+    def populate(self, record):
+        with span('form.populate', records=1):
+            self._populate(record)
+
+    def _populate(self, record):
+        self._pending.clear()
+        self._shown.clear()
+        self.dirty.clear()
+        self._filling = True
+        for key, widget in self.widgets.items():
+            value = record.get(key)
+            if isinstance(value, list):
+                widget.clear()
+                self._pending[key] = value
+            elif isinstance(widget, QTextEdit):
+                widget.setPlainText(str(value))
+            else:
+                widget.setText(str(value if value is not None else ""))
+            if key not in self._pending:
+                self._shown[key] = widget_text(widget)
+        self._filling = False
+        self.scroll_area.verticalScrollBar().setValue(0)
+        self._fill_visible()
+        if self._pending:
+            QTimer.singleShot(0, self._fill_visible) # Geometry is only final after layout
+
+    def fill_all(self):
+        for key in list(self._pending):
+            self._fill(key)
+
+    def filled_widgets(self):
+        """Widgets holding real values; unfilled fields are left untouched on save."""
+        return {key: widget for key, widget in self.widgets.items() if key not in self._pending}
+
+    def _fill(self, key):
+        with span('form.fill_list', field=key):
+            self._filling = True
+            self.widgets[key].setPlainText(json.dumps(self._pending.pop(key), indent=2))
+            self._filling = False
+            self._shown[key] = self.widgets[key].toPlainText()
+
+    def _mark_dirty(self, key):
+        if self._filling or key in self.dirty:
+            return
+        self.dirty.add(key)
+        if len(self.dirty) == 1 and self.on_dirty is not None:
+            self.on_dirty()
+
+    def dirty_fields(self):
+        """``{key: (text, multiline)}`` for the fields whose text differs from what was filled in."""
+        return {key: (widget_text(self.widgets[key]), isinstance(self.widgets[key], QTextEdit))
+                for key in self.dirty
+                if key not in self._pending and widget_text(self.widgets[key]) != self._shown.get(key)}
+
+    def restore_edits(self, edits):
+        """Put back ``dirty_fields()`` taken from an earlier form for the same record."""
+        for key, (text, multiline) in edits.items():
+            if key not in self.widgets:
+                continue
+            if key in self._pending:
+                self._fill(key)
+            widget = self.widgets[key]
+            widget.setPlainText(text) if isinstance(widget, QTextEdit) else widget.setText(text)
+
+    def mark_saved(self):
+        """The widgets now match the stored record."""
+        self._shown.update((key, widget_text(self.widgets[key])) for key in self.dirty if key not in self._pending)
+        self.dirty.clear()
+
+    def clear(self):
+        self._filling = True
+        for widget in self.widgets.values():
+            widget.clear()
+        self._filling = False
+        self._pending.clear()
+        self._shown.clear()
+        self.dirty.clear()
+
+    def estimated_bytes(self):
+        """Rough memory held by this form: a fixed cost for the widgets plus two bytes per character shown."""
+        return FORM_BASE_BYTES + 2 * sum(map(len, self._shown.values()))
+
+    def _fill_visible(self, *args):
+        if not self._pending or not self.scroll_area.isVisible():
+            return
+        viewport = self.scroll_area.viewport()
+        visible = viewport.rect().translated(0, self.scroll_area.verticalScrollBar().value())
+        for key in list(self._pending):
+            if self.widgets[key].geometry().intersects(visible):
+                self._fill(key)
+
+class FormPool(QStackedWidget):
+    """Caches RecordForms and shows the right one.
+
+    ``show_record`` reuses one form per field schema, repopulated for every
+    record. ``open_record`` instead keeps a form per open record, so going
+    back to one is a page flip with its edits still in the widgets. Those
+    forms are an LRU cache of at most ``max_forms`` and about ``budget_bytes``;
+    an evicted form leaves behind only the text of its dirty fields, which is
+    put back when the record is opened again. Evicted forms are cleared and
+    reused, one spare per schema.
+    """
+    dirty_changed = pyqtSignal(object) # Record id
+
+    def __init__(self, excluded_keys=(), max_forms=MAX_OPEN_FORMS, budget_bytes=OPEN_FORMS_BUDGET_BYTES, parent=None):
+        super().__init__(parent)
+        self.excluded_keys = tuple(excluded_keys)
+        self.max_forms = max_forms
+        self.budget_bytes = budget_bytes
+        self._forms = {}
+        self._open = OrderedDict() # id -> RecordForm, least recently shown first
+        self._spare = {} # schema -> cleared RecordForm
+        self.drafts = {} # id -> dirty_fields() of an evicted form
+        self._blank = QWidget() # Shown when no record is open
+        self.addWidget(self._blank)
+
+    def show_record(self, record):
+        schema = field_schema(record, self.excluded_keys)
+        form = self._forms.get(schema)
+        if form is None:
+            form = RecordForm(schema)
+            self._forms[schema] = form
+            self.addWidget(form.scroll_area)
+        self.setCurrentWidget(form.scroll_area)
+        form.populate(record)
+        return form
+
+    def switch_to(self, record_id):
+        """Show the record's form if it still has one; None if it was never opened or was evicted."""
+        form = self._open.get(record_id)
+        if form is not None:
+            self._open.move_to_end(record_id)
+            self.setCurrentWidget(form.scroll_area)
+        return form
+
+    def open_record(self, record):
+        """Show ``record``'s own form, building or reusing one if it has none."""
+        record_id = record.get('id')
+        form = self.switch_to(record_id)
+        if form is None:
+            schema = field_schema(record, self.excluded_keys)
+            form = self._spare.pop(schema, None)
+            if form is None:
+                form = RecordForm(schema)
+                self.addWidget(form.scroll_area)
+            form.populate(record)
+            draft = self.drafts.pop(record_id, None)
+            if draft:
+                form.restore_edits(draft)
+            form.on_dirty = lambda record_id=record_id: self.dirty_changed.emit(record_id)
+            self._open[record_id] = form
+            self.setCurrentWidget(form.scroll_area)
+            self._evict()
+        return form
+
+    def form_for(self, record_id):
+        return self._open.get(record_id)
+
+    def edits(self, record_id):
+        """``dirty_fields()`` of the record's form, or of the draft it left behind."""
+        form = self._open.get(record_id)
+        return form.dirty_fields() if form is not None else dict(self.drafts.get(record_id, {}))
+
+    def is_dirty(self, record_id):
+        form = self._open.get(record_id)
+        return bool(form.dirty) if form is not None else record_id in self.drafts
+
+    def dirty_ids(self):
+        """Ids with edits not yet saved, checked field by field."""
+        return {record_id for record_id, form in self._open.items() if form.dirty_fields()} | set(self.drafts)
+
+    def reload_record(self, record):
+        """Replace the record's form contents (and any draft) with ``record``."""
+        record_id = record.get('id')
+        self.drafts.pop(record_id, None)
+        form = self._open.get(record_id)
+        if form is not None:
+            if field_schema(record, self.excluded_keys) == form.schema:
+                form.populate(record)
+            else: # A field was added or removed; the record needs a form of the other shape
+                shown = self.currentWidget()
+                self.close_record(record_id, discard=True)
+                form = self.open_record(record)
+                if shown is not self._blank and shown is not form.scroll_area and self.indexOf(shown) >= 0:
+                    self.setCurrentWidget(shown)
+        return form
+
+    def mark_saved(self, record_id, saved_id=None):
+        """The record was saved from its form; moves it under ``saved_id`` if that changed."""
+        self.drafts.pop(record_id, None)
+        form = self._open.get(record_id)
+        if form is not None:
+            form.mark_saved()
+        if saved_id is not None and saved_id != record_id:
+            self.rename(record_id, saved_id)
+
+    def rename(self, record_id, new_id):
+        if record_id in self.drafts:
+            self.drafts[new_id] = self.drafts.pop(record_id)
+        form = self._open.get(record_id)
+        if form is not None:
+            self._open = OrderedDict((new_id if key == record_id else key, value) for key, value in self._open.items())
+            form.on_dirty = lambda: self.dirty_changed.emit(new_id)
+
+    def close_record(self, record_id, discard=False):
+        """Let go of the record's form; its unsaved edits stay as a draft unless ``discard``."""
+        form = self._open.pop(record_id, None)
+        if form is not None:
+            draft = {} if discard else form.dirty_fields()
+            if draft:
+                self.drafts[record_id] = draft
+            self._retire(form)
+        if discard:
+            self.drafts.pop(record_id, None)
+        if not self._open:
+            self.setCurrentWidget(self._blank)
+
+    def _retire(self, form):
+        form.on_dirty = None
+        if form.schema in self._spare:
+            self.removeWidget(form.scroll_area)
+            form.scroll_area.deleteLater()
+        else:
+            form.clear()
+            self._spare[form.schema] = form
+
+    def estimated_bytes(self):
+        return sum(form.estimated_bytes() for form in self._open.values())
+
+    def _evict(self):
+        while len(self._open) > 1 and (len(self._open) > self.max_forms or self.estimated_bytes() > self.budget_bytes):
+            self.close_record(next(iter(self._open))) # The form just shown was moved to the end
+
+def prediction_display_text(pred):
+    return f"{pred.get('id', 'N/A')}: {(pred.get('text') or 'No Text')[:50]}..."
+
+def blog_post_display_text(post):
+    return f"{post.get('id', 'N/A')}: {post.get('title', 'No Title')}"
+
+class RecordListModel(QAbstractListModel):
+    """List model reading straight from a ContentStore.
+
+    Display text is computed only for rows the view actually paints, so no
+    per-record item objects exist. ``set_visible_rows`` narrows the list to a
+    subset of store rows (search results, filters) without copying records,
+    optionally in another order than the store's.
+    Badges (a color swatch with a tooltip) are looked up by record id.
+    """
+    def __init__(self, store, display_text, parent=None):
+        super().__init__(parent)
+        self.store = store
+        self.display_text = display_text
+        self._visible = None # Store rows in display order when filtered or sorted, else None
+        self._positions = {} # Store row -> position in _visible
+        self.badges = {} # id -> (QColor, tooltip)
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.store) if self._visible is None else len(self._visible)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self.display_text(self.store.at(self.store_row(index)))
+        if role in (Qt.ItemDataRole.DecorationRole, Qt.ItemDataRole.ToolTipRole):
+            badge = self.badges.get(self.store.at(self.store_row(index)).get('id'))
+            if badge is not None:
+                return badge[0] if role == Qt.ItemDataRole.DecorationRole else badge[1]
+        return None
+
+    def store_row(self, index):
+        if not index.isValid():
+            return -1
+        return index.row() if self._visible is None else self._visible[index.row()]
+
+    def index_for_store_row(self, row):
+        """Model index showing store ``row``; invalid if it is filtered out."""
+        if self._visible is None:
+            return self.index(row)
+        position = self._positions.get(row)
+        return self.index(position) if position is not None else QModelIndex()
+
+    def set_visible_rows(self, rows, key=None):
+        """Show only the given store rows, in store order or by ``key(row)``; None shows everything."""
+        self.beginResetModel()
+        self._visible = sorted(rows, key=key) if rows is not None else None
+        self._positions = {row: position for position, row in enumerate(self._visible or ())}
+        self.endResetModel()
+
+    def load(self, records):
+        self.beginResetModel()
+        try:
+            self.store.load(records)
+        finally:
+            self.endResetModel()
+
+    def insert_record(self, record):
+        """Append a record to the store; it stays visible even under a filter."""
+        row = len(self.store)
+        view_row = self.rowCount()
+        self.beginInsertRows(QModelIndex(), view_row, view_row)
+        try:
+            self.store.insert(record)
+            if self._visible is not None:
+                self._visible.append(row)
+                self._positions[row] = view_row
+        finally:
+            self.endInsertRows()
+        return self.index(view_row)
+
+    def remove_record(self, record_id):
+        row = self.store.row_of(record_id)
+        view_row = self.index_for_store_row(row).row() # -1 when filtered out
+        if view_row >= 0:
+            self.beginRemoveRows(QModelIndex(), view_row, view_row)
+        try:
+            self.store.remove(record_id)
+            if self._visible is not None:
+                if view_row >= 0:
+                    del self._visible[view_row]
+                self._visible = [shown - 1 if shown > row else shown for shown in self._visible]
+                self._positions = {shown: position for position, shown in enumerate(self._visible)}
+        finally:
+            if view_row >= 0:
+                self.endRemoveRows()
+
+    def refresh_row(self, row):
+        index = self.index_for_store_row(row)
+        if index.isValid():
+            self.dataChanged.emit(index, index, [Qt.ItemDataRole.DisplayRole])
+
+    def set_badges(self, badges):
+        """Replace the badges for the given ids (None removes one)."""
+        for record_id, badge in badges.items():
+            if badge is None:
+                self.badges.pop(record_id, None)
+            else:
+                self.badges[record_id] = badge
+        if self.rowCount():
+            roles = [Qt.ItemDataRole.DecorationRole, Qt.ItemDataRole.ToolTipRole]
+            self.dataChanged.emit(self.index(0), self.index(self.rowCount() - 1), roles)
+
+def load_status_order(path=STATUS_FILE):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return [line.strip() for line in f if line.strip()]
+    except OSError:
+        return []
+
+class FacetPanel(QWidget):
+    """Checkable value lists, one per facet, with counts from a FacetIndex.
+
+    Values checked within a facet are ORed; facets are ANDed. Each count says
+    how many records the value would match given the other facets' selections.
+    """
+    filters_changed = pyqtSignal()
+
+    def __init__(self, facet_index, facets, value_order=None, count_sorted=(), parent=None):
+        super().__init__(parent)
+        self.facet_index = facet_index
+        self.value_order = value_order or {} # field -> preferred value order
+        self.count_sorted = count_sorted # Fields listed most common first; others in file order
+        self._lists = {}
+        self._items = {field: {} for field, label in facets} # field -> value -> QListWidgetItem
+        layout = QHBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        for field, label in facets:
+            column = QVBoxLayout()
+            column.addWidget(QLabel(label))
+            value_list = QListWidget()
+            value_list.setMaximumHeight(110)
+            value_list.itemChanged.connect(self._on_item_changed)
+            column.addWidget(value_list)
+            layout.addLayout(column)
+            self._lists[field] = value_list
+        clear_button = QPushButton("Clear")
+        clear_button.clicked.connect(self.clear)
+        layout.addWidget(clear_button, 0, Qt.AlignmentFlag.AlignBottom)
+
+    def filters(self):
+        return {field: {value for value, item in items.items() if item.checkState() == Qt.CheckState.Checked}
+                for field, items in self._items.items()}
+
+    def active(self):
+        return any(self.filters().values())
+
+    def clear(self):
+        changed = False
+        for items in self._items.values():
+            for item in items.values():
+                if item.checkState() == Qt.CheckState.Checked:
+                    self._set_check(item, Qt.CheckState.Unchecked)
+                    changed = True
+        if changed:
+            self.refresh_counts()
+            self.filters_changed.emit()
+
+    def refresh_counts(self):
+        """Sync the value lists and their counts with the index."""
+        filters = self.filters()
+        counts = self.facet_index.counts(filters)
+        for field, value_list in self._lists.items():
+            items = self._items[field]
+            field_counts = counts[field]
+            for value in list(items):
+                if value not in field_counts: # No record has it any more
+                    value_list.takeItem(value_list.row(items.pop(value)))
+            value_list.blockSignals(True)
+            for value in self._ordered(field, field_counts):
+                item = items.get(value)
+                if item is None:
+                    item = items[value] = QListWidgetItem()
+                    item.setData(Qt.ItemDataRole.UserRole, value)
+                    item.setCheckState(Qt.CheckState.Unchecked)
+                    value_list.addItem(item)
+                name = "(none)" if value is None else str(value)
+                item.setText(f"{name} ({field_counts[value]})")
+            value_list.blockSignals(False)
+
+    def _ordered(self, field, field_counts):
+        order = self.value_order.get(field)
+        if order:
+            rank = {value: position for position, value in enumerate(order)}
+            return sorted(field_counts, key=lambda value: (rank.get(value, len(rank)), str(value)))
+        if field in self.count_sorted:
+            return sorted(field_counts, key=lambda value: (-field_counts[value], str(value)))
+        return list(field_counts) # Order of first appearance
+
+    def _set_check(self, item, state):
+        value_list = item.listWidget()
+        value_list.blockSignals(True)
+        item.setCheckState(state)
+        value_list.blockSignals(False)
+
+    def _on_item_changed(self, item):
+        self.refresh_counts()
+        self.filters_changed.emit()
+
+class TimelineFilterPanel(QWidget):
+    """Due-date filter (between two dates, or overdue for evaluation) and chronological order.
+
+    Dates are typed as the same phrases ``predictedDate`` uses ("Early 2026",
+    "2026-05-01"); see timeline_index.parse_period.
+    """
+    filters_changed = pyqtSignal()
+    MODES = ("Any time", "Due between", "Overdue")
+    DEFAULT_STALE_DAYS = 90
+
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.settings().setAttribute(QWebEngineSettings.WebAttribute.ScrollAnimatorEnabled, True)
-        self.settings().setAttribute(QWebEngineSettings.WebAttribute.JavascriptEnabled, False) # For security
-        self.settings().setAttribute(QWebEngineSettings.WebAttribute.LocalContentCanAccessRemoteUrls, False)
-        self.page().setBackgroundColor(QColor(COLOR_CARD_BACKGROUND))
-
-
-    def set_markdown_content(self, md_text):
-        html_base = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <meta charset="utf-8">
-            <style>
-                body {{
-                    font-family: sans-serif;
-                    line-height: 1.6;
-                    background-color: {COLOR_CARD_BACKGROUND};
-                    color: {COLOR_TEXT_PRIMARY};
-                    padding: 15px;
-                }}
-                h1, h2, h3, h4, h5, h6 {{
-                    color: {COLOR_TEXT_PRIMARY};
-                    font-family: Georgia, Times, serif; /* Matching web app's serif headers */
-                }}
-                h1 {{ font-size: 2em; }}
-                h2 {{ font-size: 1.75em; }}
-                h3 {{ font-size: 1.5em; }}
-                code {{
-                    background-color: #f0f0f0;
-                    padding: 2px 4px;
-                    border-radius: 3px;
-                    font-family: "Courier New", monospace;
-                }}
-                pre {{
-                    background-color: #f0f0f0;
-                    padding: 10px;
-                    border-radius: 3px;
-                    overflow-x: auto;
-                }}
-                table {{
-                    border-collapse: collapse;
-                    width: 100%;
-                    margin-bottom: 1em;
-                }}
-                th, td {{
-                    border: 1px solid {COLOR_BORDER_MUTED};
-                    padding: 8px;
-                    text-align: left;
-                }}
-                th {{
-                    background-color: #f2f2f2;
-                }}
-                blockquote {{
-                    border-left: 4px solid {COLOR_ACCENT_GREEN};
-                    padding-left: 10px;
-                    color: {COLOR_TEXT_SECONDARY};
-                    margin-left: 0;
-                }}
-                a {{
-                    color: {COLOR_ACCENT_GREEN};
-                    text-decoration: none;
-                }}
-                a:hover {{
-                    text-decoration: underline;
-                }}
-            </style>
-        </head>
-        <body>
-            {{{{content}}}}
-        </body>
-        </html>
-        """
-        html_content = markdown.markdown(md_text, extensions=['fenced_code', 'tables', 'sane_lists'])
-        self.setHtml(html_base.replace("{{content}}", html_content))
+        layout = QHBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        self.mode_combo = QComboBox()
+        self.mode_combo.addItems(self.MODES)
+        self.mode_combo.currentIndexChanged.connect(self._on_mode_changed)
+        layout.addWidget(self.mode_combo)
+        self.from_edit = QLineEdit()
+        self.from_edit.setPlaceholderText("from, e.g. Early 2026")
+        self.to_edit = QLineEdit()
+        self.to_edit.setPlaceholderText("to, e.g. Late 2026")
+        for edit in (self.from_edit, self.to_edit):
+            edit.editingFinished.connect(self._on_dates_edited)
+            layout.addWidget(edit)
+        self.stale_spin = QSpinBox()
+        self.stale_spin.setRange(0, 3650)
+        self.stale_spin.setValue(self.DEFAULT_STALE_DAYS)
+        self.stale_spin.setPrefix("not re-evaluated in ")
+        self.stale_spin.setSuffix(" days")
+        self.stale_spin.valueChanged.connect(self.filters_changed)
+        layout.addWidget(self.stale_spin)
+        self.chronological_check = QCheckBox("Chronological")
+        self.chronological_check.toggled.connect(self.filters_changed)
+        layout.addWidget(self.chronological_check)
+        self._dates = None
+        self._on_mode_changed()
+
+    def mode(self):
+        return self.MODES[self.mode_combo.currentIndex()]
+
+    def due_range(self):
+        """``(start, end)`` decimal years for "Due between", None until both dates parse."""
+        return self._dates
+
+    def active(self):
+        return self.mode() == "Overdue" or (self.mode() == "Due between" and self._dates is not None)
+
+    def chronological(self):
+        return self.chronological_check.isChecked()
+
+    def _on_mode_changed(self, *args):
+        between = self.mode() == "Due between"
+        self.from_edit.setVisible(between)
+        self.to_edit.setVisible(between)
+        self.stale_spin.setVisible(self.mode() == "Overdue")
+        self.filters_changed.emit()
+
+    def _on_dates_edited(self):
+        first, last = parse_period(self.from_edit.text()), parse_period(self.to_edit.text())
+        for edit, period in ((self.from_edit, first), (self.to_edit, last)):
+            edit.setStyleSheet("" if period or not edit.text().strip() else "border: 1px solid #DC2626;")
+        dates = (first[0], last[1]) if first and last else None
+        if dates != self._dates:
+            self._dates = dates
+            self.filters_changed.emit()
+
+class BulkEditPanel(QWidget):
+    """Set, append or remove one field value across the selected records; shown while several are selected."""
+    apply_requested = pyqtSignal(str, str, str) # operation, field, value text
+
+    def __init__(self, fields, parent=None):
+        super().__init__(parent)
+        layout = QHBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        self.count_label = QLabel()
+        layout.addWidget(self.count_label)
+        self.operation_combo = QComboBox()
+        self.operation_combo.addItems([operation.capitalize() for operation in BULK_OPERATIONS])
+        layout.addWidget(self.operation_combo)
+        self.field_combo = QComboBox()
+        self.field_combo.setEditable(True) # For fields none of the records has yet
+        self.field_combo.addItems(fields)
+        layout.addWidget(self.field_combo)
+        self.value_edit = QLineEdit()
+        self.value_edit.setPlaceholderText("value (JSON for list items that aren't text)")
+        self.value_edit.returnPressed.connect(self._request)
+        layout.addWidget(self.value_edit, 1)
+        apply_button = QPushButton("Apply")
+        apply_button.clicked.connect(self._request)
+        layout.addWidget(apply_button)
+        self.setVisible(False)
+
+    def set_selected_count(self, count):
+        self.count_label.setText(f"{count} selected:")
+        self.setVisible(count > 1)
+
+    def _request(self):
+        field = self.field_combo.currentText().strip()
+        if field and field != 'id':
+            self.apply_requested.emit(BULK_OPERATIONS[self.operation_combo.currentIndex()], field, self.value_edit.text())
+
+def make_record_list_view(model):
+    view = QListView()
+    view.setModel(model)
+    view.setUniformItemSizes(True) # Lets the view skip measuring every row
+    view.setEditTriggers(QListView.EditTrigger.NoEditTriggers)
+    view.setSelectionMode(QListView.SelectionMode.ExtendedSelection) # Several at once for bulk edits
+    return view
 
 class EditorWindow(QMainWindow):
-    def __init__(self):
+    def __init__(self, preview_backend=PREVIEW_BACKEND, startup_report=False,
+                 predictions_path=None, blog_posts_path=None, background_io=True, storage_backend=STORAGE_BACKEND,
+                 history_path=HISTORY_FILE):
+        construct_started = time.perf_counter()
         super().__init__()
+        self.preview_backend = preview_backend
+        self.startup_report = startup_report
+        self.startup_timings = {"import_ms": IMPORT_MS} # See format_startup_report
         self.setWindowTitle("AI 2027 Content Editor")
         self.setGeometry(100, 100, 1300, 850) # Slightly larger default
         self.setStyleSheet(STYLESHEET)
 
-        self.predictions_data = []
-        self.blog_posts_data = []
+        self.predictions_store = ContentStore('P')
+        self.blog_posts_store = ContentStore('B')
+        self.predictions_model = RecordListModel(self.predictions_store, prediction_display_text)
+        self.blog_posts_model = RecordListModel(self.blog_posts_store, blog_post_display_text)
+        self.predictions_file = open_data_file(predictions_path or PREDICTIONS_FILE, storage_backend)
+        self.blog_posts_file = open_data_file(blog_posts_path or BLOG_POSTS_FILE, storage_backend)
+        self.predictions_store.body_loader = self.predictions_file.read_body
+        self.blog_posts_store.body_loader = self.blog_posts_file.read_body
+        # Parsing and writing happen on this pool; results come back as signals
+        self.io_pool = QThreadPool(self)
+        self.predictions_writer = BackgroundWriter(self.predictions_file, self.predictions_store, self.io_pool, self)
+        self.blog_posts_writer = BackgroundWriter(self.blog_posts_file, self.blog_posts_store, self.io_pool, self)
+        for writer, data_name in ((self.predictions_writer, "Predictions"), (self.blog_posts_writer, "Blog Posts")):
+            writer.saved.connect(lambda count, compacted, writer=writer, data_name=data_name:
+                                 self._report_saved(writer, data_name, count, compacted))
+            writer.failed.connect(lambda error, writer=writer, data_name=data_name:
+                                  self._report_save_failed(writer, data_name, error))
+            writer.file_changed.connect(lambda writer=writer: self.check_data_file(writer.data_file.path))
+        self._load_task = None
+        # Outside edits to the data files are merged into the stores record by record
+        self.file_watcher = DataFileWatcher([self.predictions_file.path, self.blog_posts_file.path], self)
+        self.file_watcher.changed.connect(self.check_data_file)
+        self._change_checks = {} # path -> running check; set to None when another was asked for
+        # Built on the first search, then kept current by store notifications
+        self.predictions_search_index = SearchIndex(self.predictions_store, prediction_search_text)
+        self.blog_posts_search_index = SearchIndex(self.blog_posts_store, blog_post_search_text)
+        # Compiled once; every save is checked before it is written
+        self.prediction_validator = prediction_validator(load_status_order())
+        self.blog_post_validator = blog_post_validator()
+        self.predictions_facet_index = FacetIndex(self.predictions_store, [field for field, label in PREDICTION_FACETS])
+        # Built when the timeline filter or chronological order is first used
+        self.predictions_timeline_index = TimelineIndex(self.predictions_store)
         self.current_blog_is_new = False # Flag for new blog post
+        # Saved edits as field diffs, for undo/redo across the session and restarts
+        self.history = UndoHistory(history_path)
 
         self.main_widget = QWidget()
         self.setCentralWidget(self.main_widget)
@@ -233,59 +921,61 @@ class EditorWindow(QMainWindow):
         self.tabs.addTab(self.blog_tab, "Blog Posts")
         self.setup_blog_ui()
 
-        self.load_all_data()
+        # Dashboard Tab; filled in when first shown
+        self.dashboard_tab = QWidget()
+        self.dashboard_layout = QVBoxLayout(self.dashboard_tab)
+        self.dashboard = None
+        self.tabs.addTab(self.dashboard_tab, "Dashboard")
+
+        # METR Points Tab; also filled in when first shown
+        self.metr_tab = QWidget()
+        self.metr_layout = QVBoxLayout(self.metr_tab)
+        self.metr_panel = None
+        self.tabs.addTab(self.metr_tab, "METR Points")
+
+        self.tabs.currentChanged.connect(self._on_tab_changed)
+
+        edit_menu = self.menuBar().addMenu("&Edit")
+        self.undo_action = edit_menu.addAction("Undo")
+        self.undo_action.setShortcut(QKeySequence.StandardKey.Undo) # Text fields keep theirs while focused
+        self.undo_action.triggered.connect(self.undo)
+        self.redo_action = edit_menu.addAction("Redo")
+        self.redo_action.setShortcut(QKeySequence.StandardKey.Redo)
+        self.redo_action.triggered.connect(self.redo)
+        self._update_history_actions()
+
+        tools_menu = self.menuBar().addMenu("&Tools")
+        trace_action = tools_menu.addAction("Trace Statistics...")
+        trace_action.setShortcut("Ctrl+Shift+T")
+        trace_action.triggered.connect(self.show_trace_stats)
+        self.trace_stats_dialog = None
+        links_action = tools_menu.addAction("Check Evidence Links")
+        links_action.setShortcut("Ctrl+Shift+L")
+        links_action.triggered.connect(self.check_evidence_links)
+        self.link_cache = None # Loaded by the first check
+        self._link_check = None
+
+        data_load_started = time.perf_counter()
+        if background_io:
+            self.load_all_data_in_background()
+            sync_load_ms = 0
+        else:
+            self.load_all_data()
+            sync_load_ms = self.startup_timings["data_load_ms"] = (time.perf_counter() - data_load_started) * 1000
         self.update_font_sizes()
 
+        # Saves only append to a journal; the canonical JSON is rewritten here and on exit
+        self.compact_timer = QTimer(self)
+        self.compact_timer.setInterval(COMPACT_INTERVAL_MS)
+        self.compact_timer.timeout.connect(self.compact_data_files)
+        self.compact_timer.start()
+        self.startup_timings["construct_ms"] = (time.perf_counter() - construct_started) * 1000 - sync_load_ms
+
 
     def update_font_sizes(self):
         # Base font set in stylesheet for QWidget, specific adjustments elsewhere if needed
         pass
 
-    def create_form_layout_from_dict(self, data_dict, parent_layout, excluded_keys=None):
-        if excluded_keys is None:
-            excluded_keys = []
-        
-        form_layout = QFormLayout()
-        form_layout.setRowWrapPolicy(QFormLayout.RowWrapPolicy.WrapAllRows) 
-        form_layout.setLabelAlignment(Qt.AlignmentFlag.AlignLeft) 
-        widgets = {}
-
-        for key, value in data_dict.items():
-            if key in excluded_keys:
-                continue
-            
-            # Use the key directly, capitalized, for the label
-            label_text = key[0].upper() + key[1:] 
-            label = QLabel(f"{{label_text}}:")
-            
-            use_text_edit = False
-            if isinstance(value, str):
-                if '\n' in value or len(value) > 70: # Adjust threshold for multi-line
-                    use_text_edit = True
-            elif isinstance(value, list):
-                use_text_edit = True
-            
-            if use_text_edit:
-                current_value_str = json.dumps(value, indent=2) if isinstance(value, list) else str(value)
-                widget = QTextEdit(current_value_str)
-                widget.setMinimumHeight(60) 
-                widget.setMaximumHeight(150)
-            else:
-                widget = QLineEdit(str(value if value is not None else ""))
-            
-            form_layout.addRow(label, widget)
-            widgets[key] = widget
-        
-        scroll_widget_content = QWidget()
-        scroll_widget_content.setLayout(form_layout)
-
-        scroll_area = QScrollArea()
-        scroll_area.setWidget(scroll_widget_content)
-        scroll_area.setWidgetResizable(True)
-        
-        parent_layout.addWidget(scroll_area)
-        return widgets
-
     def setup_predictions_ui(self):
         layout = QHBoxLayout(self.predictions_tab)
         splitter = QSplitter(Qt.Orientation.Horizontal)
@@ -296,9 +986,29 @@ class EditorWindow(QMainWindow):
         header_label = QLabel("Predictions")
         header_label.setObjectName("HeaderLabel")
         left_layout.addWidget(header_label)
-        self.predictions_list_widget = QListWidget()
-        self.predictions_list_widget.itemClicked.connect(self.display_prediction_details)
-        left_layout.addWidget(self.predictions_list_widget)
+        self.predictions_search_edit = QLineEdit()
+        self.predictions_search_edit.setPlaceholderText("Search predictions...")
+        self.predictions_search_edit.setClearButtonEnabled(True)
+        self.predictions_search_edit.textChanged.connect(self.filter_predictions)
+        left_layout.addWidget(self.predictions_search_edit)
+        self.prediction_facets = FacetPanel(self.predictions_facet_index, PREDICTION_FACETS,
+                                            value_order={'status': load_status_order()},
+                                            count_sorted=('categories',))
+        self.prediction_facets.filters_changed.connect(self.filter_predictions)
+        left_layout.addWidget(self.prediction_facets)
+        self.prediction_timeline = TimelineFilterPanel()
+        self.prediction_timeline.filters_changed.connect(self.filter_predictions)
+        left_layout.addWidget(self.prediction_timeline)
+        self.predictions_list_view = make_record_list_view(self.predictions_model)
+        # Follows the current row, so keyboard navigation keeps the form in sync too
+        self.predictions_list_view.selectionModel().currentChanged.connect(self.display_prediction_details)
+        left_layout.addWidget(self.predictions_list_view)
+        self.prediction_bulk_panel = BulkEditPanel(PREDICTION_BULK_FIELDS)
+        self.predictions_list_view.selectionModel().selectionChanged.connect(
+            lambda: self.prediction_bulk_panel.set_selected_count(len(self.predictions_list_view.selectionModel().selectedRows())))
+        self.prediction_bulk_panel.apply_requested.connect(
+            lambda operation, field, text: self.apply_bulk_edit(self._data_sets()[0], operation, field, text))
+        left_layout.addWidget(self.prediction_bulk_panel)
         splitter.addWidget(left_panel)
 
         # Right side: Editor fields
@@ -308,15 +1018,34 @@ class EditorWindow(QMainWindow):
         self.right_prediction_panel_layout = QVBoxLayout(self.right_prediction_panel_content)
         self.right_prediction_panel_layout.addLayout(self.predictions_editor_area_layout) # Add the dedicated form layout here
 
-        self.prediction_fields_widgets = {}
+        # One tab per open prediction; each keeps its own form (or a draft of its edits once evicted)
+        self.prediction_tabs = QTabBar()
+        self.prediction_tabs.setTabsClosable(True)
+        self.prediction_tabs.setMovable(True)
+        self.prediction_tabs.setExpanding(False)
+        self.prediction_tabs.setDocumentMode(True)
+        self.prediction_tabs.currentChanged.connect(self._on_prediction_tab_changed)
+        self.prediction_tabs.tabCloseRequested.connect(self.close_prediction_tab)
+        self.predictions_editor_area_layout.addWidget(self.prediction_tabs)
+        self.prediction_form_pool = FormPool()
+        self.prediction_form_pool.dirty_changed.connect(self._update_prediction_tab)
+        self.predictions_editor_area_layout.addWidget(self.prediction_form_pool)
+        self.prediction_form = None # RecordForm of the current tab
+        self.prediction_form_id = None # Id of the prediction in that form
+        self.selection_latency = LatencyRecorder()
         
         self.save_prediction_button = QPushButton("Save Prediction")
         self.save_prediction_button.clicked.connect(self.save_current_prediction)
         self.save_prediction_button.setFixedHeight(40)
         
+        self.save_all_predictions_button = QPushButton("Save All")
+        self.save_all_predictions_button.clicked.connect(self.save_all_predictions)
+        self.save_all_predictions_button.setFixedHeight(40)
+
         button_h_layout = QHBoxLayout()
         button_h_layout.addStretch()
         button_h_layout.addWidget(self.save_prediction_button)
+        button_h_layout.addWidget(self.save_all_predictions_button)
         button_h_layout.addStretch()
         self.right_prediction_panel_layout.addLayout(button_h_layout) # Add button layout to the main right panel layout
         
@@ -334,10 +1063,21 @@ class EditorWindow(QMainWindow):
         header_label = QLabel("Blog Posts")
         header_label.setObjectName("HeaderLabel")
         left_layout.addWidget(header_label)
+        self.blog_search_edit = QLineEdit()
+        self.blog_search_edit.setPlaceholderText("Search blog posts...")
+        self.blog_search_edit.setClearButtonEnabled(True)
+        self.blog_search_edit.textChanged.connect(self.filter_blog_posts)
+        left_layout.addWidget(self.blog_search_edit)
         
-        self.blog_list_widget = QListWidget()
-        self.blog_list_widget.itemClicked.connect(self.display_blog_details)
-        left_layout.addWidget(self.blog_list_widget)
+        self.blog_list_view = make_record_list_view(self.blog_posts_model)
+        self.blog_list_view.selectionModel().currentChanged.connect(self.display_blog_details)
+        left_layout.addWidget(self.blog_list_view)
+        self.blog_bulk_panel = BulkEditPanel(BLOG_POST_BULK_FIELDS)
+        self.blog_list_view.selectionModel().selectionChanged.connect(
+            lambda: self.blog_bulk_panel.set_selected_count(len(self.blog_list_view.selectionModel().selectedRows())))
+        self.blog_bulk_panel.apply_requested.connect(
+            lambda operation, field, text: self.apply_bulk_edit(self._data_sets()[1], operation, field, text))
+        left_layout.addWidget(self.blog_bulk_panel)
 
         new_blog_button = QPushButton("New Blog Post")
         new_blog_button.setObjectName("NewButton")
@@ -352,7 +1092,10 @@ class EditorWindow(QMainWindow):
         
         # Metadata Section
         self.blog_metadata_editor_area_layout = QVBoxLayout() # Dedicated layout for dynamic metadata form
-        self.blog_fields_widgets = {}
+        self.blog_form_pool = FormPool(excluded_keys=['content']) # Content has its own editor below
+        self.blog_metadata_editor_area_layout.addWidget(self.blog_form_pool)
+        self.blog_form = None
+        self.blog_form_id = None
         self.right_blog_panel_layout.addLayout(self.blog_metadata_editor_area_layout) # Add to main right layout
 
         # Markdown Editor and Preview (in a vertical splitter)
@@ -364,7 +1107,7 @@ class EditorWindow(QMainWindow):
         markdown_label.setObjectName("SubHeaderLabel")
         self.blog_content_edit = QTextEdit()
         self.blog_content_edit.setObjectName("MarkdownInput")
-        self.blog_content_edit.textChanged.connect(self.update_markdown_preview)
+        self.blog_content_edit.textChanged.connect(self.schedule_markdown_preview)
         markdown_input_layout.addWidget(markdown_label)
         markdown_input_layout.addWidget(self.blog_content_edit)
         editor_splitter.addWidget(markdown_input_group)
@@ -373,13 +1116,26 @@ class EditorWindow(QMainWindow):
         markdown_preview_layout = QVBoxLayout(markdown_preview_group)
         preview_label = QLabel("Live Preview:")
         preview_label.setObjectName("SubHeaderLabel")
-        self.markdown_preview = MarkdownPreview()
-        markdown_preview_layout.addWidget(preview_label)
-        markdown_preview_layout.addWidget(self.markdown_preview)
+        self.preview_latency_label = QLabel("")
+        self.preview_latency_label.setStyleSheet(f"color: {COLOR_TEXT_SECONDARY};")
+        preview_header_layout = QHBoxLayout()
+        preview_header_layout.addWidget(preview_label)
+        preview_header_layout.addStretch()
+        preview_header_layout.addWidget(self.preview_latency_label)
+        markdown_preview_layout.addLayout(preview_header_layout)
+        self.markdown_preview_layout = markdown_preview_layout
+        self.markdown_preview = None # Created when the Blog Posts tab is first shown
         editor_splitter.addWidget(markdown_preview_group)
 
         self.right_blog_panel_layout.addWidget(editor_splitter) # Add splitter to main right layout
 
+        # Keystrokes restart this timer, so a burst of typing is rendered once
+        self.preview_timer = QTimer(self)
+        self.preview_timer.setSingleShot(True)
+        self.preview_timer.setInterval(PREVIEW_DEBOUNCE_MS)
+        self.preview_timer.timeout.connect(self.update_markdown_preview)
+        self._preview_pending_since = 0.0
+
         self.save_blog_button = QPushButton("Save Blog Post")
         self.save_blog_button.clicked.connect(self.save_current_blog_post)
         self.save_blog_button.setFixedHeight(40)
@@ -392,150 +1148,654 @@ class EditorWindow(QMainWindow):
 
 
     def load_all_data(self):
-        try:
-            with open(PREDICTIONS_FILE, 'r', encoding='utf-8') as f:
-                self.predictions_data = json.load(f)
-            self.predictions_list_widget.clear()
-            for pred in self.predictions_data:
-                self.predictions_list_widget.addItem(f"{{pred.get('id', 'N/A')}}: {{pred.get('text', 'No Text')[:50]}}...")
-        except Exception as e:
-            QMessageBox.critical(self, "Error Loading Predictions", f"Could not load {{PREDICTIONS_FILE}}:\n{{e}}")
+        self._apply_loaded_data(self._read_data_files())
 
-        try:
-            with open(BLOG_POSTS_FILE, 'r', encoding='utf-8') as f:
-                self.blog_posts_data = json.load(f)
-            self.blog_list_widget.clear()
-            for post in self.blog_posts_data:
-                self.blog_list_widget.addItem(f"{{post.get('id', 'N/A')}}: {{post.get('title', 'No Title')}}")
-        except Exception as e:
-            QMessageBox.critical(self, "Error Loading Blog Posts", f"Could not load {{BLOG_POSTS_FILE}}:\n{{e}}")
-            
-    def _clear_layout(self, layout):
-        if layout is not None:
-            while layout.count():
-                item = layout.takeAt(0)
-                widget = item.widget()
-                if widget is not None:
-                    widget.deleteLater()
-                else:
-                    # If it's a layout item, recursively clear it
-                    sub_layout = item.layout()
-                    if sub_layout is not None:
-                        self._clear_layout(sub_layout)
-                    # Remove the layout item itself from its parent
-                    # This part is tricky as QLayout doesn't directly own QLayoutItems in a way that easy to remove all at once
-                    # The common approach is to delete widgets and rely on Qt's cleanup
-                    # For layouts themselves, if they are added to another layout, removing their parent widget or clearing the parent layout
-                    # handles it. For dynamic QFormLayouts being replaced, deleting the old ScrollArea widget is key.
-
-    def display_prediction_details(self, item):
-        index = self.predictions_list_widget.row(item)
-        if 0 <= index < len(self.predictions_data):
-            prediction = self.predictions_data[index]
-            
-            # Clear previous editor widgets by removing the old scroll area
-            # Find and remove the old scroll area if it exists
-            for i in reversed(range(self.predictions_editor_area_layout.count())):
-                widget_item = self.predictions_editor_area_layout.itemAt(i).widget()
-                if isinstance(widget_item, QScrollArea):
-                    widget_item.deleteLater()
-                    break # Assuming only one scroll area for fields
-            self.prediction_fields_widgets.clear()
-
-            self.prediction_fields_widgets = self.create_form_layout_from_dict(
-                prediction, 
-                self.predictions_editor_area_layout, # Pass the dedicated layout for the form
-                excluded_keys=[] 
-            )
-            
-    def display_blog_details(self, item):
-        self.current_blog_is_new = False # Editing an existing post
-        index = self.blog_list_widget.row(item)
-        if 0 <= index < len(self.blog_posts_data):
-            post = self.blog_posts_data[index]
-
-            for i in reversed(range(self.blog_metadata_editor_area_layout.count())):
-                widget_item = self.blog_metadata_editor_area_layout.itemAt(i).widget()
-                if isinstance(widget_item, QScrollArea):
-                    widget_item.deleteLater()
-                    break
-            self.blog_fields_widgets.clear()
-
-            self.blog_fields_widgets = self.create_form_layout_from_dict(
-                post, 
-                self.blog_metadata_editor_area_layout, # Pass dedicated layout
-                excluded_keys=['content']
-            )
+    def load_all_data_in_background(self):
+        """Parse the data files on the I/O pool; the lists fill in when that finishes."""
+        self.statusBar().showMessage("Loading data...")
+        started = time.perf_counter()
+        def loaded(results):
+            self._load_task = None
+            self._apply_loaded_data(results)
+            self.startup_timings["data_load_ms"] = (time.perf_counter() - started) * 1000
+            self.statusBar().showMessage(f"Loaded {len(self.predictions_store)} predictions and "
+                                         f"{len(self.blog_posts_store)} blog posts", 3000)
+            if self.startup_report:
+                print(format_startup_report(self.startup_timings))
+        self._load_task = run_in_pool(self.io_pool, self._read_data_files, on_done=loaded)
+
+    def _read_data_files(self):
+        # Touches only the files, so it is safe on a pool thread
+        results = {}
+        for name, data_file, summary_fields in (
+            ("predictions", self.predictions_file, PREDICTION_SUMMARY_FIELDS),
+            ("blog_posts", self.blog_posts_file, BLOG_POST_SUMMARY_FIELDS),
+        ):
+            try:
+                results[name] = data_file.load(summary_fields)
+            except Exception as e:
+                results[name] = e
+        return results
+
+    def _apply_loaded_data(self, results):
+        for name, title, model, data_file, writer in (
+            ("predictions", "Predictions", self.predictions_model, self.predictions_file, self.predictions_writer),
+            ("blog_posts", "Blog Posts", self.blog_posts_model, self.blog_posts_file, self.blog_posts_writer),
+        ):
+            records = results[name]
+            if isinstance(records, Exception):
+                QMessageBox.critical(self, f"Error Loading {title}", f"Could not load {data_file.path}:\n{records}")
+                continue
+            with span('editor.load', data=name) as s:
+                model.load(records)
+                s.set(records=len(model.store))
+            writer.enabled = True
+        self.prediction_facets.refresh_counts()
+        self._refresh_dashboard()
+
+    def _data_sets(self):
+        return (
+            ("Predictions", self.predictions_model, self.predictions_file, self.predictions_writer, PREDICTION_SUMMARY_FIELDS),
+            ("Blog Posts", self.blog_posts_model, self.blog_posts_file, self.blog_posts_writer, BLOG_POST_SUMMARY_FIELDS),
+        )
+
+    def check_data_file(self, path):
+        """Diff a data file that changed on disk on the I/O pool, then merge it in."""
+        path = os.path.abspath(path)
+        for data_set in self._data_sets():
+            title, model, data_file, writer, summary_fields = data_set
+            if os.path.abspath(data_file.path) != path or not writer.enabled:
+                continue
+            if path in self._change_checks:
+                self._change_checks[path] = None # Check again once the running one is merged
+                return
+            def done(changes, data_set=data_set):
+                try:
+                    self._merge_file_changes(data_set, changes)
+                finally:
+                    self._finish_change_check(path)
+            def failed(error, data_file=data_file):
+                self.statusBar().showMessage(f"Could not read changes to {data_file.path}: {error}", 5000)
+                self._finish_change_check(path)
+            self._change_checks[path] = run_in_pool(self.io_pool, data_file.detect_changes, summary_fields,
+                                                    on_done=done, on_error=failed)
+
+    def _finish_change_check(self, path):
+        if self._change_checks.pop(path, True) is None:
+            self.check_data_file(path)
+
+    def _merge_file_changes(self, data_set, changes):
+        """Patch the records another program changed into the store, list and open form.
+
+        Records that also have edits here which aren't in the file yet (journaled,
+        queued, or unsaved in the form) are conflicts; the user picks a side.
+        """
+        if changes is None:
+            return
+        title, model, data_file, writer, summary_fields = data_set
+        store = model.store
+        with span('editor.merge_file_changes', data=title) as s:
+            for record in changes.records:
+                store.relink(record) # Unchanged stubs now live at new offsets
+            unsaved = data_file.journaled_ids | writer.queued_ids()
+            unsaved_forms = self._unsaved_ids(store)
+            incoming = dict(changes.changed)
+            incoming.update((record['id'], record) for record in changes.added if record.get('id') in store)
+            # Digests are of the raw bytes, so a reformatted file flags records whose content is the same
+            incoming = {record_id: record for record_id, record in incoming.items() if store.get(record_id) != record}
+            removed = [record_id for record_id in changes.removed if record_id in store]
+            conflicts = [record_id for record_id in list(incoming) + removed
+                         if record_id in unsaved or record_id in unsaved_forms]
+            take_theirs = not conflicts or self._ask_take_theirs(title, conflicts)
+            for record_id, record in incoming.items():
+                if record_id not in store:
+                    continue
+                if record_id in conflicts:
+                    if not take_theirs and record_id in unsaved:
+                        continue # Ours is already journaled and wins at the next compaction
+                    if take_theirs and record_id in unsaved:
+                        writer.save(record, record_id) # So replaying the journal ends with theirs
+                model.refresh_row(store.update(record_id, record))
+                if record_id not in unsaved_forms or take_theirs:
+                    self._reshow_record(store, record_id)
+            for record_id in removed:
+                if record_id not in conflicts or take_theirs:
+                    model.remove_record(record_id)
+                    if store is self.predictions_store:
+                        self._forget_prediction(record_id)
+            inserted = [record for record in changes.added if record.get('id') not in store]
+            for record in inserted:
+                model.insert_record(record)
+            data_file.accept_changes(changes)
+            s.set(changed=len(incoming), added=len(inserted), removed=len(removed), conflicts=len(conflicts))
+        writer.request_compaction() # Folds any journaled edits into the new file
+        if store is self.predictions_store:
+            self.prediction_facets.refresh_counts()
+            self.filter_predictions()
+            self._refresh_dashboard()
+        else:
+            self.filter_blog_posts(self.blog_search_edit.text())
+        if incoming or inserted or removed:
+            kept = f", kept your edits to {len(conflicts)}" if conflicts and not take_theirs else ""
+            self.statusBar().showMessage(
+                f"{title} changed on disk: {len(incoming)} updated, {len(inserted)} added, {len(removed)} removed{kept}", 5000)
+
+    def _unsaved_ids(self, store):
+        """Ids of the records in ``store`` with edits in a form (or a draft) that aren't saved yet."""
+        if store is self.predictions_store:
+            return {record_id for record_id in self.prediction_form_pool.dirty_ids() if record_id in store}
+        form, record_id = self.blog_form, self.blog_form_id
+        if self.current_blog_is_new or form is None or record_id not in store:
+            return set()
+        record = store.full(record_id)
+        edited = self._get_data_from_widgets(record, form.filled_widgets())
+        content = self.blog_content_edit.toPlainText()
+        if content or 'content' in record:
+            edited['content'] = content
+        return {record_id} if edited != record else set()
+
+    def _reshow_record(self, store, record_id):
+        """Repopulate the record's form, if it has one, dropping any unsaved edits there."""
+        if store is self.predictions_store:
+            form = self.prediction_form_pool.reload_record(store.full(record_id))
+            if record_id == self.prediction_form_id:
+                self.prediction_form = form
+            self._update_prediction_tab(record_id)
+        elif store is self.blog_posts_store and record_id == self.blog_form_id and not self.current_blog_is_new:
+            post = store.full(record_id)
+            self.blog_form = self.blog_form_pool.show_record(post)
             self.blog_content_edit.setText(post.get('content', ''))
 
+    def _ask_take_theirs(self, title, conflicts):
+        listed = ", ".join(str(record_id) for record_id in conflicts[:10])
+        if len(conflicts) > 10:
+            listed += f" and {len(conflicts) - 10} more"
+        box = QMessageBox(self)
+        box.setIcon(QMessageBox.Icon.Warning)
+        box.setWindowTitle(f"{title} Changed on Disk")
+        box.setText(f"Another program changed {listed}, which you have also edited here.\n\n"
+                    "Keep your edits (they replace the other changes when saved), or take the version on disk?")
+        box.addButton("Keep Mine", QMessageBox.ButtonRole.RejectRole)
+        theirs = box.addButton("Take Theirs", QMessageBox.ButtonRole.AcceptRole)
+        box.exec()
+        return box.clickedButton() is theirs
+
+    def display_prediction_details(self, model_index, previous_index=None):
+        index = self.predictions_model.store_row(model_index)
+        if 0 <= index < len(self.predictions_store):
+            prediction = self.predictions_store.full_at(index)
+            with self.selection_latency.measure(), span('editor.open_record', records=1):
+                self._show_prediction(prediction['id'])
+            self._report_selection_latency(prediction)
+
+    def _show_prediction(self, record_id):
+        """Bring up the prediction's tab, opening one if needed."""
+        pool = self.prediction_form_pool
+        self.prediction_form = pool.switch_to(record_id) or pool.open_record(self.predictions_store.full(record_id))
+        self.prediction_form_id = record_id
+        tab = self._prediction_tab(record_id)
+        self.prediction_tabs.blockSignals(True) # Already showing it
+        if tab < 0:
+            tab = self.prediction_tabs.addTab(str(record_id))
+            self.prediction_tabs.setTabData(tab, record_id)
+            self._update_prediction_tab(record_id)
+        self.prediction_tabs.setCurrentIndex(tab)
+        self.prediction_tabs.blockSignals(False)
+
+    def _prediction_tab(self, record_id):
+        return next((tab for tab in range(self.prediction_tabs.count()) if self.prediction_tabs.tabData(tab) == record_id), -1)
+
+    def _update_prediction_tab(self, record_id):
+        tab = self._prediction_tab(record_id)
+        if tab >= 0:
+            dirty = self.prediction_form_pool.is_dirty(record_id)
+            self.prediction_tabs.setTabText(tab, f"{record_id} •" if dirty else str(record_id))
+            if record_id in self.predictions_store:
+                self.prediction_tabs.setTabToolTip(tab, prediction_display_text(self.predictions_store.at(self.predictions_store.row_of(record_id))))
+
+    def _on_prediction_tab_changed(self, tab):
+        record_id = self.prediction_tabs.tabData(tab) if tab >= 0 else None
+        if record_id is None or record_id not in self.predictions_store:
+            self.prediction_form = self.prediction_form_id = None
+            return
+        self._show_prediction(record_id)
+        index = self.predictions_model.index_for_store_row(self.predictions_store.row_of(record_id))
+        if index.isValid() and index != self.predictions_list_view.currentIndex():
+            self.predictions_list_view.setCurrentIndex(index) # Comes back to _show_prediction, which is then a no-op
+
+    def close_prediction_tab(self, tab):
+        record_id = self.prediction_tabs.tabData(tab)
+        if record_id in self.predictions_store and self.prediction_form_pool.edits(record_id):
+            answer = QMessageBox.question(self, "Unsaved Prediction", f"Save your changes to {record_id}?",
+                                          QMessageBox.StandardButton.Save | QMessageBox.StandardButton.Discard
+                                          | QMessageBox.StandardButton.Cancel)
+            if answer == QMessageBox.StandardButton.Cancel:
+                return
+            if answer == QMessageBox.StandardButton.Save:
+                saved = self._save_predictions([record_id])
+                if saved is None:
+                    return
+                record_id = saved[0][0]['id'] if saved else record_id
+        self._forget_prediction(record_id)
+
+    def _forget_prediction(self, record_id):
+        """Close the prediction's tab and drop its form and any unsaved edits."""
+        self.prediction_form_pool.close_record(record_id, discard=True)
+        tab = self._prediction_tab(record_id)
+        if tab >= 0:
+            self.prediction_tabs.removeTab(tab) # Moves to a neighbouring tab, if any
+        if self.prediction_tabs.count() == 0:
+            self.prediction_form = self.prediction_form_id = None
+
+    def _rename_prediction(self, record_id, new_id):
+        """Follow an id change of an open prediction in its tab and form."""
+        self.prediction_form_pool.rename(record_id, new_id)
+        tab = self._prediction_tab(record_id)
+        if tab >= 0:
+            self.prediction_tabs.setTabData(tab, new_id)
+            self._update_prediction_tab(new_id)
+        if self.prediction_form_id == record_id:
+            self.prediction_form_id = new_id
+
+    def display_blog_details(self, model_index, previous_index=None):
+        if not model_index.isValid():
+            return # Deselected, e.g. while preparing a new post
+        self.current_blog_is_new = False # Editing an existing post
+        index = self.blog_posts_model.store_row(model_index)
+        if 0 <= index < len(self.blog_posts_store):
+            post = self.blog_posts_store.full_at(index)
+            with self.selection_latency.measure(), span('editor.open_record', records=1):
+                self.blog_form = self.blog_form_pool.show_record(post)
+                self.blog_form_id = post.get('id')
+                self.blog_content_edit.setText(post.get('content', ''))
+            self._report_selection_latency(post)
+
+    def filter_predictions(self, *args):
+        facet_rows = None
+        if self.prediction_facets.active():
+            facet_index = self.predictions_facet_index
+            facet_rows = facet_index.rows(facet_index.select(self.prediction_facets.filters()))
+        timeline = self.prediction_timeline
+        if timeline.active():
+            if timeline.mode() == "Overdue":
+                ids = self.predictions_timeline_index.overdue(timeline.stale_spin.value())
+            else:
+                ids = self.predictions_timeline_index.due_between(*timeline.due_range())
+            timeline_rows = sorted(self.predictions_store.row_of(record_id) for record_id in ids)
+            facet_rows = timeline_rows if facet_rows is None else sorted(set(facet_rows).intersection(timeline_rows))
+        timeline_index, store = self.predictions_timeline_index, self.predictions_store
+
+        def by_due_date(row):
+            return timeline_index.rank(store.at(row)['id'])
+        self._apply_search(self.predictions_search_index, self.predictions_model, self.predictions_list_view,
+                           self.prediction_form_id, self.predictions_search_edit.text(), facet_rows,
+                           by_due_date if timeline.chronological() else None)
+
+    def filter_blog_posts(self, query):
+        self._apply_search(self.blog_posts_search_index, self.blog_posts_model,
+                           self.blog_list_view, self.blog_form_id, query)
+
+    def _apply_search(self, search_index, model, view, shown_id, query, facet_rows=None, order=None):
+        """Filter ``model`` by ``query``, within ``facet_rows`` (store rows) if given, sorted by ``order(row)``."""
+        with span('editor.filter'):
+            self._filter_model(search_index, model, query, facet_rows, order)
+        # Keep the record being edited highlighted if it is still listed
+        if shown_id in model.store:
+            index = model.index_for_store_row(model.store.row_of(shown_id))
+            if index.isValid():
+                view.selectionModel().blockSignals(True) # The form already shows it
+                view.setCurrentIndex(index)
+                view.selectionModel().blockSignals(False)
+
+    def _filter_model(self, search_index, model, query, facet_rows, order=None):
+        if not query.strip():
+            if facet_rows is None and order is not None:
+                model.set_visible_rows(range(len(model.store)), order)
+            else:
+                model.set_visible_rows(facet_rows, order)
+            if facet_rows is not None:
+                self.statusBar().showMessage(f"{len(facet_rows)} matching record{'s' if len(facet_rows) != 1 else ''}", 3000)
+        else:
+            if not search_index.built:
+                self.statusBar().showMessage("Building search index...")
+            started = time.perf_counter()
+            ids = search_index.search(query)
+            store = model.store
+            rows = [store.row_of(record_id) for record_id in ids]
+            if facet_rows is not None:
+                rows = set(rows)
+                rows = [row for row in facet_rows if row in rows]
+            model.set_visible_rows(rows, order)
+            self.statusBar().showMessage(
+                f"{len(rows)} match{'es' if len(rows) != 1 else ''} in {(time.perf_counter() - started) * 1000:.1f} ms", 3000)
+
+    def _report_selection_latency(self, record):
+        elapsed = self.selection_latency.last
+        p95 = self.selection_latency.percentile(95)
+        budget = "within" if elapsed <= FRAME_BUDGET_MS else "over"
+        self.statusBar().showMessage(
+            f"{record.get('id', 'Record')} opened in {elapsed:.1f} ms ({budget} {FRAME_BUDGET_MS} ms frame budget, p95 {p95:.1f} ms)", 5000)
+
+    def show_trace_stats(self):
+        if self.trace_stats_dialog is None:
+            from trace_panel import TraceStatsDialog
+            self.trace_stats_dialog = TraceStatsDialog(self)
+        self.trace_stats_dialog.show()
+        self.trace_stats_dialog.raise_()
+
+    def check_evidence_links(self):
+        """Probe stale supportingEvidence URLs on the I/O pool, then badge the predictions list."""
+        if self._link_check is not None:
+            return
+        from link_checker import LinkCache, LinkChecker, evidence_urls
+        links = {record['id']: evidence_urls(record) for record in self.predictions_store.iter_full()}
+        urls = [url for record_urls in links.values() for url in record_urls]
+        cache = self.link_cache
+
+        def check():
+            checker = LinkChecker(cache if cache is not None else LinkCache())
+            return checker.cache, checker.run(urls)
+
+        def done(result):
+            self._link_check = None
+            self.link_cache, stats = result
+            self.predictions_model.set_badges({record_id: self._link_badge(record_urls)
+                                               for record_id, record_urls in links.items()})
+            failing = sum(1 for record_urls in links.values()
+                          if any(self.link_cache.health(url) in ('broken', 'error') for url in record_urls))
+            self.statusBar().showMessage(
+                f"Checked {stats['checked']} evidence links ({stats['probed']} probed, {stats['revalidated']} unchanged): "
+                f"{failing} predictions have broken links", 8000)
+
+        def failed(error):
+            self._link_check = None
+            QMessageBox.warning(self, "Link Check Failed", f"Could not check the evidence links:\n{error}")
+
+        self.statusBar().showMessage(f"Checking {len(set(urls))} evidence links...")
+        self._link_check = run_in_pool(self.io_pool, check, on_done=done, on_error=failed)
+
+    def _link_badge(self, urls):
+        from link_checker import HEALTH_DESCRIPTIONS, HEALTH_ORDER, record_health
+        worst, by_health = record_health(urls, self.link_cache)
+        if worst is None:
+            return None
+        lines = [f"{len(by_health[health])} {HEALTH_DESCRIPTIONS[health]}" for health in HEALTH_ORDER if health in by_health]
+        lines += [f"  {url}" for health in ('broken', 'error') for url in by_health.get(health, ())]
+        return QColor(LINK_HEALTH_COLORS[worst]), "Evidence links:\n" + "\n".join(lines)
+
+    def schedule_markdown_preview(self):
+        now = time.perf_counter()
+        if not self.preview_timer.isActive():
+            self._preview_pending_since = now
+        elif (now - self._preview_pending_since) * 1000 >= PREVIEW_MAX_WAIT_MS:
+            return # Don't push the pending render back any further
+        self.preview_timer.start()
+
+    def _on_tab_changed(self, index):
+        if self.tabs.widget(index) is self.blog_tab and self.markdown_preview is None:
+            self._create_markdown_preview()
+            self.update_markdown_preview()
+        elif self.tabs.widget(index) is self.dashboard_tab and self.dashboard is None:
+            from analytics_panel import AccuracyDashboard
+            self.dashboard = AccuracyDashboard(self.predictions_store, load_status_order())
+            self.dashboard_layout.addWidget(self.dashboard)
+        elif self.tabs.widget(index) is self.metr_tab and self.metr_panel is None:
+            from metr_panel import MetrPointsPanel
+            try:
+                self.metr_panel = MetrPointsPanel()
+            except (OSError, ValueError) as e:
+                QMessageBox.critical(self, "Error Loading METR Points", str(e))
+                return
+            self.metr_layout.addWidget(self.metr_panel)
+
+    def _refresh_dashboard(self):
+        if self.dashboard is not None:
+            self.dashboard.schedule_refresh() # Its figures follow the store by themselves
+
+    def _create_markdown_preview(self):
+        started = time.perf_counter()
+        self.markdown_preview = create_markdown_preview(PREVIEW_HTML_SHELL, COLOR_CARD_BACKGROUND, self.preview_backend)
+        self.markdown_preview_layout.addWidget(self.markdown_preview)
+        self.startup_timings["preview_create_ms"] = (time.perf_counter() - started) * 1000
+        self.startup_timings["preview_backend"] = type(self.markdown_preview).__name__
+        if self.startup_report:
+            print(format_startup_report(self.startup_timings))
+
     def update_markdown_preview(self):
+        self.preview_timer.stop()
+        if self.markdown_preview is None:
+            return # Rendered once the tab is shown
         md_text = self.blog_content_edit.toPlainText()
         self.markdown_preview.set_markdown_content(md_text)
+        stats = self.markdown_preview.render_latency.summary()
+        self.preview_latency_label.setText(f"render {stats['last_ms']:.1f} ms (p95 {stats['p95_ms']:.1f} ms)")
 
     def _get_data_from_widgets(self, data_dict, widgets_dict):
+        return self._get_data_from_texts(data_dict, {key: (widget_text(widget), isinstance(widget, QTextEdit))
+                                                     for key, widget in widgets_dict.items()
+                                                     if isinstance(widget, (QTextEdit, QLineEdit))})
+
+    def _get_data_from_texts(self, data_dict, texts):
+        """``data_dict`` with ``{key: (text, multiline)}`` coerced back into field values."""
         updated_data = data_dict.copy()
-        for key, widget in widgets_dict.items():
+        for key, (text_value, multiline) in texts.items():
             original_value = data_dict.get(key)
-            if isinstance(widget, QTextEdit):
-                text_value = widget.toPlainText()
-                if isinstance(original_value, (list, dict)):
-                    try:
-                        updated_data[key] = json.loads(text_value)
-                    except json.JSONDecodeError:
-                        updated_data[key] = text_value 
-                        print(f"Warning: Could not parse JSON for field '{{key}}'. Saved as string.")
-                else:
-                    updated_data[key] = text_value
-            elif isinstance(widget, QLineEdit):
-                text_value = widget.text()
-                if isinstance(original_value, int):
-                    try: updated_data[key] = int(text_value)
-                    except ValueError: updated_data[key] = text_value
-                elif isinstance(original_value, float):
-                    try: updated_data[key] = float(text_value)
-                    except ValueError: updated_data[key] = text_value
-                elif isinstance(original_value, bool):
-                    updated_data[key] = text_value.lower() in ['true', '1', 'yes']
-                elif original_value is None and (text_value.lower() == 'null' or not text_value):
-                     updated_data[key] = None
-                else:
+            if multiline:
+                try:
+                    updated_data[key] = coerce_field_text(original_value, text_value, multiline=True, strict=True)
+                except ValueError:
                     updated_data[key] = text_value
+                    print(f"Warning: Could not parse JSON for field '{key}'. Saved as string.")
+            else:
+                updated_data[key] = coerce_field_text(original_value, text_value)
         return updated_data
 
     def save_current_prediction(self):
-        current_row = self.predictions_list_widget.currentRow()
-        if current_row < 0:
+        if self.prediction_form is None or self.prediction_form_id not in self.predictions_store:
             QMessageBox.warning(self, "No Prediction Selected", "Please select a prediction to save.")
             return
+        self._save_predictions([self.prediction_form_id])
 
-        original_prediction = self.predictions_data[current_row]
-        updated_prediction = self._get_data_from_widgets(original_prediction, self.prediction_fields_widgets)
-        
-        if 'id' not in self.prediction_fields_widgets and 'id' in original_prediction:
-             updated_prediction['id'] = original_prediction['id']
+    def save_all_predictions(self):
+        """Save every open prediction that has edits; the others aren't written."""
+        open_ids = [self.prediction_tabs.tabData(tab) for tab in range(self.prediction_tabs.count())]
+        self._save_predictions([record_id for record_id in open_ids if record_id in self.predictions_store])
 
-        self.predictions_data[current_row] = updated_prediction
-        self._save_data_to_file(PREDICTIONS_FILE, self.predictions_data, "Predictions")
-        pred = self.predictions_data[current_row]
-        self.predictions_list_widget.item(current_row).setText(f"{{pred.get('id', 'N/A')}}: {{pred.get('text', 'No Text')[:50]}}...")
+    def _save_predictions(self, record_ids):
+        """Save the edited fields of open predictions, skipping those that didn't really change.
+
+        Only the dirty fields are read back, so untouched ones keep their stored
+        values exactly. Returns the ``(record, previous_id)`` pairs saved, or
+        None if a save was refused partway (what was saved before that stays).
+        """
+        pool = self.prediction_form_pool
+        saves = []
+        edits = [] # (before, after), for the history
+        refused = False
+        for record_id in record_ids:
+            original_prediction = self.predictions_store.full(record_id)
+            updated_prediction = self._get_data_from_texts(original_prediction, pool.edits(record_id))
+            if updated_prediction == original_prediction:
+                pool.mark_saved(record_id) # Typed and then put back
+                self._update_prediction_tab(record_id)
+                continue
+            if not self._confirm_valid(self.prediction_validator, updated_prediction):
+                refused = True
+                break
+            try:
+                current_row = self.predictions_store.update(record_id, updated_prediction)
+            except ValueError as e: # Includes DuplicateIdError
+                QMessageBox.warning(self, "Invalid ID", str(e))
+                refused = True
+                break
+            pool.mark_saved(record_id)
+            if updated_prediction['id'] != record_id:
+                self._rename_prediction(record_id, updated_prediction['id'])
+            self._update_prediction_tab(updated_prediction['id'])
+            self.predictions_model.refresh_row(current_row)
+            saves.append((updated_prediction, record_id))
+            edits.append((original_prediction, updated_prediction))
+        if len(saves) == 1:
+            self._record_history("Predictions", f"Save {saves[0][0]['id']}", edits)
+            self._save_data_to_file(self.predictions_writer, saves[0][0], "Predictions", previous_id=saves[0][1])
+        elif saves:
+            self._record_history("Predictions", f"Save {len(saves)} Predictions", edits)
+            with span('editor.save', records=len(saves)):
+                self.predictions_writer.save_many(saves)
+            self.statusBar().showMessage("Saving Predictions...")
+        elif not refused:
+            self.statusBar().showMessage("No changes to save", 3000)
+        if saves:
+            self._predictions_saved(saves)
+        return None if refused else saves
+
+    def _predictions_saved(self, saves):
+        """Bring the panels that summarize predictions up to date after ``(record, previous_id)`` saves."""
+        self.prediction_facets.refresh_counts() # The facet index already has the new values
+        self._refresh_dashboard()
+        if self.prediction_timeline.active() or self.prediction_timeline.chronological():
+            self.filter_predictions() # The saved dates may move the record or take it out of the list
+        if self.link_cache is not None: # Edited links show as unchecked until the next check
+            from link_checker import evidence_urls
+            badges = {previous_id: None for record, previous_id in saves}
+            badges.update((record['id'], self._link_badge(evidence_urls(record))) for record, previous_id in saves)
+            self.predictions_model.set_badges(badges)
+
+    def apply_bulk_edit(self, data_set, operation, field, text):
+        """Apply one bulk edit to every selected record and save them all as one write."""
+        title, model, data_file, writer, summary_fields = data_set
+        store = model.store
+        view = self.predictions_list_view if store is self.predictions_store else self.blog_list_view
+        validator = self.prediction_validator if store is self.predictions_store else self.blog_post_validator
+        ids = [store.at(model.store_row(index))['id'] for index in view.selectionModel().selectedRows()]
+        if not ids:
+            return
+        verb = {'set': f"Set {field} to", 'append': f"Append to {field}:", 'remove': f"Remove from {field}:"}[operation]
+        question = f"{verb} {text!r} on {len(ids)} {title.lower()}?"
+        replaced = self._unsaved_ids(store) & set(ids)
+        if replaced:
+            question += f"\n\nYour unsaved edits to {', '.join(sorted(map(str, replaced)))} will be replaced."
+        if QMessageBox.question(self, "Bulk Edit", question) != QMessageBox.StandardButton.Yes:
+            return
+        saves = []
+        edits = [] # (before, after), for the history
+        unchanged = 0
+        failures = [] # (id, message)
+        examples = FieldExamples(store)
+        with span('editor.bulk_edit', records=len(ids)) as s:
+            for record_id in ids:
+                record = store.full(record_id)
+                try:
+                    updated = apply_bulk_edit(record, field, operation, text, examples)
+                except PatchError as e:
+                    failures.append((record_id, str(e)))
+                    continue
+                if updated == record:
+                    unchanged += 1
+                    continue
+                problems = [problem for problem in validator.errors(updated) if problem not in validator.errors(record)]
+                if problems:
+                    failures.append((record_id, "; ".join(problems)))
+                    continue
+                model.refresh_row(store.update(record_id, updated))
+                saves.append((updated, record_id))
+                edits.append((record, updated))
+            s.set(changed=len(saves), failed=len(failures))
+        if saves:
+            self._record_history(title, f"Bulk Edit of {len(saves)} {title}", edits)
+            writer.save_many(saves)
+            self.statusBar().showMessage(f"Saving {title}...")
+            if store is self.predictions_store:
+                self._predictions_saved(saves)
+            for updated, record_id in saves:
+                self._reshow_record(store, record_id)
+        summary = f"{verb} {text!r}: {len(saves)} changed, {unchanged} already matched, {len(failures)} failed."
+        if failures:
+            summary += "\n\n" + "\n".join(f"{record_id}: {message}" for record_id, message in failures[:10])
+            if len(failures) > 10:
+                summary += f"\n...and {len(failures) - 10} more"
+        QMessageBox.information(self, "Bulk Edit", summary)
 
 
+    def _record_history(self, data_name, label, changes):
+        self.history.record(data_name, label, changes)
+        self._update_history_actions()
+
+    def _update_history_actions(self):
+        for action, verb, entry in ((self.undo_action, "Undo", self.history.next_undo()),
+                                    (self.redo_action, "Redo", self.history.next_redo())):
+            action.setEnabled(entry is not None)
+            action.setText(f"{verb} {entry['label']}" if entry is not None else verb)
+
+    def undo(self):
+        self._step_history(self.history.undo, self.history.next_undo(), "Undo")
+
+    def redo(self):
+        self._step_history(self.history.redo, self.history.next_redo(), "Redo")
+
+    def _step_history(self, step, entry, verb):
+        if entry is None:
+            return
+        data_set = next((data_set for data_set in self._data_sets() if data_set[0] == entry['data']), None)
+        if data_set is None:
+            return
+        store = data_set[1].store
+        reverse = verb == "Undo"
+        replaced = self._unsaved_ids(store) & {revert_target(change, reverse)[0] for change in entry['records']}
+        if replaced:
+            answer = QMessageBox.question(self, verb, f"{verb} {entry['label']}? Your unsaved edits to "
+                                                      f"{', '.join(sorted(map(str, replaced)))} will be replaced.")
+            if answer != QMessageBox.StandardButton.Yes:
+                return
+        try:
+            step(lambda entry, reverse: self._apply_history_entry(data_set, entry, reverse))
+        except HistoryConflict as e:
+            QMessageBox.warning(self, f"Can't {verb}", f"Can't {verb.lower()} {entry['label']}: {e}")
+            return
+        self._update_history_actions()
+        self.statusBar().showMessage(f"{verb}: {entry['label']}", 4000)
+
+    def _apply_history_entry(self, data_set, entry, reverse):
+        """Undo (``reverse``) or redo one history entry and save the records it touches as one write."""
+        title, model, data_file, writer, summary_fields = data_set
+        store = model.store
+        # Everything is checked before anything changes, so a conflict leaves the records as they were
+        updates = []
+        for change in entry['records']:
+            current_id, target_id = revert_target(change, reverse)
+            if current_id not in store:
+                raise HistoryConflict(f"{current_id} is no longer there")
+            if target_id != current_id and target_id in store:
+                raise HistoryConflict(f"{target_id} is taken by another record")
+            try:
+                updates.append((current_id, apply_diff(store.full(current_id), change['fields'], reverse)))
+            except HistoryConflict as e:
+                raise HistoryConflict(f"{current_id} {e}") from None
+        saves = []
+        for current_id, updated in updates:
+            model.refresh_row(store.update(current_id, updated))
+            saves.append((updated, current_id))
+            if store is self.predictions_store and updated['id'] != current_id:
+                self._rename_prediction(current_id, updated['id'])
+            elif store is self.blog_posts_store and self.blog_form_id == current_id:
+                self.blog_form_id = updated['id']
+        with span('editor.save', records=len(saves)):
+            writer.save_many(saves)
+        if store is self.predictions_store:
+            self._predictions_saved(saves)
+        for updated, current_id in saves:
+            self._reshow_record(store, updated['id'])
+
     def prepare_new_blog_post(self):
         self.current_blog_is_new = True
-        self.blog_list_widget.setCurrentRow(-1) # Deselect any item in the list
+        self.blog_list_view.setCurrentIndex(QModelIndex()) # Deselect any item in the list
 
-        # Generate a new placeholder ID (simple increment for now)
-        new_id_num = 1
-        if self.blog_posts_data:
-            ids = [int(p['id'][1:]) for p in self.blog_posts_data if p['id'].startswith('B') and p['id'][1:].isdigit()]
-            if ids:
-                new_id_num = max(ids) + 1
-        new_id = f"B{{str(new_id_num).zfill(3)}}"
+        new_id = self.blog_posts_store.next_id()
 
         from datetime import date
         today = date.today().strftime("%Y-%m-%d")
 
-        new_post_template = {{
+        new_post_template = {
             "id": new_id,
             "title": "New Blog Post Title",
             "date": today,
@@ -543,31 +1803,21 @@ class EditorWindow(QMainWindow):
             "summary": "A brief summary of this new post.",
             "content": "# New Post\n\nStart writing your Markdown content here!",
             "tags": ["new", "draft"]
-        }}
+        }
 
-        # Clear previous metadata editor widgets
-        for i in reversed(range(self.blog_metadata_editor_area_layout.count())):
-            widget_item = self.blog_metadata_editor_area_layout.itemAt(i).widget()
-            if isinstance(widget_item, QScrollArea):
-                widget_item.deleteLater()
-                break
-        self.blog_fields_widgets.clear()
-
-        self.blog_fields_widgets = self.create_form_layout_from_dict(
-            new_post_template, 
-            self.blog_metadata_editor_area_layout, 
-            excluded_keys=['content'] # Content is handled by dedicated editor
-        )
+        self.blog_form = self.blog_form_pool.show_record(new_post_template)
+        self.blog_form_id = None # Not in the store until saved
+        self.blog_form.fill_all() # Save reads every field of a new post
         self.blog_content_edit.setText(new_post_template.get('content', ''))
         self.update_markdown_preview()
-        QMessageBox.information(self, "New Blog Post", f"Editing new blog post. ID will be '{{new_id}}'. Fill details and save.")
+        QMessageBox.information(self, "New Blog Post", f"Editing new blog post. ID will be '{new_id}'. Fill details and save.")
 
     def save_current_blog_post(self):
         if self.current_blog_is_new:
             # Data is already in widgets from prepare_new_blog_post
             # We just need to construct the full new post object from them
-            new_post_data = {{}}
-            for key, widget in self.blog_fields_widgets.items():
+            new_post_data = {}
+            for key, widget in self.blog_form.widgets.items():
                 original_template_value = None # Not strictly needed here but for consistency with _get_data
                 if isinstance(widget, QTextEdit):
                     text_value = widget.toPlainText()
@@ -581,58 +1831,164 @@ class EditorWindow(QMainWindow):
             new_post_data['content'] = self.blog_content_edit.toPlainText()
             
             # Ensure ID is correctly taken if it was editable (it should be from the template)
-            if 'id' not in new_post_data and self.blog_fields_widgets.get('id'):
-                 new_post_data['id'] = self.blog_fields_widgets['id'].text()
+            if 'id' not in new_post_data and self.blog_form.widgets.get('id'):
+                 new_post_data['id'] = self.blog_form.widgets['id'].text()
             elif 'id' not in new_post_data: # Fallback if ID field somehow missing
                 QMessageBox.critical(self, "Error", "Could not determine ID for new blog post.")
                 return
 
             # Check for duplicate ID
-            if any(p['id'] == new_post_data['id'] for p in self.blog_posts_data):
-                QMessageBox.warning(self, "Duplicate ID", f"A blog post with ID '{{new_post_data['id']}}' already exists. Please change the ID.")
+            if new_post_data['id'] in self.blog_posts_store:
+                QMessageBox.warning(self, "Duplicate ID", f"A blog post with ID '{new_post_data['id']}' already exists. Please change the ID.")
+                return
+            if not self._confirm_valid(self.blog_post_validator, new_post_data):
                 return
 
-            self.blog_posts_data.append(new_post_data)
-            self._save_data_to_file(BLOG_POSTS_FILE, self.blog_posts_data, "Blog Posts")
-            self.blog_list_widget.addItem(f"{{new_post_data.get('id')}}: {{new_post_data.get('title', 'No Title')}}")
-            self.blog_list_widget.setCurrentRow(self.blog_list_widget.count() - 1)
+            new_index = self.blog_posts_model.insert_record(new_post_data)
+            self._save_data_to_file(self.blog_posts_writer, new_post_data, "Blog Posts")
+            self.blog_list_view.setCurrentIndex(new_index)
             self.current_blog_is_new = False # Reset flag
-            QMessageBox.information(self, "Blog Post Saved", "New blog post saved successfully.")
 
         else: # Existing post saving logic
-            current_row = self.blog_list_widget.currentRow()
-            if current_row < 0:
+            if self.blog_form is None or self.blog_form_id not in self.blog_posts_store:
                 QMessageBox.warning(self, "No Blog Post Selected", "Please select a blog post to save.")
                 return
+            current_row = self.blog_posts_store.row_of(self.blog_form_id)
 
-            original_post = self.blog_posts_data[current_row]
-            updated_post_metadata = self._get_data_from_widgets(original_post, self.blog_fields_widgets)
+            original_post = self.blog_posts_store.full_at(current_row)
+            post_widgets = self.blog_form.filled_widgets()
+            updated_post_metadata = self._get_data_from_widgets(original_post, post_widgets)
             updated_post_metadata['content'] = self.blog_content_edit.toPlainText()
-            if 'id' not in self.blog_fields_widgets and 'id' in original_post:
+            if 'id' not in post_widgets and 'id' in original_post:
                  updated_post_metadata['id'] = original_post['id']
+            if not self._confirm_valid(self.blog_post_validator, updated_post_metadata):
+                return
+
+            try:
+                self.blog_posts_store.update(original_post['id'], updated_post_metadata)
+            except ValueError as e: # Includes DuplicateIdError
+                QMessageBox.warning(self, "Invalid ID", str(e))
+                return
+            self.blog_form_id = updated_post_metadata['id']
+            self._record_history("Blog Posts", f"Save {updated_post_metadata['id']}", [(original_post, updated_post_metadata)])
+            self._save_data_to_file(self.blog_posts_writer, updated_post_metadata, "Blog Posts",
+                                    previous_id=original_post['id'])
+            self.blog_posts_model.refresh_row(current_row)
+
+    def _confirm_valid(self, validator, record):
+        errors = validator.errors(record)
+        if not errors:
+            return True
+        listed = "\n".join(f"• {error}" for error in errors[:10])
+        answer = QMessageBox.question(
+            self, "Validation Problems", f"{record.get('id', 'This record')} has problems:\n\n{listed}\n\nSave anyway?",
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No, QMessageBox.StandardButton.No)
+        return answer == QMessageBox.StandardButton.Yes
+
+    def _save_data_to_file(self, writer, record, data_name, previous_id=None):
+        """Queue ``record`` for the background writer; the status bar reports when it is on disk."""
+        with span('editor.save', records=1):
+            writer.save(record, previous_id)
+        self.statusBar().showMessage(f"Saving {data_name}...")
+
+    def _report_saved(self, writer, data_name, count, compacted):
+        if writer.busy:
+            return # More is on the way; report once it has all landed
+        if count:
+            message = f"{data_name} saved ({count} change{'s' if count != 1 else ''}) to {writer.data_file.path}"
+        else:
+            message = f"{data_name} written to {writer.data_file.path}"
+        self.statusBar().showMessage(message, 4000)
 
-            self.blog_posts_data[current_row] = updated_post_metadata
-            self._save_data_to_file(BLOG_POSTS_FILE, self.blog_posts_data, "Blog Posts")
-            post = self.blog_posts_data[current_row]
-            self.blog_list_widget.item(current_row).setText(f"{{post.get('id', 'N/A')}}: {{post.get('title', 'No Title')}}")
+    def _report_save_failed(self, writer, data_name, error):
+        self.statusBar().clearMessage()
+        QMessageBox.critical(self, f"Error Saving {data_name}",
+                             f"Could not save data to {writer.data_file.path}:\n{error}\n\nThe change is kept and retried with the next save.")
 
-    def _save_data_to_file(self, filepath, data, data_name):
+    def compact_data_files(self):
+        self.predictions_writer.request_compaction()
+        self.blog_posts_writer.request_compaction()
+
+    def closeEvent(self, event):
+        unsaved = self._unsaved_ids(self.predictions_store)
+        if unsaved:
+            answer = QMessageBox.question(self, "Unsaved Predictions",
+                                          f"Save your changes to {', '.join(sorted(map(str, unsaved)))}?",
+                                          QMessageBox.StandardButton.Save | QMessageBox.StandardButton.Discard
+                                          | QMessageBox.StandardButton.Cancel)
+            if answer == QMessageBox.StandardButton.Cancel or (
+                    answer == QMessageBox.StandardButton.Save and self._save_predictions(sorted(unsaved, key=str)) is None):
+                event.ignore()
+                return
+        if self.metr_panel is not None and self.metr_panel.dirty:
+            answer = QMessageBox.question(self, "Unsaved METR Points", "Save your changes to the METR points?",
+                                          QMessageBox.StandardButton.Save | QMessageBox.StandardButton.Discard
+                                          | QMessageBox.StandardButton.Cancel)
+            if answer == QMessageBox.StandardButton.Cancel or (
+                    answer == QMessageBox.StandardButton.Save and not self.metr_panel.save()):
+                event.ignore()
+                return
+        if self._load_task is not None:
+            self.io_pool.waitForDone() # Don't close files under a running load
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
-            QMessageBox.information(self, f"{{data_name}} Saved", f"{{data_name}} data saved successfully to\n{{filepath}}")
-        except Exception as e:
-            QMessageBox.critical(self, f"Error Saving {{data_name}}", f"Could not save data to {{filepath}}:\n{{e}}")
+            self.history.save()
+        except OSError as e:
+            print(f"Warning: Could not save the undo history to {self.history.path}: {e}")
+        for data_set in self._data_sets():
+            data_name, model, data_file, writer, summary_fields = data_set
+            try:
+                try:
+                    writer.finish()
+                except FileChangedError: # Changed on disk since the last merge
+                    self._merge_file_changes(data_set, data_file.detect_changes(summary_fields))
+                    writer.finish()
+            except Exception as e:
+                QMessageBox.critical(self, f"Error Saving {data_name}", f"Could not write {writer.data_file.path}:\n{e}")
+        self.predictions_file.close()
+        self.blog_posts_file.close()
+        super().closeEvent(event)
+
+def format_startup_report(timings):
+    lines = ["Startup timings:"]
+    for key in ("import_ms", "app_ms", "construct_ms", "data_load_ms", "show_ms", "preview_create_ms"):
+        if key in timings:
+            lines.append(f"  {key[:-3]:<16}{timings[key]:8.1f} ms")
+    if "preview_backend" in timings:
+        lines.append(f"  preview backend {timings['preview_backend']}")
+    return "\n".join(lines)
 
 
 if __name__ == '__main__':
+    startup_report = '--startup-report' in sys.argv
+    trace_path = os.environ.get(tracing.TRACE_ENV) or ('content-editor-trace.json' if '--trace' in sys.argv else None)
+    if trace_path:
+        tracing.enable()
+    preview_backend = 'textbrowser' if '--light-preview' in sys.argv else PREVIEW_BACKEND
+    if preview_backend not in PREVIEW_BACKENDS:
+        sys.exit(f"Unknown preview backend '{preview_backend}', expected one of {PREVIEW_BACKENDS}")
+    storage_backend = 'sqlite' if '--sqlite' in sys.argv else 'sharded' if '--sharded' in sys.argv else STORAGE_BACKEND
+    if storage_backend not in STORAGE_BACKENDS:
+        sys.exit(f"Unknown storage backend '{storage_backend}', expected one of {STORAGE_BACKENDS}")
+
     if hasattr(Qt, 'AA_EnableHighDpiScaling'):
         QApplication.setAttribute(Qt.ApplicationAttribute.AA_EnableHighDpiScaling, True)
     if hasattr(Qt, 'AA_UseHighDpiPixmaps'):
         QApplication.setAttribute(Qt.ApplicationAttribute.AA_UseHighDpiPixmaps, True)
-        
+    # Required to import QtWebEngine after the application exists (lazy preview)
+    QApplication.setAttribute(Qt.ApplicationAttribute.AA_ShareOpenGLContexts, True)
+
+    app_started = time.perf_counter()
     app = QApplication(sys.argv)
+    app_ms = (time.perf_counter() - app_started) * 1000
 
-    window = EditorWindow()
+    window = EditorWindow(preview_backend, startup_report, storage_backend=storage_backend)
+    window.startup_timings["app_ms"] = app_ms
+    show_started = time.perf_counter()
     window.showMaximized()
-    sys.exit(app.exec()) 
\ No newline at end of file
+    window.startup_timings["show_ms"] = (time.perf_counter() - show_started) * 1000
+    if startup_report:
+        print(format_startup_report(window.startup_timings)) # Printed again once the preview exists
+    exit_code = app.exec()
+    if trace_path:
+        print(f"Wrote {tracing.tracer.export(trace_path)} trace events to {trace_path}")
+    sys.exit(exit_code) 
\ No newline at end of file
@@ -0,0 +1,181 @@
+"""Headless, id-indexed record store for predictions and blog posts.
+
+Records stay in file order (that is what gets written back to JSON), but are
+also indexed by ``id`` so lookups, inserts and new-ID allocation don't need to
+scan the whole list. Filtering by field values is facets.FacetIndex's job; it
+listens to the store. Nothing here imports Qt,
+so scripts can use it directly.
+"""
+import re
+
+from lazy_records import RecordStub
+
+
+class DuplicateIdError(ValueError):
+    pass
+
+
+def indexed_values(record, field):
+    """The hashable values ``record`` is filed under for ``field`` (see facets.FacetIndex).
+
+    List fields (categories, tags) yield each element; a missing field yields None.
+    """
+    value = record.get(field)
+    values = value if isinstance(value, list) else [value]
+    for item in values:
+        if isinstance(item, (str, int, float, bool)) or item is None:
+            yield item
+
+
+class ContentStore:
+    def __init__(self, id_prefix, records=None, body_loader=None):
+        self.id_prefix = id_prefix
+        self.body_loader = body_loader # Turns a RecordStub into the full record
+        self._id_pattern = re.compile(rf'^{re.escape(id_prefix)}(\d+)$')
+        self._records = [] # File order
+        self._by_id = {}
+        self._rows = {}
+        self._max_id_num = 0
+        self._listeners = []
+        if records is not None:
+            self.load(records)
+
+    def load(self, records):
+        self._records = []
+        self._by_id.clear()
+        self._rows.clear()
+        self._max_id_num = 0
+        for record in records:
+            self._insert(record)
+        for listener in self._listeners:
+            listener.store_reset(self)
+
+    def add_listener(self, listener):
+        """Register an object with ``record_changed(old, new)``, ``record_removed(record, row)``
+        and ``store_reset(store)``.
+
+        ``record_changed`` gets ``old=None`` for inserts. ``record_removed`` is
+        sent after the rows below ``row`` have moved up. ``store_reset`` follows
+        a bulk ``load``, which sends no per-record notifications.
+        """
+        self._listeners.append(listener)
+
+    @property
+    def records(self):
+        """The live record list in file order. Treat as read-only."""
+        return self._records
+
+    def __len__(self):
+        return len(self._records)
+
+    def __iter__(self):
+        return iter(self._records)
+
+    def __contains__(self, record_id):
+        return record_id in self._by_id
+
+    def get(self, record_id, default=None):
+        return self._by_id.get(record_id, default)
+
+    def at(self, row):
+        return self._records[row]
+
+    def full_at(self, row):
+        """The complete record at ``row``, loading its body if only a stub is held."""
+        record = self._records[row]
+        if isinstance(record, RecordStub):
+            stub = record
+            record = self.body_loader(stub)
+            self._records[row] = record
+            self._by_id[record['id']] = record
+            # Listeners built from the stub's scanned fields; tell them if the body disagrees
+            if any(record.get(field) != value for field, value in stub.items()):
+                for listener in self._listeners:
+                    listener.record_changed(stub, record)
+        return record
+
+    def iter_full(self):
+        """Yield every complete record without keeping loaded bodies around."""
+        for record in self._records:
+            yield self.body_loader(record) if isinstance(record, RecordStub) else record
+
+    def full(self, record_id):
+        return self.full_at(self._rows[record_id])
+
+    def row_of(self, record_id):
+        return self._rows[record_id]
+
+    def insert(self, record):
+        row = self._insert(record)
+        for listener in self._listeners:
+            listener.record_changed(None, record)
+        return row
+
+    def _insert(self, record):
+        record_id = self._require_id(record)
+        if record_id in self._by_id:
+            raise DuplicateIdError(f"Duplicate id '{record_id}'")
+        row = len(self._records)
+        self._records.append(record)
+        self._by_id[record_id] = record
+        self._rows[record_id] = row
+        self._track_id(record_id)
+        return row
+
+    def update(self, record_id, record):
+        """Replace the record stored under ``record_id``, keeping its row."""
+        row = self._rows[record_id]
+        new_id = self._require_id(record)
+        if new_id != record_id and new_id in self._by_id:
+            raise DuplicateIdError(f"Duplicate id '{new_id}'")
+        old = self._records[row]
+        if new_id != record_id:
+            del self._by_id[record_id]
+            del self._rows[record_id]
+            self._rows[new_id] = row
+            self._track_id(new_id)
+        self._records[row] = record
+        self._by_id[new_id] = record
+        for listener in self._listeners:
+            listener.record_changed(old, record)
+        return row
+
+    def remove(self, record_id):
+        row = self._rows.pop(record_id)
+        record = self._records.pop(row)
+        del self._by_id[record_id]
+        for moved in self._records[row:]:
+            self._rows[moved['id']] -= 1
+        for listener in self._listeners:
+            listener.record_removed(record, row)
+        return row
+
+    def relink(self, record):
+        """Point the unchanged record with ``record``'s id at its copy in a rewritten file.
+
+        Only stubs need this, since their bodies are read from the old spans.
+        Sends no notifications: the content is the same.
+        """
+        held = self._by_id.get(record.get('id'))
+        if not isinstance(held, RecordStub):
+            return
+        if isinstance(record, RecordStub):
+            held.span = record.span
+        else:
+            row = self._rows[record['id']]
+            self._records[row] = record
+            self._by_id[record['id']] = record
+
+    def next_id(self):
+        return f"{self.id_prefix}{str(self._max_id_num + 1).zfill(3)}"
+
+    def _require_id(self, record):
+        record_id = record.get('id')
+        if record_id is None:
+            raise ValueError("Record has no 'id'")
+        return record_id
+
+    def _track_id(self, record_id):
+        match = self._id_pattern.match(str(record_id))
+        if match:
+            self._max_id_num = max(self._max_id_num, int(match.group(1)))
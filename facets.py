@@ -0,0 +1,108 @@
+"""Precomputed facet bitsets for combining status/category/segment filters.
+
+For every facet value we keep a Python int whose bit ``n`` is set when store
+row ``n`` has that value. Combining filters is then a handful of big-int
+AND/OR operations, and counts come from ``int.bit_count``, so neither depends
+on walking the record dicts. The index listens to its ContentStore and flips
+single bits when a record is saved.
+"""
+from content_store import indexed_values
+from tracing import span
+
+
+def _bits_from_rows(rows, size):
+    bitmap = bytearray(size // 8 + 1)
+    for row in rows:
+        bitmap[row >> 3] |= 1 << (row & 7)
+    return int.from_bytes(bitmap, 'little')
+
+
+class FacetIndex:
+    def __init__(self, store, fields):
+        self.store = store
+        self.fields = tuple(fields)
+        self._bits = {field: {} for field in self.fields} # field -> value -> row bitset
+        self._all = 0
+        store.add_listener(self)
+        self.store_reset(store)
+
+    def values(self, field):
+        return list(self._bits[field])
+
+    def select(self, filters):
+        """Row bitset matching ``filters`` ({field: values}); values OR, fields AND."""
+        result = self._all
+        for field, values in filters.items():
+            if not values:
+                continue
+            field_bits = self._bits[field]
+            union = 0
+            for value in values:
+                union |= field_bits.get(value, 0)
+            result &= union
+        return result
+
+    def counts(self, filters):
+        """Per field, how many rows each value would match alongside the other fields' filters."""
+        counts = {}
+        for field in self.fields:
+            others = self.select({f: v for f, v in filters.items() if f != field})
+            counts[field] = {value: (bits & others).bit_count() for value, bits in self._bits[field].items()}
+        return counts
+
+    @staticmethod
+    def rows(bitset):
+        """Store rows set in ``bitset``, ascending."""
+        rows = []
+        binary = format(bitset, 'b')[::-1]
+        position = binary.find('1')
+        while position >= 0:
+            rows.append(position)
+            position = binary.find('1', position + 1)
+        return rows
+
+    # ContentStore listener interface
+    def record_changed(self, old, new):
+        row = self.store.row_of(new['id'])
+        bit = 1 << row
+        self._all |= bit
+        for field, field_bits in self._bits.items():
+            if old is not None:
+                for value in indexed_values(old, field):
+                    remaining = field_bits.get(value, 0) & ~bit
+                    if remaining:
+                        field_bits[value] = remaining
+                    else:
+                        field_bits.pop(value, None)
+            for value in indexed_values(new, field):
+                field_bits[value] = field_bits.get(value, 0) | bit
+
+    def record_removed(self, record, row):
+        low = (1 << row) - 1
+        def without_row(bits):
+            return (bits & low) | ((bits >> (row + 1)) << row)
+        for field_bits in self._bits.values():
+            for value in list(field_bits):
+                remaining = without_row(field_bits[value])
+                if remaining:
+                    field_bits[value] = remaining
+                else:
+                    del field_bits[value]
+        self._all = without_row(self._all)
+
+    def store_reset(self, store):
+        with span('facets.build', records=len(store)):
+            self._rebuild(store)
+
+    def _rebuild(self, store):
+        size = len(store)
+        rows_by_value = {field: {} for field in self.fields}
+        for row, record in enumerate(store):
+            for field in self.fields:
+                for value in indexed_values(record, field):
+                    rows_by_value[field].setdefault(value, []).append(row)
+        self._bits = {
+            field: {value: _bits_from_rows(rows, size) for value, rows in values.items()}
+            for field, values in rows_by_value.items()
+        }
+        self._all = (1 << size) - 1
@@ -0,0 +1,62 @@
+"""Noticing when the data files are changed by another program.
+
+A ``git pull`` or a teammate's script usually replaces a data file by
+renaming a new one over it, which makes QFileSystemWatcher drop the path, so
+the containing directory is watched too and the path re-added whenever it
+reappears. Notifications are debounced, since a checkout touches a file
+several times in a row. Any change in a watched file's directory counts too,
+which covers sharded layouts where the path is a manifest next to the
+shards. Our own writes trigger all this as well; telling those apart is up
+to the data file's ``detect_changes``.
+"""
+import os
+
+from PyQt6.QtCore import QFileSystemWatcher, QObject, QTimer, pyqtSignal
+
+CHANGE_SETTLE_MS = 250
+
+
+class DataFileWatcher(QObject):
+    changed = pyqtSignal(str) # Path of a file that may have changed
+
+    def __init__(self, paths, parent=None):
+        super().__init__(parent)
+        self.paths = [os.path.abspath(path) for path in paths]
+        self._pending = set()
+        self._watcher = QFileSystemWatcher(self)
+        self._watcher.fileChanged.connect(self._on_file_changed)
+        self._watcher.directoryChanged.connect(self._on_directory_changed)
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(CHANGE_SETTLE_MS)
+        self._timer.timeout.connect(self._emit_pending)
+        directories = {os.path.dirname(path) for path in self.paths}
+        self._watcher.addPaths([directory for directory in directories if os.path.isdir(directory)])
+        self._watch_existing()
+
+    def _watch_existing(self):
+        watched = set(self._watcher.files())
+        missing = [path for path in self.paths if path not in watched and os.path.exists(path)]
+        if missing:
+            self._watcher.addPaths(missing)
+        return missing
+
+    def _on_file_changed(self, path):
+        self._watch_existing() # Replaced files are no longer watched
+        self._mark(path)
+
+    def _on_directory_changed(self, directory):
+        self._watch_existing()
+        for path in self.paths:
+            if os.path.dirname(path) == os.path.normpath(directory):
+                self._mark(path)
+
+    def _mark(self, path):
+        self._pending.add(path)
+        self._timer.start()
+
+    def _emit_pending(self):
+        pending, self._pending = self._pending, set()
+        for path in pending:
+            if os.path.exists(path):
+                self.changed.emit(path)
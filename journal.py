@@ -0,0 +1,285 @@
+"""Append-only change journal in front of the canonical JSON data files.
+
+Saving a record appends one JSON line to ``<file>.journal`` and fsyncs it, so
+the cost of a save doesn't depend on the size of the data file. Loading replays
+the journal over the canonical file. Compaction rewrites the canonical file
+through a temp file and ``os.replace`` (never half-written), then drops the
+journal. Replaying the same entries twice is harmless, so a crash between
+those two steps loses nothing.
+"""
+import json
+import os
+import stat
+import tempfile
+import threading
+from contextlib import contextmanager, nullcontext
+
+from lazy_records import RecordStub, digest_records, read_record, scan_records, write_record_array
+from tracing import span
+
+JOURNAL_SUFFIX = '.journal'
+DEFAULT_COMPACT_EVERY = 200 # Journal entries before a save also compacts
+_UMASK = os.umask(0)
+os.umask(_UMASK) # Only readable by setting it; done once, before any threads
+
+
+class FileChangedError(OSError):
+    """The canonical file was replaced by someone else since it was last read."""
+
+
+def file_signature(path):
+    """Cheap identity of the file currently at ``path`` (None if it is missing)."""
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+
+@contextmanager
+def atomic_replace(path, binary=False, lock=None, on_replace=None, precondition=None):
+    """Yield a temp file next to ``path`` that replaces it once the block succeeds.
+
+    ``precondition`` runs just before the rename and may raise to abort it;
+    ``on_replace`` runs straight after. All three happen under ``lock`` if given.
+    The new file gets the old one's permissions (mkstemp makes it 0600), or
+    the umask's default for a new file.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    try:
+        mode = stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        mode = 0o666 & ~_UMASK
+    fd, tmp_path = tempfile.mkstemp(prefix=f".{os.path.basename(path)}.", suffix='.tmp', dir=directory)
+    try:
+        os.chmod(tmp_path, mode)
+        with (os.fdopen(fd, 'wb') if binary else os.fdopen(fd, 'w', encoding='utf-8')) as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        with lock if lock is not None else nullcontext():
+            if precondition is not None:
+                precondition()
+            os.replace(tmp_path, path)
+            if on_replace is not None:
+                on_replace()
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def atomic_write_json(path, data):
+    """Write ``data`` as indented JSON to ``path`` via temp file + rename."""
+    with atomic_replace(path) as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+
+
+def replay(records, entries):
+    """Apply journal entries (``{'id': key, 'record': ...}``) to ``records`` in place."""
+    rows = {record.get('id'): row for row, record in enumerate(records)}
+    for entry in entries:
+        record = entry['record']
+        row = rows.get(entry['id'])
+        if row is None:
+            # Already renamed by an earlier replay, or a brand new record
+            row = rows.get(record.get('id'))
+        if row is None:
+            rows[record.get('id')] = len(records)
+            records.append(record)
+            continue
+        old_id = records[row].get('id')
+        if old_id != record.get('id'):
+            rows.pop(old_id, None)
+            rows[record.get('id')] = row
+        records[row] = record
+    return records
+
+
+class FileChanges:
+    """How the canonical file differs from the version this process last read or wrote.
+
+    ``changed`` and ``added`` hold full records, ``removed`` the ids that are
+    gone, and ``records`` every record now in the file (stubs where the layout
+    allows), for re-pointing stubs of the records that didn't change.
+    """
+    def __init__(self, signature, digests, changed, added, removed, records):
+        self.signature = signature
+        self.digests = digests
+        self.changed = changed # id -> record
+        self.added = added # Records in file order
+        self.removed = removed # Ids
+        self.records = records
+
+    def __bool__(self):
+        return bool(self.changed or self.added or self.removed)
+
+
+class JournaledJsonFile:
+    def __init__(self, path, compact_every=DEFAULT_COMPACT_EVERY):
+        self.path = path
+        self.journal_path = path + JOURNAL_SUFFIX
+        self.compact_every = compact_every
+        self.pending = 0 # Journal entries not yet folded into the canonical file
+        self.journaled_ids = set() # Ids with journal entries, i.e. edits the file doesn't have yet
+        # What the canonical file looked like when last read or written, for spotting outside edits
+        self.signature = None
+        self.digests = {} # id -> content digest
+        self._journal = None
+        # Body reads may run while another thread compacts; spans change with the file
+        self._file_lock = threading.Lock()
+
+    def load(self, summary_fields=None):
+        """Return the canonical records with journaled edits replayed on top.
+
+        With ``summary_fields``, untouched records come back as RecordStubs
+        holding only those fields; ``read_body`` parses the rest on demand.
+        """
+        with span('journal.load', file=os.path.basename(self.path), lazy=bool(summary_fields)) as s:
+            signature = file_signature(self.path)
+            records = scan_records(self.path, summary_fields) if summary_fields else None
+            if records is None:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    records = json.load(f)
+            self.signature = signature
+            self.digests = dict(zip((record.get('id') for record in records), digest_records(self.path, records)))
+            entries = list(self.read_journal())
+            self.pending = len(entries)
+            self.journaled_ids = {entry['id'] for entry in entries} | {entry['record'].get('id') for entry in entries}
+            s.set(records=len(records), journal_entries=len(entries))
+            return replay(records, entries)
+
+    def read_body(self, stub):
+        with span('journal.read_body', records=1), self._file_lock:
+            try:
+                record = read_record(self.path, stub.span)
+            except ValueError:
+                record = None
+            if not isinstance(record, dict) or record.get('id') != stub.get('id'):
+                record = self._relocate(stub) # The file was replaced under us
+            return record
+
+    def _relocate(self, stub):
+        for found in scan_records(self.path, ('id',)) or ():
+            if found.get('id') == stub.get('id'):
+                stub.span = found.span
+                return read_record(self.path, found.span)
+        raise KeyError(f"Record {stub.get('id')!r} is no longer in {self.path}")
+
+    def detect_changes(self, summary_fields=None):
+        """Diff the file on disk against the last read/write by id and content digest.
+
+        Returns None if the file is untouched (our own compactions included),
+        else a FileChanges to apply and then hand to ``accept_changes``. Only
+        changed and added records are parsed in full; this can run off the GUI thread.
+        """
+        with self._file_lock:
+            signature = file_signature(self.path)
+            if signature is None or signature == self.signature:
+                return None
+            with span('journal.detect_changes', file=os.path.basename(self.path)) as s:
+                records = scan_records(self.path, summary_fields) if summary_fields else None
+                if records is None:
+                    with open(self.path, 'r', encoding='utf-8') as f:
+                        records = json.load(f)
+                digests = dict(zip((record.get('id') for record in records), digest_records(self.path, records)))
+                changed = {}
+                added = []
+                for record in records:
+                    record_id = record.get('id')
+                    if record_id not in self.digests:
+                        added.append(self._full(record))
+                    elif self.digests[record_id] != digests[record_id]:
+                        changed[record_id] = self._full(record)
+                removed = [record_id for record_id in self.digests if record_id not in digests]
+                s.set(records=len(records), changed=len(changed), added=len(added), removed=len(removed))
+        return FileChanges(signature, digests, changed, added, removed, records)
+
+    def _full(self, record):
+        return read_record(self.path, record.span) if isinstance(record, RecordStub) else record
+
+    def accept_changes(self, changes):
+        """Take ``changes`` as the new baseline once they are in the store."""
+        with self._file_lock:
+            self.signature = changes.signature
+            self.digests = changes.digests
+
+    def read_journal(self):
+        if not os.path.exists(self.journal_path):
+            return
+        with open(self.journal_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    # Torn write from a crash; everything before it is intact
+                    print(f"Warning: Ignoring truncated journal entry in {self.journal_path}")
+                    return
+                yield entry
+
+    def append(self, record, previous_id=None):
+        """Journal one saved record. Returns True when compaction is due.
+
+        ``previous_id`` is the id the record was stored under, if it changed.
+        """
+        return self.append_many([(record, previous_id)])
+
+    def append_many(self, saves):
+        """Journal ``(record, previous_id)`` pairs with a single fsync."""
+        if self._journal is None:
+            self._journal = open(self.journal_path, 'a', encoding='utf-8')
+        with span('journal.append', records=len(saves)):
+            lines = []
+            for record, previous_id in saves:
+                entry = {"id": previous_id if previous_id is not None else record.get('id'), "record": record}
+                lines.append(json.dumps(entry, ensure_ascii=False) + '\n')
+            self._journal.write(''.join(lines))
+            self._journal.flush()
+            os.fsync(self._journal.fileno())
+        self.pending += len(saves)
+        for record, previous_id in saves:
+            self.journaled_ids.add(record.get('id'))
+        return self.pending >= self.compact_every
+
+    def compact(self, records, expected_signature=None):
+        """Fold everything into the canonical file and start a fresh journal.
+
+        ``records`` may be a snapshot; this can run off the GUI thread. Raises
+        FileChangedError instead of overwriting edits made by someone else.
+        ``expected_signature`` is the file ``records`` was based on, if taken
+        earlier than now.
+        """
+        expected = expected_signature if expected_signature is not None else self.signature
+        def unchanged():
+            if expected is not None and file_signature(self.path) != expected:
+                raise FileChangedError(f"{self.path} was changed by another program")
+        unchanged() # Fail before writing anything; checked again right before the rename
+        spans = []
+        digests = []
+        def move_stubs():
+            for record, record_span in zip(records, spans):
+                if isinstance(record, RecordStub):
+                    record.span = record_span
+            self.signature = file_signature(self.path)
+            self.digests = dict(zip((record.get('id') for record in records), digests))
+        with span('journal.compact', file=os.path.basename(self.path), records=len(records)), \
+                atomic_replace(self.path, binary=True, lock=self._file_lock,
+                               on_replace=move_stubs, precondition=unchanged) as f:
+            spans.extend(write_record_array(f, records, self.path, digests)) # Stubs are copied, not parsed
+        self._close_journal()
+        self.journaled_ids = set()
+        if os.path.exists(self.journal_path):
+            os.remove(self.journal_path)
+        self.pending = 0
+
+    def close(self):
+        self._close_journal()
+
+    def _close_journal(self):
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
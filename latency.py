@@ -0,0 +1,47 @@
+"""Small rolling latency recorder used to report editor timings."""
+import time
+from collections import deque
+from contextlib import contextmanager
+
+
+class LatencyRecorder:
+    """Keeps the most recent ``maxlen`` samples (in milliseconds)."""
+
+    def __init__(self, maxlen=500):
+        self.samples = deque(maxlen=maxlen)
+        self.count = 0
+
+    def record(self, elapsed_ms):
+        self.samples.append(elapsed_ms)
+        self.count += 1
+
+    @contextmanager
+    def measure(self):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record((time.perf_counter() - start) * 1000.0)
+
+    @property
+    def last(self):
+        return self.samples[-1] if self.samples else None
+
+    def percentile(self, pct):
+        if not self.samples:
+            return None
+        ordered = sorted(self.samples)
+        index = min(len(ordered) - 1, int(round(pct / 100.0 * (len(ordered) - 1))))
+        return ordered[index]
+
+    def summary(self):
+        if not self.samples:
+            return {"count": 0}
+        return {
+            "count": self.count,
+            "last_ms": self.last,
+            "mean_ms": sum(self.samples) / len(self.samples),
+            "p50_ms": self.percentile(50),
+            "p95_ms": self.percentile(95),
+            "max_ms": max(self.samples),
+        }
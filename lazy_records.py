@@ -0,0 +1,135 @@
+"""Lazy loading of the record arrays in ``src/data``.
+
+The data files are always written as ``json.dump(records, indent=2)``, so each
+record starts with a ``  {`` line and ends with a ``  }`` line, and its own
+keys sit on lines indented by exactly four spaces. That lets us find record
+boundaries and a handful of summary fields with byte searches over a memory
+map, without building Python objects for the heavy fields. The full body of a
+record is parsed from its byte span only when it is opened.
+"""
+import hashlib
+import json
+import mmap
+import os
+import re
+
+# Top-level braces are indented by two spaces, a record's own keys by four.
+_SUMMARY_VALUE = rb'(\[\]|\{\}|\[\n[\s\S]*?\n    \]|\{\n[\s\S]*?\n    \}|.*)'
+
+
+def _summary_pattern(summary_fields):
+    names = b'|'.join(re.escape(json.dumps(field).encode('utf-8')) for field in summary_fields)
+    # Anchoring on '\n' rather than '^' keeps the regex engine on its fast path
+    # Any spacing around the colon: hand-edited lines like '"status":"Retired",' still count
+    return re.compile(rb'\n(?:  ([{}])|    (' + names + rb')[ \t]*:[ \t]*' + _SUMMARY_VALUE + rb')')
+
+
+class RecordStub(dict):
+    """Summary fields of a record whose full body is still on disk at ``span``."""
+    __slots__ = ('span',)
+
+    def __init__(self, fields, span):
+        super().__init__(fields)
+        self.span = span
+
+
+def scan_records(path, summary_fields):
+    """Return a RecordStub per record, or None if the file isn't in indent=2 layout."""
+    if os.path.getsize(path) == 0:
+        return None
+    pattern = _summary_pattern(summary_fields)
+    spans = []
+    summaries = [] # Raw '{"key": value, ...}' bytes, decoded in one go below
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        if data[:1] != b'[':
+            return None
+        start = None
+        fields = []
+        for match in pattern.finditer(data):
+            brace = match.group(1)
+            if brace is None:
+                if start is None:
+                    return None
+                fields.append(match.group(2) + b':' + match.group(3).rstrip(b'\r').rstrip(b','))
+            elif brace == b'{':
+                if start is not None:
+                    return None
+                start = match.start(1)
+            else:
+                if start is None:
+                    return None
+                spans.append((start, match.end(1)))
+                summaries.append(b'{' + b','.join(fields) + b'}')
+                start = None
+                fields = []
+        if start is not None or (not spans and data[:2] != b'[]'):
+            return None
+    try:
+        decoded = json.loads(b'[' + b','.join(summaries) + b']')
+    except ValueError:
+        return None
+    return [RecordStub(fields, span) for fields, span in zip(decoded, spans)]
+
+
+def read_record(path, span):
+    start, end = span
+    with open(path, 'rb') as f:
+        f.seek(start)
+        return json.loads(f.read(end - start))
+
+
+def record_bytes(record):
+    """A full record as it appears inside an indent=2 array, from its opening brace."""
+    return json.dumps(record, indent=2, ensure_ascii=False).replace('\n', '\n  ').encode('utf-8')
+
+
+def digest(raw):
+    return hashlib.blake2b(raw, digest_size=16).digest()
+
+
+def digest_records(path, records):
+    """Content digest per record: of its bytes in ``path`` for stubs, of ``record_bytes`` otherwise.
+
+    Both agree for files in the usual layout, so digests taken either way compare.
+    """
+    if not any(isinstance(record, RecordStub) for record in records):
+        return [digest(record_bytes(record)) for record in records]
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        return [digest(data[record.span[0]:record.span[1]]) if isinstance(record, RecordStub)
+                else digest(record_bytes(record)) for record in records]
+
+
+def write_record_array(f, records, source_path=None, digests=None):
+    """Write ``records`` to binary file ``f`` exactly as ``json.dump(indent=2)`` would.
+
+    Stubs are copied byte for byte from ``source_path`` instead of being
+    loaded. Returns the new span of every record, in order. If ``digests`` is
+    a list, each record's digest is appended to it.
+    """
+    if not records:
+        f.write(b'[]')
+        return []
+    spans = []
+    source = open(source_path, 'rb') if source_path and any(isinstance(r, RecordStub) for r in records) else None
+    try:
+        position = f.write(b'[\n')
+        for index, record in enumerate(records):
+            if index:
+                position += f.write(b',\n')
+            if isinstance(record, RecordStub):
+                start, end = record.span
+                source.seek(start)
+                raw = source.read(end - start)
+            else:
+                raw = record_bytes(record)
+            if digests is not None:
+                digests.append(digest(raw))
+            chunk = b'  ' + raw
+            # Spans cover the record from its opening brace
+            spans.append((position + 2, position + len(chunk)))
+            position += f.write(chunk)
+        f.write(b'\n]')
+    finally:
+        if source is not None:
+            source.close()
+    return spans
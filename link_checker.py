@@ -0,0 +1,326 @@
+"""Checking that the predictions' ``supportingEvidence`` URLs still resolve.
+
+Links are probed with asyncio over a small HTTP/1.1 client: connections are
+kept alive and reused per host, with at most PER_HOST_LIMIT requests in
+flight to any one host and CONNECTION_LIMIT overall. Each link gets a HEAD
+request (GET, with the body discarded, where HEAD isn't allowed), following
+redirects.
+
+Results go to a cache file. A result younger than its TTL is used as it is;
+an older one is revalidated with If-None-Match / If-Modified-Since when the
+server gave an ETag or Last-Modified, so a re-run only probes stale links and
+mostly gets 304s back. Failures expire sooner than successes.
+
+    python link_checker.py                  # check stale links, list the broken ones
+    python link_checker.py --force          # probe every link again
+    python link_checker.py --ttl-days 1 --per-host 2
+"""
+import argparse
+import asyncio
+import json
+import os
+import ssl
+import sys
+import time
+from collections import defaultdict
+from urllib.parse import urljoin, urlsplit
+
+from journal import atomic_replace
+from tracing import span
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+PREDICTIONS_FILE = os.path.join(SCRIPT_DIR, 'src', 'data', 'predictions.json')
+CACHE_FILE = os.path.join(SCRIPT_DIR, '.link-cache.json')
+CACHE_VERSION = 1
+DAY_SECONDS = 24 * 3600
+DEFAULT_TTL_DAYS = 7
+FAILURE_TTL_DAYS = 1
+CONNECTION_LIMIT = 32
+PER_HOST_LIMIT = 4
+TIMEOUT_SECONDS = 15
+MAX_REDIRECTS = 5
+MAX_BODY_BYTES = 64 * 1024 # Larger GET bodies aren't drained; the connection is dropped instead
+USER_AGENT = 'ai-2027-tracker-link-checker/1.0'
+REDIRECT_STATUSES = {301, 302, 303, 307, 308}
+
+# Link health, worst first; a record's badge shows the worst of its links
+HEALTH_ORDER = ('broken', 'error', 'blocked', 'unchecked', 'ok')
+HEALTH_DESCRIPTIONS = {
+    'broken': "gone or failing (4xx/5xx)",
+    'error': "unreachable (DNS, TLS, timeout)",
+    'blocked': "refused the checker (401/403/429); may work in a browser",
+    'unchecked': "not checked yet",
+    'ok': "resolves",
+}
+
+
+def classify(status):
+    if status is None:
+        return 'error'
+    if 200 <= status < 400:
+        return 'ok'
+    if status in (401, 403, 429):
+        return 'blocked'
+    return 'broken'
+
+
+def evidence_urls(record):
+    """The http(s) URLs in a record's ``supportingEvidence``, in order, without repeats."""
+    urls = []
+    evidence = record.get('supportingEvidence')
+    for entry in evidence if isinstance(evidence, list) else ():
+        url = entry.get('url') if isinstance(entry, dict) else None
+        if isinstance(url, str) and urlsplit(url.strip()).scheme in ('http', 'https') and url.strip() not in urls:
+            urls.append(url.strip())
+    return urls
+
+
+class LinkCache:
+    """url -> result dict, kept in a JSON file between runs."""
+
+    def __init__(self, path=CACHE_FILE):
+        self.path = path
+        self.results = {}
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') == CACHE_VERSION:
+                self.results = data['results']
+        except (OSError, ValueError, KeyError, AttributeError):
+            pass # A missing or unreadable cache just means probing everything
+
+    def get(self, url):
+        return self.results.get(url)
+
+    def put(self, result):
+        self.results[result['url']] = result
+
+    def health(self, url):
+        result = self.results.get(url)
+        return result['health'] if result is not None else 'unchecked'
+
+    def save(self):
+        with atomic_replace(self.path) as f:
+            json.dump({'version': CACHE_VERSION, 'results': self.results}, f, ensure_ascii=False, indent=1, sort_keys=True)
+
+
+def record_health(urls, cache):
+    """``(worst health, {health: [urls]})`` for one record's links; worst is None without links."""
+    by_health = defaultdict(list)
+    for url in urls:
+        by_health[cache.health(url)].append(url)
+    worst = next((health for health in HEALTH_ORDER if by_health.get(health)), None)
+    return worst, dict(by_health)
+
+
+class _Response:
+    def __init__(self, status, headers, reusable):
+        self.status = status
+        self.headers = headers # Lower-cased names
+        self.reusable = reusable
+
+
+class ConnectionPool:
+    """Keep-alive HTTP/1.1 connections per (scheme, host, port), with concurrency limits."""
+
+    def __init__(self, limit=CONNECTION_LIMIT, per_host=PER_HOST_LIMIT, timeout=TIMEOUT_SECONDS, ssl_context=None):
+        self.timeout = timeout
+        self.ssl_context = ssl_context or ssl.create_default_context()
+        self._idle = defaultdict(list) # key -> [(reader, writer)]
+        self._total = asyncio.Semaphore(limit)
+        self._per_host = defaultdict(lambda: asyncio.Semaphore(per_host))
+        self.opened = 0 # Connections opened, for reporting reuse
+
+    async def request(self, method, url, headers=()):
+        parts = urlsplit(url)
+        https = parts.scheme == 'https'
+        key = (parts.scheme, parts.hostname, parts.port or (443 if https else 80))
+        target = (parts.path or '/') + (f"?{parts.query}" if parts.query else '')
+        host = parts.hostname if parts.port is None else f"{parts.hostname}:{parts.port}"
+        lines = [f"{method} {target} HTTP/1.1", f"Host: {host}", f"User-Agent: {USER_AGENT}", "Accept: */*"]
+        lines += [f"{name}: {value}" for name, value in headers]
+        request = ('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1', 'replace')
+        async with self._per_host[parts.hostname], self._total:
+            while self._idle[key]:
+                connection = self._idle[key].pop()
+                try:
+                    return await self._exchange(key, connection, request, method)
+                except (ConnectionError, asyncio.IncompleteReadError):
+                    continue # The server closed it while idle; try the next, or a new one
+            connection = await asyncio.wait_for(self._open(key, https), self.timeout)
+            return await self._exchange(key, connection, request, method)
+
+    async def _open(self, key, https):
+        scheme, hostname, port = key
+        self.opened += 1
+        return await asyncio.open_connection(hostname, port, ssl=self.ssl_context if https else None,
+                                             server_hostname=hostname if https else None)
+
+    async def _exchange(self, key, connection, request, method):
+        reader, writer = connection
+        try:
+            writer.write(request)
+            response = await asyncio.wait_for(self._read_response(reader, method), self.timeout)
+        except BaseException:
+            writer.close()
+            raise
+        if response.reusable:
+            self._idle[key].append(connection)
+        else:
+            writer.close()
+        return response
+
+    async def _read_response(self, reader, method):
+        status_line = await reader.readuntil(b'\r\n')
+        version, status = status_line.decode('latin-1').split(None, 2)[:2]
+        headers = {}
+        while True:
+            line = await reader.readuntil(b'\r\n')
+            if line == b'\r\n':
+                break
+            name, _, value = line.decode('latin-1').partition(':')
+            headers[name.strip().lower()] = value.strip()
+        status = int(status)
+        reusable = version == 'HTTP/1.1' and headers.get('connection', '').lower() != 'close'
+        if method == 'HEAD' or status in (204, 304) or 100 <= status < 200:
+            return _Response(status, headers, reusable)
+        if 'chunked' in headers.get('transfer-encoding', '').lower():
+            reusable = reusable and await self._drain_chunked(reader)
+        elif 'content-length' in headers:
+            length = int(headers['content-length'])
+            if length > MAX_BODY_BYTES:
+                reusable = False
+            else:
+                await reader.readexactly(length)
+        else:
+            reusable = False # Body runs to EOF
+        return _Response(status, headers, reusable)
+
+    async def _drain_chunked(self, reader):
+        """Read a chunked body; False (leave it unread) once it passes MAX_BODY_BYTES."""
+        total = 0
+        while True:
+            size = int((await reader.readuntil(b'\r\n')).split(b';')[0], 16)
+            total += size
+            if total > MAX_BODY_BYTES:
+                return False
+            if size == 0:
+                while await reader.readuntil(b'\r\n') != b'\r\n':
+                    pass # Trailers
+                return True
+            await reader.readexactly(size + 2)
+
+    async def close(self):
+        for connections in self._idle.values():
+            for reader, writer in connections:
+                writer.close()
+        self._idle.clear()
+
+
+class LinkChecker:
+    def __init__(self, cache, ttl_days=DEFAULT_TTL_DAYS, failure_ttl_days=FAILURE_TTL_DAYS,
+                 connections=CONNECTION_LIMIT, per_host=PER_HOST_LIMIT, timeout=TIMEOUT_SECONDS, ssl_context=None):
+        self.cache = cache
+        self.ttl = ttl_days * DAY_SECONDS
+        self.failure_ttl = failure_ttl_days * DAY_SECONDS
+        self.pool_options = dict(limit=connections, per_host=per_host, timeout=timeout, ssl_context=ssl_context)
+
+    def is_fresh(self, result, now):
+        ttl = self.ttl if result['health'] in ('ok', 'blocked') else self.failure_ttl
+        return now - result['checked'] < ttl
+
+    def stale(self, urls, force=False, now=None):
+        now = time.time() if now is None else now
+        return [url for url in dict.fromkeys(urls)
+                if force or self.cache.get(url) is None or not self.is_fresh(self.cache.get(url), now)]
+
+    def run(self, urls, force=False):
+        """Probe the stale ``urls`` and save the cache. Returns ``{'checked', 'probed', 'revalidated', 'connections'}``."""
+        stale = self.stale(urls, force)
+        with span('links.check', records=len(stale)) as s:
+            stats = asyncio.run(self.check(stale, force))
+            s.set(**stats)
+        if stale:
+            self.cache.save()
+        return dict(stats, checked=len(set(urls)))
+
+    async def check(self, urls, force=False):
+        pool = ConnectionPool(**self.pool_options)
+        try:
+            results = await asyncio.gather(*(self._check_one(pool, url, None if force else self.cache.get(url))
+                                             for url in urls))
+        finally:
+            await pool.close()
+        for result in results:
+            self.cache.put(result)
+        revalidated = sum(1 for result in results if result.get('revalidated'))
+        return {'probed': len(results), 'revalidated': revalidated, 'connections': pool.opened}
+
+    async def _check_one(self, pool, url, previous):
+        conditional = []
+        if previous is not None and previous['health'] == 'ok':
+            if previous.get('etag'):
+                conditional.append(('If-None-Match', previous['etag']))
+            if previous.get('lastModified'):
+                conditional.append(('If-Modified-Since', previous['lastModified']))
+        result = {'url': url, 'checked': time.time(), 'status': None, 'finalUrl': url, 'error': None}
+        try:
+            response, final_url = await self._follow(pool, url, conditional)
+        except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError, asyncio.LimitOverrunError, ValueError) as e:
+            result.update(health='error', error=f"{type(e).__name__}: {e}".rstrip(': '))
+            return result
+        if response.status == 304 and previous is not None:
+            return dict(previous, checked=result['checked'], revalidated=True)
+        result.update(status=response.status, health=classify(response.status), finalUrl=final_url,
+                      etag=response.headers.get('etag'), lastModified=response.headers.get('last-modified'))
+        return result
+
+    async def _follow(self, pool, url, conditional):
+        for _ in range(MAX_REDIRECTS + 1):
+            response = await pool.request('HEAD', url, conditional)
+            if response.status in (405, 501): # HEAD not supported; GET as little as the server allows
+                response = await pool.request('GET', url, conditional + [('Range', 'bytes=0-0')])
+            if response.status not in REDIRECT_STATUSES or 'location' not in response.headers:
+                return response, url
+            url = urljoin(url, response.headers['location'])
+            if urlsplit(url).scheme not in ('http', 'https'):
+                raise ValueError(f"redirect to {url}")
+        raise ValueError(f"more than {MAX_REDIRECTS} redirects")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Check the predictions' supporting evidence links.")
+    parser.add_argument('file', nargs='?', default=PREDICTIONS_FILE, help="predictions JSON file")
+    parser.add_argument('--cache', default=CACHE_FILE, help="result cache file")
+    parser.add_argument('--force', action='store_true', help="probe every link, even freshly checked ones")
+    parser.add_argument('--ttl-days', type=float, default=DEFAULT_TTL_DAYS, help="how long a good result is trusted")
+    parser.add_argument('--connections', type=int, default=CONNECTION_LIMIT, help="requests in flight overall")
+    parser.add_argument('--per-host', type=int, default=PER_HOST_LIMIT, help="requests in flight per host")
+    parser.add_argument('--timeout', type=float, default=TIMEOUT_SECONDS, help="seconds per connect or response")
+    args = parser.parse_args(argv)
+    try:
+        with open(args.file, 'r', encoding='utf-8') as f:
+            records = json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+    links = {record.get('id'): evidence_urls(record) for record in records}
+    cache = LinkCache(args.cache)
+    checker = LinkChecker(cache, ttl_days=args.ttl_days, connections=args.connections, per_host=args.per_host,
+                          timeout=args.timeout)
+    started = time.perf_counter()
+    stats = checker.run([url for urls in links.values() for url in urls], args.force)
+    print(f"{stats['checked']} links: probed {stats['probed']} ({stats['revalidated']} unchanged since last time) "
+          f"over {stats['connections']} connections in {time.perf_counter() - started:.1f} s")
+    broken = 0
+    for record_id, urls in links.items():
+        for url in urls:
+            result = cache.get(url)
+            if result['health'] in ('broken', 'error'):
+                broken += 1
+                print(f"  {record_id}: {result['status'] or result['error']}  {url}")
+    return 1 if broken else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
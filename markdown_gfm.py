@@ -0,0 +1,84 @@
+"""The GitHub-flavoured Markdown behaviour the site used to get from react-markdown and remark-gfm.
+
+Blog posts are rendered to HTML ahead of time (blog_export.py) and injected
+into the page as they are, so this extension also takes over what
+react-markdown did on the client:
+
+* raw HTML in a post is escaped and shows up as text instead of being passed through;
+* link and image URLs with a scheme other than http, https, mailto or tel
+  become ``javascript:void(0)``, as react-markdown's default ``transformLinkUri`` does;
+* ``~~strikethrough~~`` (and ``~single~`` tildes) render as ``<del>``;
+* bare URLs (``https://…``, ``www.…``) and email addresses become links.
+
+Load it as ``markdown.Markdown(extensions=['markdown_gfm'])``.
+"""
+import xml.etree.ElementTree as etree
+
+from markdown.extensions import Extension
+from markdown.inlinepatterns import InlineProcessor, SimpleTagInlineProcessor
+from markdown.treeprocessors import Treeprocessor
+from markdown.util import AtomicString
+
+SAFE_PROTOCOLS = ('http', 'https', 'mailto', 'tel')
+# Opening and closing tildes must hug the text, so "~5 to ~10 years" stays as it is
+STRIKETHROUGH_RE = r'(?<!~)(~{1,2})(?![~\s])(.+?)(?<![~\s])\1(?!~)'
+LITERAL_AUTOLINK_RE = (r'(?<![\w/.@:+-])(?:(?:https?://|www\.)[\w-]+(?:\.[\w-]+)*[^\s<\x02\x03]*'
+                       r'|[\w.+-]+@[\w-]+(?:\.[\w-]+)+)')
+_TRAILING_PUNCTUATION = '?!.,:*_~\'";'
+
+
+def safe_url(url):
+    """``url`` unless it has a scheme outside SAFE_PROTOCOLS, in which case ``javascript:void(0)``."""
+    colon = url.find(':')
+    if colon == -1 or any(0 <= url.find(c) < colon for c in '/?#'):
+        return url # Relative
+    if url[:colon].lower() in SAFE_PROTOCOLS:
+        return url
+    return 'javascript:void(0)'
+
+
+class LiteralAutolinkInlineProcessor(InlineProcessor):
+    """Links bare URLs and email addresses, leaving off trailing punctuation as GFM does."""
+    ANCESTOR_EXCLUDES = ('a',)
+
+    def handleMatch(self, m, data):
+        text = m.group(0)
+        while text and (text[-1] in _TRAILING_PUNCTUATION or text[-1] == ')' and text.count(')') > text.count('(')):
+            text = text[:-1]
+        if '://' in text:
+            href = text
+        elif text.startswith('www.'):
+            href = 'http://' + text
+        elif '@' in text and '.' in text.split('@', 1)[1]:
+            href = 'mailto:' + text
+        else:
+            return None, None, None
+        el = etree.Element('a')
+        el.set('href', href)
+        el.text = AtomicString(text)
+        return el, m.start(0), m.start(0) + len(text)
+
+
+class SafeUrlTreeprocessor(Treeprocessor):
+    def run(self, root):
+        for el in root.iter('a'):
+            if el.get('href') is not None:
+                el.set('href', safe_url(el.get('href')))
+        for el in root.iter('img'):
+            if el.get('src') is not None:
+                el.set('src', safe_url(el.get('src')))
+
+
+class GfmExtension(Extension):
+    def extendMarkdown(self, md):
+        # Without these, HTML in the source is ordinary text and gets escaped on output
+        md.preprocessors.deregister('html_block')
+        md.inlinePatterns.deregister('html')
+        md.inlinePatterns.register(LiteralAutolinkInlineProcessor(LITERAL_AUTOLINK_RE, md), 'literal_autolink', 75)
+        md.inlinePatterns.register(SimpleTagInlineProcessor(STRIKETHROUGH_RE, 'del'), 'strikethrough', 65)
+        # After 'inline' (20), which creates the links
+        md.treeprocessors.register(SafeUrlTreeprocessor(md), 'safe_url', 5)
+
+
+def makeExtension(**kwargs):
+    return GfmExtension(**kwargs)
@@ -0,0 +1,53 @@
+"""Markdown preview backends for the blog editor.
+
+``webengine`` is the full Chromium view; ``textbrowser`` renders the same HTML
+in a QTextBrowser, which starts instantly and needs a fraction of the memory
+at the cost of simpler CSS support. QtWebEngine is only imported when the web
+backend is actually created.
+"""
+import sys
+
+from PyQt6.QtWidgets import QTextBrowser
+
+from latency import LatencyRecorder
+from markdown_renderer import BlockRenderer
+from tracing import span
+
+PREVIEW_BACKENDS = ('webengine', 'textbrowser')
+CONTENT_PLACEHOLDER = '<div id="content"></div>'
+
+
+class TextBrowserPreview(QTextBrowser):
+    def __init__(self, shell_html, background_color, parent=None):
+        super().__init__(parent)
+        self.setOpenExternalLinks(False)
+        self.setStyleSheet(f"background-color: {background_color};")
+        self.shell_html = shell_html
+        self.renderer = BlockRenderer()
+        self.render_latency = LatencyRecorder()
+        self._shown_html = None
+
+    def set_markdown_content(self, md_text):
+        with self.render_latency.measure():
+            html = self.renderer.render(md_text)
+            if html == self._shown_html:
+                return
+            # setHtml resets the scroll position, so carry it over
+            scroll_bar = self.verticalScrollBar()
+            position = scroll_bar.value()
+            with span('preview.set_html', chars=len(html)):
+                self.setHtml(self.shell_html.replace(CONTENT_PLACEHOLDER, f'<div id="content">{html}</div>'))
+            scroll_bar.setValue(min(position, scroll_bar.maximum()))
+            self._shown_html = html
+
+
+def create_markdown_preview(shell_html, background_color, backend='webengine', parent=None):
+    """Build the preview widget, falling back to the text browser if QtWebEngine is unavailable."""
+    if backend == 'webengine':
+        try:
+            from web_engine_preview import WebEnginePreview
+        except ImportError as e:
+            print(f"Warning: QtWebEngine unavailable ({e}); using the text browser preview.", file=sys.stderr)
+        else:
+            return WebEnginePreview(shell_html, background_color, parent)
+    return TextBrowserPreview(shell_html, background_color, parent)
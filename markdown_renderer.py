@@ -0,0 +1,155 @@
+"""Block-level Markdown rendering for the blog editor preview.
+
+The post is split into top-level blocks (paragraphs, headings, lists, tables,
+fenced code) and each block is converted on its own, so an edit only pays for
+the blocks it actually touched. Rendered blocks are cached by their source text.
+
+Two things in Markdown reach across blocks, and are handled so the result
+matches converting the whole post: reference-style links, whose definitions
+are collected from the whole post and given to every block that has a link,
+and loose lists, whose blank-line-separated items stay in one block.
+"""
+import re
+from collections import OrderedDict
+
+from tracing import span
+
+# The preview and the exported site (blog_export.py) render with the same set;
+# markdown_gfm escapes raw HTML and adds GFM strikethrough and bare-URL links.
+MARKDOWN_EXTENSIONS = ['fenced_code', 'tables', 'sane_lists', 'markdown_gfm']
+
+
+_LIST_ITEM = re.compile(r' {0,3}(?:([*+-])|\d+[.)])[ \t]')
+# markdown.blockprocessors.ReferenceProcessor.RE, which isn't importable before markdown is
+_REFERENCE = re.compile(r'^[ ]{0,3}\[([^\[\]]*)\]:[ ]*(?:\n[ ]*)?([^\s]+)[ ]*(?:\n[ ]*)?((["\'])(.*)\4[ ]*|\((.*)\)[ ]*)?$',
+                        re.MULTILINE)
+
+
+def _list_kind(line):
+    """'ul' or 'ol' if the line starts a list item, else None."""
+    match = _LIST_ITEM.match(line)
+    if match is None:
+        return None
+    return 'ul' if match.group(1) else 'ol'
+
+
+def _fence_marker(line):
+    stripped = line.lstrip()
+    for marker in ('```', '~~~'):
+        if stripped.startswith(marker):
+            return marker
+    return None
+
+
+def split_blocks(md_text):
+    """Split Markdown source into independently renderable blocks.
+
+    Blocks are separated by blank lines, except that fenced code is kept whole,
+    indented chunks (list continuations, indented code) stay attached to the
+    block before them, and a list item after a blank line joins the list
+    before it if that is the same kind of list.
+    """
+    blocks = []
+    current = []
+    open_fence = None
+
+    def flush():
+        if not current:
+            return
+        text = '\n'.join(current)
+        if blocks and (current[0][:1] in (' ', '\t') or
+                       _list_kind(current[0]) is not None and _list_kind(current[0]) == _list_kind(blocks[-1])):
+            blocks[-1] = blocks[-1] + '\n\n' + text
+        else:
+            blocks.append(text)
+        current.clear()
+
+    for line in md_text.split('\n'):
+        if open_fence:
+            current.append(line)
+            if line.lstrip().startswith(open_fence):
+                open_fence = None
+            continue
+        marker = _fence_marker(line)
+        if marker:
+            open_fence = marker
+            current.append(line)
+        elif line.strip():
+            current.append(line)
+        else:
+            flush()
+    flush()
+    return blocks
+
+
+def diff_blocks(old_blocks, new_blocks):
+    """Return ``(start, delete_count, inserted)`` turning old into new.
+
+    Uses the common prefix and suffix, which covers typing inside one block as
+    well as inserting or deleting whole blocks.
+    """
+    limit = min(len(old_blocks), len(new_blocks))
+    start = 0
+    while start < limit and old_blocks[start] == new_blocks[start]:
+        start += 1
+    old_end, new_end = len(old_blocks), len(new_blocks)
+    while old_end > start and new_end > start and old_blocks[old_end - 1] == new_blocks[new_end - 1]:
+        old_end -= 1
+        new_end -= 1
+    return start, old_end - start, new_blocks[start:new_end]
+
+
+class BlockRenderer:
+    """Renders Markdown block by block with a reusable converter and LRU cache."""
+
+    def __init__(self, extensions=None, cache_size=2048):
+        import markdown # Deferred: only needed once a preview exists
+        self._md = markdown.Markdown(extensions=list(extensions or MARKDOWN_EXTENSIONS))
+        self._cache = OrderedDict()
+        self.cache_size = cache_size
+        self.hits = 0
+        self.misses = 0
+
+    def render_block(self, block, references=''):
+        """HTML for one block; ``references`` is the post's link definitions (see ``references_of``)."""
+        key = (block, references if '[' in block else '') # Only blocks with brackets can use them
+        html = self._cache.get(key)
+        if html is not None:
+            self._cache.move_to_end(key)
+            self.hits += 1
+            return html
+        self.misses += 1
+        self._md.reset()
+        if key[1]:
+            self._md.convert(key[1]) # Leaves the definitions in self._md.references
+            definitions = dict(self._md.references)
+            self._md.reset()
+            self._md.references.update(definitions)
+        html = self._md.convert(block)
+        self._cache[key] = html
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return html
+
+    def clear_cache(self):
+        self._cache.clear()
+
+    def render_blocks(self, md_text):
+        """HTML per block; blocks holding only link definitions come out empty."""
+        with span('markdown.render') as s:
+            misses = self.misses
+            blocks = split_blocks(md_text)
+            references = references_of(blocks)
+            rendered = [self.render_block(block, references) for block in blocks]
+            s.set(records=len(rendered), converted=self.misses - misses)
+            return rendered
+
+    def render(self, md_text):
+        """The same HTML as converting ``md_text`` in one go."""
+        return '\n'.join(html for html in self.render_blocks(md_text) if html)
+
+
+def references_of(blocks):
+    """Every reference-style link definition in the post, as Markdown source, in order."""
+    return '\n\n'.join(match.group(0) for block in blocks if _fence_marker(block) is None
+                       for match in _REFERENCE.finditer(block))
@@ -0,0 +1,325 @@
+"""Daniel's METR horizon curve, evaluated and refitted with NumPy.
+
+``src/data/metrProgress.json`` holds the curve coefficients and the METR
+p80 points; ``src/data/metrProgress.js``, which the site imports, is
+generated from it. The curve is piecewise in ``tau = year - pivotYear``:
+
+    log2(divisor * hours) = offset + slopeBefore * tau + curvatureBefore * tau**2           (tau <= 0)
+                          = offset + slopeAfter * tau + boostAfter * (exp(growthAfter * tau) - 1)   (tau > 0)
+
+Everything but ``growthAfter`` enters linearly, so a refit solves a linear
+least-squares problem for each candidate growth rate and searches that one
+rate. Residuals are in doublings (log2 units), the scale the chart uses.
+
+The generated file carries the curve series precomputed, so the browser no
+longer evaluates it date by date on load:
+
+    python metr_curve.py                        # regenerate metrProgress.js
+    python metr_curve.py fit                    # refit against the published points, report residuals
+    python metr_curve.py fit --extrapolated --apply   # also fit the ECI extrapolations, save the result
+"""
+import argparse
+import json
+import math
+import os
+import sys
+
+import numpy as np
+
+from journal import atomic_replace
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+METR_DATA_FILE = os.path.join(SCRIPT_DIR, 'src', 'data', 'metrProgress.json')
+METR_JS_FILE = os.path.join(SCRIPT_DIR, 'src', 'data', 'metrProgress.js')
+# Coefficients a refit changes; pivotYear and divisor stay as they are
+FITTED_PARAMETERS = ('offset', 'slopeBefore', 'curvatureBefore', 'slopeAfter', 'boostAfter', 'growthAfter')
+GROWTH_BOUNDS = (0.05, 5.0)
+GROWTH_GRID = 200 # Candidate growth rates scanned before refining the best one
+SERIES_SIGNIFICANT_DIGITS = 6
+
+
+def load(path=METR_DATA_FILE):
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def save(data, path=METR_DATA_FILE, js_path=METR_JS_FILE):
+    """Write the data file and regenerate the module from it."""
+    with atomic_replace(path) as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+        f.write('\n')
+    return write_js(data, js_path)
+
+
+def to_decimal_year(dates):
+    """``'2025-04-01'`` strings or datetime64 values to fractional years, like the JS ``toDecimalYear``."""
+    days = np.asarray(dates, dtype='datetime64[D]')
+    years = days.astype('datetime64[Y]')
+    year_start = years.astype('datetime64[D]')
+    year_length = ((years + 1).astype('datetime64[D]') - year_start).astype(float)
+    return years.astype(np.int64) + 1970 + (days - year_start).astype(float) / year_length
+
+
+def log2_horizon(years, curve):
+    tau = np.asarray(years, dtype=float) - curve['pivotYear']
+    before = curve['offset'] + curve['slopeBefore'] * tau + curve['curvatureBefore'] * tau ** 2
+    # exp only sees tau > 0, so far-past years can't overflow
+    after = (curve['offset'] + curve['slopeAfter'] * tau
+             + curve['boostAfter'] * np.expm1(curve['growthAfter'] * np.maximum(tau, 0.0)))
+    return np.where(tau <= 0, before, after)
+
+
+def hours_from_decimal_year(years, curve):
+    return np.exp2(log2_horizon(years, curve)) / curve['divisor']
+
+
+def curve_series(start_date, end_date, steps, curve):
+    """``(dates, hours)`` at ``steps + 1`` evenly spaced instants, dated as ``buildDanielCurveSeries`` did."""
+    start_ms, end_ms = (np.datetime64(date, 'ms').astype(np.int64) for date in (start_date, end_date))
+    instants = start_ms + (end_ms - start_ms) * (np.arange(steps + 1) / steps)
+    dates = np.trunc(instants).astype(np.int64).astype('datetime64[ms]').astype('datetime64[D]')
+    return dates, hours_from_decimal_year(to_decimal_year(dates), curve)
+
+
+def usable_points(points):
+    """The points with a valid release date and positive hours; the rest are left out of fits."""
+    usable = []
+    for point in points:
+        try:
+            np.datetime64(point['releaseDate'], 'D')
+            hours = float(point['hours'])
+        except (KeyError, TypeError, ValueError):
+            continue
+        if hours > 0 and math.isfinite(hours):
+            usable.append(point)
+    return usable
+
+
+def points_arrays(points):
+    """Decimal years and hours of the usable points."""
+    points = usable_points(points)
+    return (to_decimal_year([point['releaseDate'] for point in points]).reshape(-1),
+            np.array([float(point['hours']) for point in points]))
+
+
+def residuals(points, curve):
+    """log2(observed / curve) per usable point (see usable_points), in doublings."""
+    years, hours = points_arrays(points)
+    return np.log2(hours) - (log2_horizon(years, curve) - math.log2(curve['divisor']))
+
+
+def _design(tau, growth):
+    before = tau <= 0
+    after = ~before
+    return np.column_stack([np.ones_like(tau), tau * before, tau ** 2 * before,
+                            tau * after, np.expm1(growth * np.maximum(tau, 0.0)) * after])
+
+
+def _solve(tau, target, growth):
+    design = _design(tau, growth)
+    coefficients, _, rank, _ = np.linalg.lstsq(design, target, rcond=None)
+    error = target - design @ coefficients
+    return float(error @ error), coefficients, rank
+
+
+def fit_curve(points, curve, growth_bounds=GROWTH_BOUNDS):
+    """Least-squares coefficients for ``points``, as a new curve dict.
+
+    Coefficients are rounded to the six decimals metrProgress.js is written with.
+
+    Raises ValueError when the points can't pin down every coefficient, which
+    takes at least three on each side of the pivot.
+    """
+    years, hours = points_arrays(points)
+    tau = years - curve['pivotYear']
+    if (tau <= 0).sum() < 3 or (tau > 0).sum() < 3:
+        raise ValueError("A refit needs at least three points on each side of "
+                         f"{curve['pivotYear']:.2f} with a valid date and hours")
+    target = np.log2(hours * curve['divisor'])
+    grid = np.geomspace(*growth_bounds, GROWTH_GRID)
+    errors = np.array([_solve(tau, target, growth)[0] for growth in grid])
+    best = int(np.argmin(errors))
+    # Golden-section search between the best candidate's neighbours
+    low, high = grid[max(best - 1, 0)], grid[min(best + 1, len(grid) - 1)]
+    ratio = (math.sqrt(5) - 1) / 2
+    for _ in range(60):
+        a, b = high - ratio * (high - low), low + ratio * (high - low)
+        if _solve(tau, target, a)[0] < _solve(tau, target, b)[0]:
+            high = b
+        else:
+            low = a
+    growth = (low + high) / 2
+    error, coefficients, rank = _solve(tau, target, growth)
+    if rank < 5:
+        raise ValueError("The points don't determine every coefficient")
+    fitted = dict(curve)
+    fitted.update(zip(FITTED_PARAMETERS, [round(float(c), 6) for c in list(coefficients) + [growth]]))
+    return fitted
+
+
+def rms(values):
+    return float(np.sqrt(np.mean(np.square(values)))) if len(values) else 0.0
+
+
+def fit_points(data, extrapolated=False):
+    return data['published'] + (data['extrapolated'] if extrapolated else [])
+
+
+# Generating metrProgress.js
+def js_value(value):
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    if isinstance(value, str):
+        if "'" in value and '"' not in value:
+            return json.dumps(value, ensure_ascii=False)
+        return "'" + value.replace('\\', '\\\\').replace("'", "\\'").replace('\n', '\\n') + "'"
+    if isinstance(value, float) and value.is_integer() and abs(value) < 1e15:
+        return str(int(value))
+    return repr(value)
+
+
+def js_object(values, indent='  ', inline_width=140):
+    fields = [f"{key}: {js_value(value)}" for key, value in values.items()]
+    inline = '{ ' + ', '.join(fields) + ' }'
+    if len(indent) + len(inline) <= inline_width:
+        return indent + inline
+    inner = indent + '  '
+    return indent + '{\n' + ''.join(f"{inner}{field},\n" for field in fields) + indent + '}'
+
+
+def js_array(items, **kwargs):
+    return '[\n' + ''.join(js_object(item, **kwargs) + ',\n' for item in items) + ']'
+
+
+def snapshot(data):
+    points = {point['id']: point for point in data['published'] + data['extrapolated']}
+    best = max(data['published'], key=lambda point: point['hours'])
+    entries = {
+        'danielCurveToday': None,
+        'bestPublished': {'label': best['label'], 'hours': best['hours']},
+    }
+    for key, reference in data['snapshot'].items():
+        point = points[reference['point']]
+        entries[key] = {'label': reference['label']}
+        entries[key].update((field, point[field]) for field in reference.get('fields', ('hours',)))
+    return entries
+
+
+def render_js(data):
+    curve = data['curve']
+    domain = data['domain']
+    dates, hours = curve_series(domain['startDate'], domain['endDate'], domain['seriesSteps'], curve)
+    series = [{'releaseDate': str(date), 'hours': float(f"{value:.{SERIES_SIGNIFICANT_DIGITS}g}")}
+              for date, value in zip(dates, hours)]
+    snapshot_lines = []
+    for key, entry in snapshot(data).items():
+        if entry is None:
+            snapshot_lines.append(f"  {key}: {{\n    label: \"Daniel's curve\",\n"
+                                  "    hours: danielCurveHoursForDate(TODAY_REFERENCE_DATE),\n  },")
+        else:
+            fields = ''.join(f"    {field}: {js_value(value)},\n" for field, value in entry.items())
+            snapshot_lines.append(f"  {key}: {{\n{fields}  }},")
+    c = {name: f"{curve[name]:.6f}" for name in FITTED_PARAMETERS}
+    return f"""// Generated by metr_curve.py from metrProgress.json; edit that file (or the editor's METR Points tab) instead.
+const HOURS_FROM_MIN_SECONDS = {js_value(domain['minSeconds'])} / 3600;
+const DANIEL_CURVE_PIVOT_YEAR = {js_value(curve['pivotYear'])};
+
+const toDecimalYear = (dateString) => {{
+  const year = Number(dateString.slice(0, 4));
+  const dateMs = Date.parse(`${{dateString}}T00:00:00Z`);
+  const yearStartMs = Date.UTC(year, 0, 1);
+  const nextYearStartMs = Date.UTC(year + 1, 0, 1);
+
+  return year + ((dateMs - yearStartMs) / (nextYearStartMs - yearStartMs));
+}};
+
+export const danielCurveHoursFromDecimalYear = (decimalYear) => {{
+  const tau = decimalYear - DANIEL_CURVE_PIVOT_YEAR;
+
+  const g = tau <= 0
+    ? {c['offset']} + ({c['slopeBefore']} * tau) + ({c['curvatureBefore']} * (tau ** 2))
+    : {c['offset']} + ({c['slopeAfter']} * tau) + ({c['boostAfter']} * (Math.exp({c['growthAfter']} * tau) - 1));
+
+  return (2 ** g) / {js_value(curve['divisor'])};
+}};
+
+export const danielCurveHoursForDate = (dateString) =>
+  danielCurveHoursFromDecimalYear(toDecimalYear(dateString));
+
+export const TODAY_REFERENCE_DATE = {js_value(data['referenceDate'])};
+
+export const METR_PROGRESS_DOMAIN = {{
+  startDate: {js_value(domain['startDate'])},
+  endDate: {js_value(domain['endDate'])},
+  minHours: HOURS_FROM_MIN_SECONDS,
+  maxHours: {js_value(domain['maxHours'])},
+}};
+
+// Published METR points use p80 horizons from METR Horizon v1.1, converted from minutes to hours.
+export const PUBLISHED_METR_P80_POINTS = {js_array(data['published'])};
+
+export const ECI_EXTRAPOLATED_P80_POINTS = {js_array(data['extrapolated'])};
+
+// The curve at {domain['seriesSteps']} even steps from startDate to endDate ({SERIES_SIGNIFICANT_DIGITS} significant digits)
+export const DANIEL_CURVE_P80_SERIES = {js_array(series)};
+
+export const METR_PROGRESS_SNAPSHOT = {{
+{chr(10).join(snapshot_lines)}
+}};
+"""
+
+
+def write_js(data, path=METR_JS_FILE):
+    """Regenerate the module. Returns False when it was already up to date."""
+    text = render_js(data)
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            if f.read() == text:
+                return False
+    except FileNotFoundError:
+        pass
+    with atomic_replace(path) as f:
+        f.write(text)
+    return True
+
+
+def format_curve(curve):
+    return ', '.join(f"{name}={curve[name]:.6f}" for name in FITTED_PARAMETERS)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Regenerate metrProgress.js, or refit Daniel's curve to the METR points.")
+    parser.add_argument('command', nargs='?', choices=('write', 'fit'), default='write')
+    parser.add_argument('--data', default=METR_DATA_FILE, help="curve and points JSON file")
+    parser.add_argument('--js', default=METR_JS_FILE, help="module to generate")
+    parser.add_argument('--extrapolated', action='store_true', help="fit the ECI extrapolations as well")
+    parser.add_argument('--apply', action='store_true', help="save the fitted coefficients and regenerate the module")
+    args = parser.parse_args(argv)
+    try:
+        data = load(args.data)
+        if args.command == 'write':
+            changed = write_js(data, args.js)
+            print(f"{'Wrote' if changed else 'Up to date:'} {args.js}")
+            return 0
+        points = fit_points(data, args.extrapolated)
+        fitted = fit_curve(points, data['curve'])
+    except (OSError, ValueError, KeyError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    current_residuals = residuals(points, data['curve'])
+    fitted_residuals = residuals(points, fitted)
+    print(f"Current: {format_curve(data['curve'])}")
+    print(f"Fitted:  {format_curve(fitted)}")
+    print(f"{'Point':<32} {'current':>8} {'fitted':>8}  (residual, doublings)")
+    for point, current, refit in zip(usable_points(points), current_residuals, fitted_residuals):
+        print(f"{point['label']:<32} {current:>+8.3f} {refit:>+8.3f}")
+    print(f"{'RMS':<32} {rms(current_residuals):>8.3f} {rms(fitted_residuals):>8.3f}")
+    if args.apply:
+        data['curve'] = fitted
+        save(data, args.data, args.js)
+        print(f"Saved the fitted curve to {args.data} and {args.js}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
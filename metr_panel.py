@@ -0,0 +1,278 @@
+"""METR Points tab: edit the horizon points, see Daniel's curve and a refit against them (see metr_curve.py)."""
+import math
+
+import numpy as np
+from PyQt6.QtCore import QPointF, QRectF, Qt
+from PyQt6.QtGui import QBrush, QColor, QPainter, QPainterPath, QPen
+from PyQt6.QtWidgets import (
+    QCheckBox, QHBoxLayout, QHeaderView, QLabel, QMessageBox, QPushButton, QSplitter, QTableWidget,
+    QTableWidgetItem, QVBoxLayout, QWidget
+)
+
+import metr_curve
+
+# (title, point field); residual columns are filled in, not edited
+POINT_COLUMNS = (("Set", None), ("Id", 'id'), ("Label", 'label'), ("Release date", 'releaseDate'), ("Hours", 'hours'),
+                 ("vs curve", None), ("vs refit", None))
+SET_TITLES = {'published': "Published", 'extrapolated': "ECI extrap."}
+CURVE_COLOR = QColor("#059669")
+REFIT_COLOR = QColor("#7d746f")
+POINT_COLOR = QColor("#4A4441")
+INVALID_COLOR = QColor("#FEE2E2")
+
+
+def format_hours(hours):
+    if hours < 1 / 60:
+        return f"{hours * 3600:.0f} s"
+    if hours < 1:
+        return f"{hours * 60:.0f} min"
+    return f"{hours:g} h"
+
+
+class HorizonPlot(QWidget):
+    """Log-scale horizon against release date, drawn like the site's chart."""
+    MARGIN = (56, 12, 12, 28) # left, top, right, bottom
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setMinimumSize(360, 260)
+        self.domain = None
+        self.curves = [] # (years, hours, color, dashed)
+        self.points = [] # (year, hours, filled)
+
+    def set_data(self, domain, curves, points):
+        self.domain = domain
+        self.curves = curves
+        self.points = points
+        self.update()
+
+    def paintEvent(self, event):
+        if self.domain is None:
+            return
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        left, top, right, bottom = self.MARGIN
+        area = QRectF(left, top, self.width() - left - right, self.height() - top - bottom)
+        x_min, x_max = metr_curve.to_decimal_year([self.domain['startDate'], self.domain['endDate']])
+        y_min = math.log10(self.domain['minSeconds'] / 3600)
+        y_max = math.log10(self.domain['maxHours'])
+
+        def map_x(years):
+            return area.left() + (np.asarray(years) - x_min) / (x_max - x_min) * area.width()
+
+        def map_y(hours):
+            return area.bottom() - (np.log10(np.asarray(hours)) - y_min) / (y_max - y_min) * area.height()
+
+        painter.setPen(QPen(QColor("#D1D5DB")))
+        for year in range(math.ceil(x_min), math.floor(x_max) + 1):
+            x = float(map_x(year))
+            painter.drawLine(QPointF(x, area.top()), QPointF(x, area.bottom()))
+            painter.drawText(QRectF(x - 30, area.bottom() + 4, 60, 20), Qt.AlignmentFlag.AlignHCenter, str(year))
+        for power in range(math.ceil(y_min), math.floor(y_max) + 1):
+            y = float(map_y(10.0 ** power))
+            painter.drawLine(QPointF(area.left(), y), QPointF(area.right(), y))
+            painter.drawText(QRectF(0, y - 10, left - 6, 20), Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter,
+                             format_hours(10.0 ** power))
+        painter.drawRect(area)
+
+        painter.setClipRect(area)
+        for years, hours, color, dashed in self.curves:
+            path = QPainterPath()
+            for index, (x, y) in enumerate(zip(map_x(years), map_y(hours))):
+                path.lineTo(x, y) if index else path.moveTo(x, y)
+            pen = QPen(color, 2)
+            if dashed:
+                pen.setStyle(Qt.PenStyle.DashLine)
+            painter.setPen(pen)
+            painter.setBrush(Qt.BrushStyle.NoBrush)
+            painter.drawPath(path)
+        for year, hours, filled in self.points:
+            painter.setPen(QPen(POINT_COLOR, 1.5))
+            painter.setBrush(QBrush(POINT_COLOR) if filled else Qt.BrushStyle.NoBrush)
+            painter.drawEllipse(QPointF(float(map_x(year)), float(map_y(hours))), 4, 4)
+        painter.end()
+
+
+class MetrPointsPanel(QWidget):
+    def __init__(self, path=metr_curve.METR_DATA_FILE, js_path=metr_curve.METR_JS_FILE, parent=None):
+        super().__init__(parent)
+        self.path = path
+        self.js_path = js_path
+        self.data = metr_curve.load(path)
+        self.rows = [] # (set name, point dict) per table row
+        self.fitted = None
+        self.dirty = False
+        self._filling = False
+
+        layout = QVBoxLayout(self)
+        header = QLabel("METR Points")
+        header.setObjectName("HeaderLabel")
+        layout.addWidget(header)
+
+        splitter = QSplitter(Qt.Orientation.Horizontal)
+        table_panel = QWidget()
+        table_layout = QVBoxLayout(table_panel)
+        table_layout.setContentsMargins(0, 0, 0, 0)
+        self.table = QTableWidget(0, len(POINT_COLUMNS))
+        self.table.setHorizontalHeaderLabels([title for title, field in POINT_COLUMNS])
+        self.table.horizontalHeader().setSectionResizeMode(2, QHeaderView.ResizeMode.Stretch)
+        self.table.verticalHeader().setVisible(False)
+        self.table.itemChanged.connect(self._on_item_changed)
+        table_layout.addWidget(self.table)
+
+        buttons = QHBoxLayout()
+        add_button = QPushButton("Add Release")
+        add_button.clicked.connect(self.add_release)
+        remove_button = QPushButton("Remove")
+        remove_button.clicked.connect(self.remove_selected)
+        self.extrapolated_check = QCheckBox("Fit ECI extrapolations too")
+        self.extrapolated_check.toggled.connect(self.refresh)
+        self.apply_button = QPushButton("Use Refit")
+        self.apply_button.clicked.connect(self.apply_fit)
+        self.save_button = QPushButton("Save")
+        self.save_button.clicked.connect(self.save)
+        for widget in (add_button, remove_button, self.extrapolated_check):
+            buttons.addWidget(widget)
+        buttons.addStretch()
+        buttons.addWidget(self.apply_button)
+        buttons.addWidget(self.save_button)
+        table_layout.addLayout(buttons)
+        splitter.addWidget(table_panel)
+
+        self.plot = HorizonPlot()
+        splitter.addWidget(self.plot)
+        splitter.setSizes([620, 480])
+        layout.addWidget(splitter)
+
+        self.fit_label = QLabel()
+        self.fit_label.setWordWrap(True)
+        layout.addWidget(self.fit_label)
+
+        self._fill_table()
+        self.refresh()
+
+    def _fill_table(self):
+        self._filling = True
+        self.rows = [(set_name, point) for set_name in ('published', 'extrapolated') for point in self.data[set_name]]
+        self.table.setRowCount(len(self.rows))
+        for row, (set_name, point) in enumerate(self.rows):
+            for column, (title, field) in enumerate(POINT_COLUMNS):
+                text = SET_TITLES[set_name] if column == 0 else '' if field is None else str(point.get(field, ''))
+                item = QTableWidgetItem(text)
+                if field is None:
+                    item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)
+                self.table.setItem(row, column, item)
+        self._filling = False
+
+    def _on_item_changed(self, item):
+        if self._filling:
+            return
+        set_name, point = self.rows[item.row()]
+        field = POINT_COLUMNS[item.column()][1]
+        text = item.text().strip()
+        if field == 'hours':
+            try:
+                point[field] = float(text)
+            except ValueError:
+                point[field] = text # Left out of the fit and refused on save until fixed
+        else:
+            point[field] = text
+        self.dirty = True
+        self.refresh()
+
+    def add_release(self):
+        self.data['published'].append({'id': '', 'label': '', 'releaseDate': '', 'hours': ''})
+        self.dirty = True
+        self._fill_table()
+        self.refresh()
+        row = len(self.data['published']) - 1
+        self.table.setCurrentCell(row, 1)
+        self.table.editItem(self.table.item(row, 1))
+
+    def remove_selected(self):
+        rows = sorted({index.row() for index in self.table.selectedIndexes()}, reverse=True)
+        for row in rows:
+            set_name, point = self.rows[row]
+            self.data[set_name].remove(point)
+        if rows:
+            self.dirty = True
+            self._fill_table()
+            self.refresh()
+
+    def apply_fit(self):
+        if self.fitted is not None:
+            self.data['curve'] = self.fitted
+            self.dirty = True
+            self.refresh()
+
+    def fit_points(self):
+        return metr_curve.fit_points(self.data, self.extrapolated_check.isChecked())
+
+    def refresh(self):
+        """Refit, then update the residual columns, the plot and the fit summary."""
+        curve = self.data['curve']
+        points = self.fit_points()
+        try:
+            self.fitted = metr_curve.fit_curve(points, curve)
+            fit_error = None
+        except ValueError as e:
+            self.fitted, fit_error = None, str(e)
+        self.apply_button.setEnabled(self.fitted is not None and self.fitted != curve)
+
+        usable = metr_curve.usable_points([point for set_name, point in self.rows])
+        residuals = {id(point): [value] for point, value in zip(usable, metr_curve.residuals(usable, curve))}
+        if self.fitted is not None:
+            for point, value in zip(usable, metr_curve.residuals(usable, self.fitted)):
+                residuals[id(point)].append(value)
+        self._filling = True
+        for row, (set_name, point) in enumerate(self.rows):
+            values = residuals.get(id(point), [])
+            for offset in range(2):
+                item = self.table.item(row, len(POINT_COLUMNS) - 2 + offset)
+                item.setText(f"{values[offset]:+.2f}" if offset < len(values) else '')
+            invalid = id(point) not in residuals
+            for column in range(1, 5):
+                self.table.item(row, column).setBackground(QBrush(INVALID_COLOR) if invalid else QBrush())
+        self._filling = False
+
+        domain = self.data['domain']
+        curves = []
+        for fitted, color, dashed in ((curve, CURVE_COLOR, False), (self.fitted, REFIT_COLOR, True)):
+            if fitted is not None:
+                dates, hours = metr_curve.curve_series(domain['startDate'], domain['endDate'], domain['seriesSteps'], fitted)
+                curves.append((metr_curve.to_decimal_year(dates), hours, color, dashed))
+        plotted = [(float(metr_curve.to_decimal_year(point['releaseDate'])), float(point['hours']), set_name == 'published')
+                   for set_name, point in self.rows if id(point) in residuals]
+        self.plot.set_data(domain, curves, plotted)
+
+        fitted_ids = {id(point) for point in metr_curve.usable_points(points)}
+        current_rms = metr_curve.rms([values[0] for key, values in residuals.items() if key in fitted_ids])
+        summary = f"Curve RMS residual {current_rms:.3f} doublings over {len(fitted_ids)} points."
+        if self.fitted is not None:
+            refit_rms = metr_curve.rms([values[1] for key, values in residuals.items() if key in fitted_ids])
+            summary += f" Refit (dashed) RMS {refit_rms:.3f}: {metr_curve.format_curve(self.fitted)}."
+        else:
+            summary += f" No refit: {fit_error}."
+        if self.dirty:
+            summary += " Unsaved changes."
+        self.fit_label.setText(summary)
+
+    def invalid_rows(self):
+        usable = {id(point) for point in metr_curve.usable_points([point for set_name, point in self.rows])}
+        return [row for row, (set_name, point) in enumerate(self.rows) if id(point) not in usable or not point.get('id')]
+
+    def save(self):
+        """Write the points and curve, and regenerate metrProgress.js. Returns True on success."""
+        invalid = self.invalid_rows()
+        if invalid:
+            QMessageBox.warning(self, "Invalid METR Points",
+                                f"Row {invalid[0] + 1} needs an id, a YYYY-MM-DD release date and positive hours.")
+            return False
+        try:
+            metr_curve.save(self.data, self.path, self.js_path)
+        except (OSError, KeyError, ValueError) as e:
+            QMessageBox.critical(self, "Error Saving METR Points", f"Could not write {self.path}:\n{e}")
+            return False
+        self.dirty = False
+        self.refresh()
+        return True
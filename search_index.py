@@ -0,0 +1,136 @@
+"""Incremental inverted index for searching predictions and blog posts.
+
+Every query term is matched as a prefix, and all terms must match. The index
+listens to a ContentStore, so a save only re-indexes the record that changed.
+It is built on the first search rather than at startup, since building it
+needs the full record bodies.
+"""
+import re
+from bisect import bisect_left, insort
+
+from tracing import span
+
+_TOKEN = re.compile(r'\w+')
+
+
+def tokenize(text):
+    return _TOKEN.findall(text.lower())
+
+
+def prediction_search_text(record):
+    yield record.get('text')
+    yield record.get('originalScenario')
+    yield record.get('actualOutcome')
+    commentary = record.get('analystCommentary')
+    if isinstance(commentary, list):
+        for entry in commentary:
+            yield entry.get('comment') if isinstance(entry, dict) else entry
+    else:
+        yield commentary
+    evidence = record.get('supportingEvidence')
+    if isinstance(evidence, list):
+        for entry in evidence:
+            yield entry.get('text') if isinstance(entry, dict) else entry
+
+
+def blog_post_search_text(record):
+    yield record.get('title')
+    yield record.get('summary')
+    yield record.get('content')
+    tags = record.get('tags')
+    if isinstance(tags, list):
+        yield from tags
+
+
+class SearchIndex:
+    def __init__(self, store, text_of):
+        self.store = store
+        self.text_of = text_of
+        self.built = False
+        self._postings = {} # token -> set of ids
+        self._doc_tokens = {} # id -> set of tokens
+        self._vocabulary = [] # Sorted tokens, for prefix lookups
+        store.add_listener(self)
+
+    def build(self):
+        with span('search.build', records=len(self.store)):
+            self._postings.clear()
+            self._doc_tokens.clear()
+            for record in self.store.iter_full():
+                self._add(record)
+            self._vocabulary = sorted(self._postings)
+            self.built = True
+
+    def search(self, query):
+        """Ids of records matching every term of ``query`` (each as a prefix)."""
+        if not self.built:
+            self.build()
+        with span('search.query'):
+            return self._search(query)
+
+    def _search(self, query):
+        result = None
+        for term in sorted(set(tokenize(query)), key=len, reverse=True): # Longest, most selective first
+            matches = self._prefix_matches(term)
+            result = matches if result is None else result & matches
+            if not result:
+                return set()
+        return result if result is not None else set(self._doc_tokens)
+
+    def _prefix_matches(self, prefix):
+        exact = self._postings.get(prefix)
+        matches = set(exact) if exact else set()
+        position = bisect_left(self._vocabulary, prefix)
+        if exact:
+            position += 1
+        vocabulary = self._vocabulary
+        while position < len(vocabulary) and vocabulary[position].startswith(prefix):
+            matches |= self._postings[vocabulary[position]]
+            position += 1
+        return matches
+
+    def _tokens_of(self, record):
+        tokens = set()
+        for text in self.text_of(record):
+            if isinstance(text, str):
+                tokens.update(tokenize(text))
+        return tokens
+
+    def _add(self, record, keep_vocabulary=False):
+        record_id = record['id']
+        tokens = self._tokens_of(record)
+        self._doc_tokens[record_id] = tokens
+        for token in tokens:
+            ids = self._postings.get(token)
+            if ids is None:
+                ids = self._postings[token] = set()
+                if keep_vocabulary:
+                    insort(self._vocabulary, token)
+            ids.add(record_id)
+
+    def _remove(self, record_id):
+        for token in self._doc_tokens.pop(record_id, ()):
+            ids = self._postings[token]
+            ids.discard(record_id)
+            if not ids:
+                del self._postings[token]
+                del self._vocabulary[bisect_left(self._vocabulary, token)]
+
+    # ContentStore listener interface
+    def record_changed(self, old, new):
+        if not self.built:
+            return
+        if old is not None:
+            self._remove(old['id'])
+        if new is not None:
+            self._add(new, keep_vocabulary=True)
+
+    def record_removed(self, record, row):
+        if self.built:
+            self._remove(record['id'])
+
+    def store_reset(self, store):
+        self.built = False
+        self._postings.clear()
+        self._doc_tokens.clear()
+        self._vocabulary = []
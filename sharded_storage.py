@@ -0,0 +1,361 @@
+"""One file per record, plus a manifest, instead of one big JSON array.
+
+``src/data/predictions.json`` becomes ``src/data/predictions/`` holding
+``P001.json``, ``P002.json``, ... and ``manifest.json``, which lists the ids
+in order with a digest of each shard, one record per line. Editing a
+prediction rewrites its shard and one manifest line, so git diffs stay small
+and two people editing different records merge cleanly.
+
+``ShardedDataFile`` has the JournaledJsonFile interface, so the editor uses
+it unchanged (``--sharded``). Shards are read on a thread pool and parsed
+in one pass afterwards (see benchmarks/sharded_load.py for why not in parallel).
+Compaction, and the build step below, assemble the monolithic file that the
+web app imports, byte for byte as ``json.dump(indent=2)`` would.
+
+The manifest also records the digest of the JSON file as last assembled (or
+split). If the JSON file has been edited directly since, by hand or by a
+tool that writes it, assembling would throw those edits away, so ``build``
+refuses until they are split into the shards; the editor merges them in like
+any other outside change.
+
+    python sharded_storage.py split     # create the shard directories from the JSON files
+    python sharded_storage.py build     # reassemble the JSON files (what `npm run build` runs first)
+"""
+import argparse
+import io
+import json
+import os
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from journal import DEFAULT_COMPACT_EVERY, FileChangedError, FileChanges, atomic_replace
+from lazy_records import RecordStub, digest, write_record_array
+from tracing import span
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+DATA_DIR = os.path.join(SCRIPT_DIR, 'src', 'data')
+DATA_FILES = (os.path.join(DATA_DIR, 'predictions.json'), os.path.join(DATA_DIR, 'blogPosts.json'))
+MANIFEST_NAME = 'manifest.json'
+MANIFEST_VERSION = 1
+
+
+def shard_directory(path):
+    """``src/data/predictions.json`` -> ``src/data/predictions``."""
+    return os.path.splitext(path)[0]
+
+
+def shard_name(record_id):
+    safe_id = ''.join(c if c.isalnum() or c in '-_' else '_' for c in str(record_id))
+    return f"{safe_id}.json"
+
+
+def shard_bytes(record):
+    return (json.dumps(record, indent=2, ensure_ascii=False) + '\n').encode('utf-8')
+
+
+def manifest_bytes(entries, assembled=None):
+    """The manifest, one ``{"id", "digest"}`` entry per line so edits diff as single lines.
+
+    ``assembled`` is the digest of the JSON file as last assembled or split.
+    """
+    lines = [json.dumps({"id": record_id, "digest": record_digest}, ensure_ascii=False) for record_id, record_digest in entries]
+    header = f'"version": {MANIFEST_VERSION}, '
+    if assembled is not None:
+        header += f'"assembled": {json.dumps(assembled)}, '
+    return ('{' + header + '"records": [\n' + ',\n'.join(lines) + '\n]}\n').encode('utf-8')
+
+
+def file_digest(path):
+    """Hex digest of the file's bytes, or None if it doesn't exist."""
+    try:
+        with open(path, 'rb') as f:
+            return digest(f.read()).hex()
+    except FileNotFoundError:
+        return None
+
+
+def assembled_bytes(records):
+    assembled = io.BytesIO()
+    write_record_array(assembled, records)
+    return assembled.getvalue()
+
+
+def _write_if_changed(path, data):
+    try:
+        with open(path, 'rb') as f:
+            if f.read() == data:
+                return False
+    except FileNotFoundError:
+        pass
+    with atomic_replace(path, binary=True) as f:
+        f.write(data)
+    return True
+
+
+class ShardedDataFile:
+    def __init__(self, path, compact_every=DEFAULT_COMPACT_EVERY, workers=None):
+        self.json_path = path # The assembled file the web app imports
+        self.directory = shard_directory(path)
+        self.path = os.path.join(self.directory, MANIFEST_NAME)
+        self.compact_every = compact_every
+        self.workers = workers
+        self.pending = 0 # Saves not yet in the assembled file
+        self.journaled_ids = set()
+        # Bumped whenever outside changes are accepted; compaction refuses snapshots from before
+        self.signature = 0
+        self.digests = {} # id -> shard digest (hex)
+        self.assembled = None # Digest of the JSON file as we last wrote or split it; None if unknown
+        self._accepted_json = None # Digest of a directly edited JSON file whose changes were merged in
+        self._order = [] # Ids in manifest order
+        self._stats = {} # File name -> stat when last read or written, for spotting outside edits
+        self._lock = threading.Lock()
+
+    # JournaledJsonFile interface
+    def load(self, summary_fields=None):
+        """Return every record, in manifest order, splitting the JSON file first if needed.
+
+        Records are small enough that ``summary_fields`` is ignored and the
+        full records are returned.
+        """
+        with span('sharded.load', file=os.path.basename(self.directory)) as s, self._lock:
+            if not os.path.exists(self.path):
+                split(self.json_path)
+            stats = self._scan()
+            order = self._read_manifest()
+            with ThreadPoolExecutor(max_workers=self.workers) as pool:
+                raws = list(pool.map(self._read_shard, order))
+            # json.loads holds the GIL, and a process pool would have to pickle the
+            # records back, which costs more than parsing them here
+            records = [json.loads(raw) for raw in raws]
+            self.digests = {record_id: digest(raw).hex() for record_id, raw in zip(order, raws)}
+            if self.assembled is None and file_digest(self.json_path) == digest(assembled_bytes(records)).hex():
+                self.assembled = file_digest(self.json_path) # A manifest from before digests were kept
+            self._order = order
+            self._stats = stats
+            self.pending = 0
+            self.journaled_ids = set()
+            s.set(records=len(records))
+            return records
+
+    def read_body(self, stub):
+        with span('sharded.read_body', records=1):
+            return json.loads(self._read_shard(stub['id']))
+
+    def append(self, record, previous_id=None):
+        return self.append_many([(record, previous_id)])
+
+    def append_many(self, saves):
+        """Write the saved records' shards and the manifest. Returns True when compaction is due."""
+        with span('sharded.save', records=len(saves)), self._lock:
+            for record, previous_id in saves:
+                record_id = record.get('id')
+                if previous_id is not None and previous_id != record_id and previous_id in self.digests:
+                    self._remove_shard(previous_id)
+                    self._order[self._order.index(previous_id)] = record_id
+                elif record_id not in self.digests:
+                    self._order.append(record_id)
+                self._write_shard(record_id, shard_bytes(record))
+                self.journaled_ids.add(record_id)
+            self._write_manifest()
+        self.pending += len(saves)
+        return self.pending >= self.compact_every
+
+    def compact(self, records, expected_signature=None):
+        """Bring the shards and manifest in line with ``records``, then assemble the JSON file.
+
+        Only shards whose content differs are written. Raises FileChangedError
+        if shards changed on disk since they were last read, or if the JSON
+        file was edited directly and those edits haven't been merged in.
+        """
+        with span('sharded.compact', file=os.path.basename(self.directory), records=len(records)), self._lock:
+            if (expected_signature is not None and expected_signature != self.signature) or self._scan() != self._stats:
+                raise FileChangedError(f"{self.directory} was changed by another program")
+            if self._json_edited():
+                raise FileChangedError(f"{self.json_path} was edited directly since it was last assembled; "
+                                       f"run `python sharded_storage.py split` to keep those edits")
+            full = [self._read_record(record) for record in records]
+            ids = [record.get('id') for record in full]
+            for record_id in set(self.digests) - set(ids):
+                self._remove_shard(record_id)
+            for record_id, record in zip(ids, full):
+                raw = shard_bytes(record)
+                if self.digests.get(record_id) != digest(raw).hex():
+                    self._write_shard(record_id, raw)
+            self._order = ids
+            data = assembled_bytes(full)
+            _write_if_changed(self.json_path, data)
+            self.assembled = digest(data).hex()
+            self._accepted_json = None
+            self._write_manifest()
+        self.journaled_ids = set()
+        self.pending = 0
+
+    def detect_changes(self, summary_fields=None):
+        """Diff the shards on disk against the last read/write; see JournaledJsonFile.detect_changes.
+
+        Only shards whose stat changed are read, and they only count as changed
+        if their content digest differs. A directly edited JSON file is taken as
+        the new version of every record instead.
+        """
+        with self._lock:
+            stats = self._scan()
+            if self._json_edited():
+                return self._json_changes()
+            if stats == self._stats or MANIFEST_NAME not in stats:
+                return None # Unchanged, or mid-checkout: wait for the manifest to come back
+            with span('sharded.detect_changes', file=os.path.basename(self.directory)) as s:
+                order = self._read_manifest()
+                digests = {}
+                changed = {}
+                added = []
+                for record_id in order:
+                    name = shard_name(record_id)
+                    if record_id in self.digests and stats.get(name) == self._stats.get(name):
+                        digests[record_id] = self.digests[record_id]
+                        continue
+                    raw = self._read_shard(record_id)
+                    digests[record_id] = digest(raw).hex()
+                    if record_id not in self.digests:
+                        added.append(json.loads(raw))
+                    elif digests[record_id] != self.digests[record_id]:
+                        changed[record_id] = json.loads(raw)
+                removed = [record_id for record_id in self.digests if record_id not in digests]
+                s.set(records=len(order), changed=len(changed), added=len(added), removed=len(removed))
+        # No stubs to re-point; the signature carries what accept_changes needs
+        return FileChanges((stats, order), digests, changed, added, removed, [])
+
+    def accept_changes(self, changes):
+        with self._lock:
+            if changes.signature[0] == 'json':
+                # The shards still hold the old versions; compaction writes the merged ones
+                self._accepted_json = changes.signature[1]
+            else:
+                self._stats, self._order = changes.signature
+                self.digests = changes.digests
+            self.signature += 1
+
+    def close(self):
+        pass
+
+    # Helpers; callers hold the lock
+    def _json_edited(self):
+        current = file_digest(self.json_path)
+        return current is not None and current != self.assembled and current != self._accepted_json
+
+    def _json_changes(self):
+        with span('sharded.detect_json_changes', file=os.path.basename(self.json_path)) as s:
+            with open(self.json_path, 'rb') as f:
+                raw = f.read()
+            records = json.loads(raw)
+            digests = {record.get('id'): digest(shard_bytes(record)).hex() for record in records}
+            changed = {record['id']: record for record in records
+                       if record.get('id') in self.digests and digests[record['id']] != self.digests[record['id']]}
+            added = [record for record in records if record.get('id') not in self.digests]
+            removed = [record_id for record_id in self.digests if record_id not in digests]
+            s.set(records=len(records), changed=len(changed), added=len(added), removed=len(removed))
+        return FileChanges(('json', digest(raw).hex()), digests, changed, added, removed, [])
+
+    def _scan(self):
+        stats = {}
+        with os.scandir(self.directory) as entries:
+            for entry in entries:
+                if entry.name.endswith('.json'):
+                    stat = entry.stat()
+                    stats[entry.name] = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+        return stats
+
+    def _read_manifest(self):
+        with open(self.path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+        self.assembled = manifest.get('assembled', self.assembled)
+        return [entry['id'] for entry in manifest['records']]
+
+    def _read_shard(self, record_id):
+        with open(os.path.join(self.directory, shard_name(record_id)), 'rb') as f:
+            return f.read()
+
+    def _read_record(self, record):
+        return json.loads(self._read_shard(record['id'])) if isinstance(record, RecordStub) else record
+
+    def _write_shard(self, record_id, raw):
+        path = os.path.join(self.directory, shard_name(record_id))
+        with atomic_replace(path, binary=True) as f:
+            f.write(raw)
+        self.digests[record_id] = digest(raw).hex()
+        self._restat(path)
+
+    def _remove_shard(self, record_id):
+        path = os.path.join(self.directory, shard_name(record_id))
+        if os.path.exists(path):
+            os.remove(path)
+        self.digests.pop(record_id, None)
+        self._stats.pop(os.path.basename(path), None)
+
+    def _write_manifest(self):
+        _write_if_changed(self.path, manifest_bytes(((record_id, self.digests[record_id]) for record_id in self._order),
+                                                    self.assembled))
+        self._restat(self.path)
+
+    def _restat(self, path):
+        stat = os.stat(path)
+        self._stats[os.path.basename(path)] = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+
+def split(path):
+    """(Re)create the shard directory from the JSON file at ``path``. Returns the record count.
+
+    The JSON file wins: shards of records it no longer has are removed.
+    """
+    with open(path, 'rb') as f:
+        data = f.read()
+    records = json.loads(data)
+    directory = shard_directory(path)
+    os.makedirs(directory, exist_ok=True)
+    entries = []
+    for record in records:
+        raw = shard_bytes(record)
+        _write_if_changed(os.path.join(directory, shard_name(record['id'])), raw)
+        entries.append((record['id'], digest(raw).hex()))
+    names = {shard_name(record_id) for record_id, record_digest in entries} | {MANIFEST_NAME}
+    with os.scandir(directory) as existing:
+        for entry in existing:
+            if entry.name.endswith('.json') and entry.name not in names:
+                os.remove(entry.path)
+    _write_if_changed(os.path.join(directory, MANIFEST_NAME), manifest_bytes(entries, digest(data).hex()))
+    return len(records)
+
+
+def build(path, workers=None):
+    """Assemble the JSON file at ``path`` from its shards. Returns the record count.
+
+    Raises FileChangedError if the JSON file was edited directly since it was last assembled.
+    """
+    data_file = ShardedDataFile(path, workers=workers)
+    records = data_file.load()
+    data_file.compact(records) # Also refreshes manifest digests of hand-edited shards
+    return len(records)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Split the data files into per-record shards, or assemble them again.")
+    parser.add_argument('command', choices=('split', 'build'))
+    parser.add_argument('files', nargs='*', default=DATA_FILES, help="JSON data files (default: predictions and blog posts)")
+    parser.add_argument('--jobs', type=int, default=None, help="threads reading shards")
+    args = parser.parse_args(argv)
+    for path in args.files:
+        try:
+            if args.command == 'split':
+                print(f"Split {split(path)} records from {path} into {shard_directory(path)}")
+            elif not os.path.isdir(shard_directory(path)):
+                print(f"{path}: no shard directory, left as it is")
+            else:
+                print(f"Assembled {build(path, args.jobs)} records into {path}")
+        except (OSError, ValueError, KeyError) as e:
+            print(f"Error: {path}: {e}", file=sys.stderr)
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
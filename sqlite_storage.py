@@ -0,0 +1,422 @@
+"""SQLite storage for the editor's records, with the JSON files as an export.
+
+``SqliteDataFile`` keeps one collection (``predictions``, ``blogPosts``) in a
+shared database and has the same interface as JournaledJsonFile, so the
+editor and BackgroundWriter use it unchanged:
+
+- a save is one small upsert transaction, whatever the corpus size;
+- ``compact`` regenerates the JSON file the Vite build imports from the
+  database, deterministically, and leaves the file alone if nothing changed;
+- ``detect_changes`` diffs that JSON file against the last export, so a
+  ``git pull`` is merged in exactly like with the JSON backend.
+
+Each record's body is stored exactly as it appears in the exported array, so
+exporting is a concatenation. ``id``, ``status`` and ``timelineSegment`` are
+indexed columns, ``supportingEvidence`` entries get a table of their own, and
+the search text goes into an FTS5 table whose rowid is the record's ``key``,
+so a save replaces its search text with a rowid lookup:
+
+    python sqlite_storage.py export           # rewrite both JSON files from the database
+    python sqlite_storage.py import           # (re)load the database from the JSON files
+    python sqlite_storage.py search "agent benchmark" --collection predictions
+"""
+import argparse
+import json
+import os
+import sqlite3
+import sys
+import threading
+
+from journal import DEFAULT_COMPACT_EVERY, FileChangedError, FileChanges, atomic_replace, file_signature
+from lazy_records import RecordStub, digest, digest_records, read_record, record_bytes, scan_records
+from search_index import blog_post_search_text, prediction_search_text, tokenize
+from tracing import span
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+DATA_DIR = os.path.join(SCRIPT_DIR, 'src', 'data')
+DB_FILE_NAME = 'content.sqlite'
+DEFAULT_DB_FILE = os.path.join(DATA_DIR, DB_FILE_NAME)
+# Collection -> search text, for the full-text index
+SEARCH_TEXT = {'predictions': prediction_search_text, 'blogPosts': blog_post_search_text}
+
+SCHEMA_VERSION = 2 # PRAGMA user_version; 1 keyed the FTS rows by (collection, id)
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS records (
+    key INTEGER PRIMARY KEY, -- Stable rowid, shared with records_fts
+    collection TEXT NOT NULL,
+    id TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    status TEXT,
+    timeline_segment TEXT,
+    body TEXT NOT NULL, -- The record as it appears in the exported array
+    base_digest BLOB, -- Digest of the record in the JSON file at the last import/export
+    dirty INTEGER NOT NULL DEFAULT 0, -- Saved since the last export
+    UNIQUE (collection, id)
+);
+CREATE INDEX IF NOT EXISTS records_position ON records (collection, position);
+CREATE INDEX IF NOT EXISTS records_status ON records (collection, status);
+CREATE INDEX IF NOT EXISTS records_timeline_segment ON records (collection, timeline_segment);
+CREATE TABLE IF NOT EXISTS supporting_evidence (
+    collection TEXT NOT NULL,
+    record_id TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    text TEXT,
+    url TEXT,
+    PRIMARY KEY (collection, record_id, position)
+);
+CREATE INDEX IF NOT EXISTS supporting_evidence_url ON supporting_evidence (url);
+CREATE VIRTUAL TABLE IF NOT EXISTS records_fts USING fts5 (text); -- rowid = records.key
+CREATE TABLE IF NOT EXISTS exports (
+    collection TEXT PRIMARY KEY,
+    signature TEXT -- file_signature of the JSON file when last imported or exported
+);
+"""
+
+
+def collection_name(json_path):
+    return os.path.splitext(os.path.basename(json_path))[0]
+
+
+def _search_document(search_text, record):
+    return '\n'.join(value for value in search_text(record) if isinstance(value, str))
+
+
+def fts_query(query):
+    """Every term as a prefix, all required, like SearchIndex."""
+    return ' AND '.join(f'"{term}"*' for term in tokenize(query))
+
+
+class SqliteDataFile:
+    def __init__(self, path, db_path=DEFAULT_DB_FILE, compact_every=DEFAULT_COMPACT_EVERY, search_text=None):
+        self.path = path # The JSON export, which is what gets watched and built from
+        self.db_path = db_path
+        self.collection = collection_name(path)
+        self.compact_every = compact_every
+        self.search_text = search_text or SEARCH_TEXT.get(self.collection)
+        self.pending = 0 # Records saved since the last export
+        self.journaled_ids = set() # Their ids, i.e. edits the JSON file doesn't have yet
+        self.signature = None
+        # Used from the GUI thread and the I/O pool, one at a time
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(db_path, check_same_thread=False)
+        self._migrate()
+        self._db.executescript(SCHEMA)
+        self._db.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    def _migrate(self):
+        """Move a version 1 database (no ``key`` column) over to the current schema, keeping every record."""
+        version = self._db.execute("PRAGMA user_version").fetchone()[0]
+        columns = [row[1] for row in self._db.execute("PRAGMA table_info(records)")]
+        if version >= SCHEMA_VERSION or not columns or 'key' in columns:
+            return
+        with span('sqlite.migrate', version=version), self._db:
+            self._db.execute("ALTER TABLE records RENAME TO records_v1")
+            for index in ('records_position', 'records_status', 'records_timeline_segment'):
+                self._db.execute(f"DROP INDEX IF EXISTS {index}")
+            self._db.execute("DROP TABLE IF EXISTS records_fts")
+            for statement in SCHEMA.split(';'):
+                if 'CREATE' in statement:
+                    self._db.execute(statement)
+            self._db.execute("INSERT INTO records (collection, id, position, status, timeline_segment, body, base_digest, dirty) "
+                             "SELECT collection, id, position, status, timeline_segment, body, base_digest, dirty FROM records_v1")
+            self._db.execute("DROP TABLE records_v1")
+            for key, collection, body in self._db.execute("SELECT key, collection, body FROM records").fetchall():
+                search_text = SEARCH_TEXT.get(collection)
+                if search_text is not None:
+                    self._db.execute("INSERT INTO records_fts (rowid, text) VALUES (?, ?)",
+                                     (key, _search_document(search_text, json.loads(body))))
+
+    # JournaledJsonFile interface
+    def load(self, summary_fields=None):
+        """Return the records in file order, importing the JSON file on first use.
+
+        Edits made to the JSON file since the last export are taken in first,
+        except for records that also have unexported edits in the database.
+        """
+        with span('sqlite.load', collection=self.collection, lazy=bool(summary_fields)) as s:
+            with self._lock:
+                self.signature = self._stored_signature()
+                empty = self._db.execute("SELECT NOT EXISTS (SELECT 1 FROM records WHERE collection = ?)",
+                                         (self.collection,)).fetchone()[0]
+            if empty:
+                self.import_json()
+            else:
+                changes = self.detect_changes()
+                if changes is not None:
+                    self.accept_changes(changes)
+            with self._lock:
+                records = self._select_records(summary_fields)
+                self.journaled_ids = {row[0] for row in self._db.execute(
+                    "SELECT id FROM records WHERE collection = ? AND dirty", (self.collection,))}
+            self.pending = len(self.journaled_ids)
+            s.set(records=len(records))
+            return records
+
+    def _select_records(self, summary_fields):
+        if not summary_fields:
+            return [json.loads(body) for body, in self._db.execute(
+                "SELECT body FROM records WHERE collection = ? ORDER BY position", (self.collection,))]
+        columns = ', '.join("body -> ?" for field in summary_fields)
+        paths = [f'$."{field}"' for field in summary_fields]
+        records = []
+        for row in self._db.execute(f"SELECT rowid, {columns} FROM records WHERE collection = ? ORDER BY position",
+                                    (*paths, self.collection)):
+            # SQL NULL means the field is absent; JSON null comes back as 'null'
+            fields = {field: json.loads(value) for field, value in zip(summary_fields, row[1:]) if value is not None}
+            records.append(RecordStub(fields, row[0]))
+        return records
+
+    def read_body(self, stub):
+        with span('sqlite.read_body', records=1), self._lock:
+            row = self._db.execute("SELECT body FROM records WHERE collection = ? AND id = ?",
+                                   (self.collection, stub.get('id'))).fetchone()
+        if row is None:
+            raise KeyError(f"Record {stub.get('id')!r} is no longer in {self.db_path}")
+        return json.loads(row[0])
+
+    def append(self, record, previous_id=None):
+        return self.append_many([(record, previous_id)])
+
+    def append_many(self, saves):
+        """Store ``(record, previous_id)`` pairs in one transaction. Returns True when an export is due."""
+        with span('sqlite.save', records=len(saves)), self._lock, self._db:
+            for record, previous_id in saves:
+                record_id = record.get('id')
+                if previous_id is not None and previous_id != record_id:
+                    self._rename(previous_id, record_id)
+                    self.journaled_ids.discard(previous_id)
+                self._upsert(record, dirty=True)
+                self.journaled_ids.add(record_id)
+        self.pending = len(self.journaled_ids)
+        return self.pending >= self.compact_every
+
+    def compact(self, records, expected_signature=None):
+        """Make the database match ``records`` (ids and order) and export the JSON file.
+
+        Records missing from ``records`` are deleted. The file is only
+        rewritten if its bytes would change. Raises FileChangedError if the
+        file was edited by someone else since it was last imported or exported.
+        """
+        expected = expected_signature if expected_signature is not None else self.signature
+        with span('sqlite.export', collection=self.collection, records=len(records)), self._lock:
+            if expected is not None and file_signature(self.path) != expected:
+                raise FileChangedError(f"{self.path} was changed by another program")
+            with self._db:
+                self._db.execute("CREATE TEMP TABLE IF NOT EXISTS wanted (id TEXT PRIMARY KEY, position INTEGER)")
+                self._db.execute("DELETE FROM wanted")
+                self._db.executemany("INSERT OR IGNORE INTO wanted VALUES (?, ?)",
+                                     ((record.get('id'), position) for position, record in enumerate(records)))
+                self._db.execute("DELETE FROM records_fts WHERE rowid IN (SELECT key FROM records "
+                                 "WHERE collection = ? AND id NOT IN (SELECT id FROM wanted))", (self.collection,))
+                for table, id_column in (('records', 'id'), ('supporting_evidence', 'record_id')):
+                    self._db.execute(f"DELETE FROM {table} WHERE collection = ? AND {id_column} NOT IN (SELECT id FROM wanted)",
+                                     (self.collection,))
+                self._db.execute("UPDATE records SET position = (SELECT position FROM wanted WHERE wanted.id = records.id) "
+                                 "WHERE collection = ?", (self.collection,))
+                self._export()
+        self.journaled_ids = set()
+        self.pending = 0
+
+    def detect_changes(self, summary_fields=None):
+        """Diff the JSON file against the last import/export; see JournaledJsonFile.detect_changes."""
+        with self._lock:
+            signature = file_signature(self.path)
+            if signature is None or signature == self.signature:
+                return None
+            with span('sqlite.detect_changes', collection=self.collection) as s:
+                records = scan_records(self.path, summary_fields or ('id',))
+                if records is None:
+                    with open(self.path, 'r', encoding='utf-8') as f:
+                        records = json.load(f)
+                digests = dict(zip((record.get('id') for record in records), digest_records(self.path, records)))
+                base = dict(self._db.execute("SELECT id, base_digest FROM records WHERE collection = ?", (self.collection,)))
+                changed = {}
+                added = []
+                for record in records:
+                    record_id = record.get('id')
+                    if record_id not in base:
+                        added.append(self._full(record))
+                    elif base[record_id] != digests[record_id]:
+                        changed[record_id] = self._full(record)
+                # Never-exported records (no base digest) are ours, not removed from the file
+                removed = [record_id for record_id, base_digest in base.items()
+                           if base_digest is not None and record_id not in digests]
+                s.set(records=len(records), changed=len(changed), added=len(added), removed=len(removed))
+        return FileChanges(signature, digests, changed, added, removed, records)
+
+    def _full(self, record):
+        return read_record(self.path, record.span) if isinstance(record, RecordStub) else record
+
+    def accept_changes(self, changes):
+        """Store the file's version of every changed record that has no unexported edits here."""
+        with self._lock, self._db:
+            dirty = {row[0] for row in self._db.execute(
+                "SELECT id FROM records WHERE collection = ? AND dirty", (self.collection,))}
+            for record in list(changes.changed.values()) + changes.added:
+                if record.get('id') not in dirty:
+                    self._upsert(record, dirty=False)
+            for record_id in changes.removed:
+                if record_id not in dirty:
+                    self._delete(record_id)
+            self._db.execute("UPDATE records SET base_digest = NULL WHERE collection = ?", (self.collection,))
+            self._db.executemany("UPDATE records SET base_digest = ? WHERE collection = ? AND id = ?",
+                                 ((record_digest, self.collection, record_id) for record_id, record_digest in changes.digests.items()))
+            self._store_signature(changes.signature)
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+    # Beyond the JournaledJsonFile interface
+    def import_json(self):
+        """Replace the collection with the contents of the JSON file."""
+        with open(self.path, 'r', encoding='utf-8') as f:
+            records = json.load(f)
+        with span('sqlite.import', collection=self.collection, records=len(records)), self._lock, self._db:
+            self._db.execute("DELETE FROM records_fts WHERE rowid IN (SELECT key FROM records WHERE collection = ?)",
+                             (self.collection,))
+            for table in ('records', 'supporting_evidence'):
+                self._db.execute(f"DELETE FROM {table} WHERE collection = ?", (self.collection,))
+            bodies = [record_bytes(record) for record in records] # Encoded once for both the body and its digest
+            for position, (record, body) in enumerate(zip(records, bodies)):
+                self._upsert(record, dirty=False, position=position, body=body)
+            self._db.executemany("UPDATE records SET base_digest = ? WHERE collection = ? AND id = ?",
+                                 ((digest(body), self.collection, record.get('id')) for record, body in zip(records, bodies)))
+            self._store_signature(file_signature(self.path))
+        self.journaled_ids = set()
+        self.pending = 0
+
+    def search(self, query):
+        """Ids matching every term of ``query`` as a prefix, best match first."""
+        match = fts_query(query)
+        if not match:
+            return []
+        with span('sqlite.search'), self._lock:
+            return [row[0] for row in self._db.execute(
+                "SELECT records.id FROM records_fts JOIN records ON records.key = records_fts.rowid "
+                "WHERE records_fts MATCH ? AND records.collection = ? ORDER BY records_fts.rank",
+                (match, self.collection))]
+
+    def ids_where(self, status=None, timeline_segment=None):
+        """Ids in file order, filtered on the indexed columns."""
+        conditions = ["collection = ?"]
+        params = [self.collection]
+        for column, value in (('status', status), ('timeline_segment', timeline_segment)):
+            if value is not None:
+                conditions.append(f"{column} = ?")
+                params.append(value)
+        with self._lock:
+            return [row[0] for row in self._db.execute(
+                f"SELECT id FROM records WHERE {' AND '.join(conditions)} ORDER BY position", params)]
+
+    # Helpers; callers hold the lock and a transaction
+    def _upsert(self, record, dirty, position=None, body=None):
+        record_id = record.get('id')
+        if record_id is None:
+            raise ValueError("Record has no 'id'")
+        if position is None:
+            row = self._db.execute("SELECT position FROM records WHERE collection = ? AND id = ?",
+                                   (self.collection, record_id)).fetchone()
+            if row is None:
+                row = self._db.execute("SELECT COALESCE(MAX(position) + 1, 0) FROM records WHERE collection = ?",
+                                       (self.collection,)).fetchone()
+            position = row[0]
+        status = record.get('status')
+        segment = record.get('timelineSegment')
+        key, = self._db.execute(
+            "INSERT INTO records (collection, id, position, status, timeline_segment, body, dirty) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?) ON CONFLICT (collection, id) DO UPDATE SET "
+            "position = excluded.position, status = excluded.status, timeline_segment = excluded.timeline_segment, "
+            "body = excluded.body, dirty = excluded.dirty RETURNING key",
+            (self.collection, record_id, position, status if isinstance(status, str) else None,
+             segment if isinstance(segment, str) else None, (body or record_bytes(record)).decode('utf-8'), int(dirty))).fetchone()
+        self._db.execute("DELETE FROM supporting_evidence WHERE collection = ? AND record_id = ?", (self.collection, record_id))
+        evidence = record.get('supportingEvidence')
+        if isinstance(evidence, list):
+            self._db.executemany("INSERT INTO supporting_evidence VALUES (?, ?, ?, ?, ?)", (
+                (self.collection, record_id, position, entry.get('text'), entry.get('url'))
+                for position, entry in enumerate(evidence) if isinstance(entry, dict)))
+        self._db.execute("DELETE FROM records_fts WHERE rowid = ?", (key,))
+        if self.search_text is not None:
+            self._db.execute("INSERT INTO records_fts (rowid, text) VALUES (?, ?)",
+                             (key, _search_document(self.search_text, record)))
+
+    def _rename(self, old_id, new_id):
+        # The FTS row follows records.key, which a rename keeps
+        for table, id_column in (('records', 'id'), ('supporting_evidence', 'record_id')):
+            self._db.execute(f"UPDATE {table} SET {id_column} = ? WHERE collection = ? AND {id_column} = ?",
+                             (new_id, self.collection, old_id))
+
+    def _delete(self, record_id):
+        self._db.execute("DELETE FROM records_fts WHERE rowid IN (SELECT key FROM records WHERE collection = ? AND id = ?)",
+                         (self.collection, record_id))
+        for table, id_column in (('records', 'id'), ('supporting_evidence', 'record_id')):
+            self._db.execute(f"DELETE FROM {table} WHERE collection = ? AND {id_column} = ?", (self.collection, record_id))
+
+    def _export(self):
+        rows = [(record_id, body.encode('utf-8')) for record_id, body in self._db.execute(
+            "SELECT id, body FROM records WHERE collection = ? ORDER BY position, id", (self.collection,))]
+        bodies = [body for record_id, body in rows]
+        # Same bytes as json.dump(records, indent=2), which is what the JSON backend writes
+        data = b'[\n' + b',\n'.join(b'  ' + body for body in bodies) + b'\n]' if bodies else b'[]'
+        try:
+            with open(self.path, 'rb') as f:
+                unchanged = f.read() == data
+        except FileNotFoundError:
+            unchanged = False
+        if not unchanged:
+            with atomic_replace(self.path, binary=True) as f:
+                f.write(data)
+        self._db.execute("UPDATE records SET dirty = 0 WHERE collection = ?", (self.collection,))
+        self._db.executemany("UPDATE records SET base_digest = ? WHERE collection = ? AND id = ?",
+                             ((digest(body), self.collection, record_id) for record_id, body in rows))
+        self._store_signature(file_signature(self.path))
+
+    def _stored_signature(self):
+        row = self._db.execute("SELECT signature FROM exports WHERE collection = ?", (self.collection,)).fetchone()
+        return tuple(json.loads(row[0])) if row and row[0] else None
+
+    def _store_signature(self, signature):
+        self.signature = signature
+        self._db.execute("INSERT INTO exports VALUES (?, ?) ON CONFLICT (collection) DO UPDATE SET signature = excluded.signature",
+                         (self.collection, json.dumps(signature)))
+
+
+def main(argv=None):
+    json_files = [os.path.join(DATA_DIR, 'predictions.json'), os.path.join(DATA_DIR, 'blogPosts.json')]
+    parser = argparse.ArgumentParser(description="Manage the optional SQLite store behind the content editor.")
+    parser.add_argument('command', choices=('export', 'import', 'search'))
+    parser.add_argument('query', nargs='?', help="search terms")
+    parser.add_argument('--db', default=DEFAULT_DB_FILE)
+    parser.add_argument('--collection', choices=[collection_name(path) for path in json_files],
+                        help="Default: every collection")
+    args = parser.parse_args(argv)
+    if args.command == 'search' and not args.query:
+        parser.error("search needs a query")
+
+    for path in json_files:
+        if args.collection and collection_name(path) != args.collection:
+            continue
+        data_file = SqliteDataFile(path, args.db)
+        try:
+            if args.command == 'import':
+                data_file.import_json()
+                print(f"Imported {path}")
+            elif args.command == 'export':
+                records = data_file.load(('id',))
+                data_file.compact(records)
+                print(f"Exported {len(records)} records to {path}")
+            else:
+                data_file.load(('id',))
+                for record_id in data_file.search(args.query):
+                    print(f"{data_file.collection}\t{record_id}")
+        except (OSError, ValueError, sqlite3.Error) as e:
+            print(f"Error: {path}: {e}", file=sys.stderr)
+            return 1
+        finally:
+            data_file.close()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,4 +1,5 @@
-const HOURS_FROM_EIGHT_SECONDS = 8 / 3600;
+// Generated by metr_curve.py from metrProgress.json; edit that file (or the editor's METR Points tab) instead.
+const HOURS_FROM_MIN_SECONDS = 8 / 3600;
 const DANIEL_CURVE_PIVOT_YEAR = 2025.2468;
 
 const toDecimalYear = (dateString) => {
@@ -23,28 +24,12 @@ export const danielCurveHoursFromDecimalYear = (decimalYear) => {
 export const danielCurveHoursForDate = (dateString) =>
   danielCurveHoursFromDecimalYear(toDecimalYear(dateString));
 
-const buildDanielCurveSeries = (startDate, endDate, steps = 216) => {
-  const startMs = Date.parse(`${startDate}T00:00:00Z`);
-  const endMs = Date.parse(`${endDate}T00:00:00Z`);
-
-  return Array.from({ length: steps + 1 }, (_, index) => {
-    const t = index / steps;
-    const date = new Date(startMs + ((endMs - startMs) * t));
-    const releaseDate = date.toISOString().slice(0, 10);
-
-    return {
-      releaseDate,
-      hours: danielCurveHoursForDate(releaseDate),
-    };
-  });
-};
-
 export const TODAY_REFERENCE_DATE = '2026-04-10';
 
 export const METR_PROGRESS_DOMAIN = {
   startDate: '2021-01-01',
   endDate: '2027-01-01',
-  minHours: HOURS_FROM_EIGHT_SECONDS,
+  minHours: HOURS_FROM_MIN_SECONDS,
   maxHours: 256,
 };
 
@@ -96,10 +81,226 @@ export const ECI_EXTRAPOLATED_P80_POINTS = [
   },
 ];
 
-export const DANIEL_CURVE_P80_SERIES = buildDanielCurveSeries(
-  METR_PROGRESS_DOMAIN.startDate,
-  METR_PROGRESS_DOMAIN.endDate,
-);
+// The curve at 216 even steps from startDate to endDate (6 significant digits)
+export const DANIEL_CURVE_P80_SERIES = [
+  { releaseDate: '2021-01-01', hours: 0.00303691 },
+  { releaseDate: '2021-01-11', hours: 0.00307737 },
+  { releaseDate: '2021-01-21', hours: 0.003119 },
+  { releaseDate: '2021-01-31', hours: 0.00316185 },
+  { releaseDate: '2021-02-10', hours: 0.00320594 },
+  { releaseDate: '2021-02-20', hours: 0.00325132 },
+  { releaseDate: '2021-03-02', hours: 0.00329801 },
+  { releaseDate: '2021-03-13', hours: 0.00335093 },
+  { releaseDate: '2021-03-23', hours: 0.00340051 },
+  { releaseDate: '2021-04-02', hours: 0.00345154 },
+  { releaseDate: '2021-04-12', hours: 0.00350404 },
+  { releaseDate: '2021-04-22', hours: 0.00355807 },
+  { releaseDate: '2021-05-02', hours: 0.00361368 },
+  { releaseDate: '2021-05-12', hours: 0.00367091 },
+  { releaseDate: '2021-05-23', hours: 0.00373579 },
+  { releaseDate: '2021-06-02', hours: 0.00379658 },
+  { releaseDate: '2021-06-12', hours: 0.00385915 },
+  { releaseDate: '2021-06-22', hours: 0.00392355 },
+  { releaseDate: '2021-07-02', hours: 0.00398985 },
+  { releaseDate: '2021-07-12', hours: 0.0040581 },
+  { releaseDate: '2021-07-22', hours: 0.00412836 },
+  { releaseDate: '2021-08-02', hours: 0.00420805 },
+  { releaseDate: '2021-08-12', hours: 0.00428275 },
+  { releaseDate: '2021-08-22', hours: 0.00435966 },
+  { releaseDate: '2021-09-01', hours: 0.00443887 },
+  { releaseDate: '2021-09-11', hours: 0.00452044 },
+  { releaseDate: '2021-09-21', hours: 0.00460445 },
+  { releaseDate: '2021-10-01', hours: 0.00469099 },
+  { releaseDate: '2021-10-12', hours: 0.00478919 },
+  { releaseDate: '2021-10-22', hours: 0.00488129 },
+  { releaseDate: '2021-11-01', hours: 0.00497619 },
+  { releaseDate: '2021-11-11', hours: 0.00507396 },
+  { releaseDate: '2021-11-21', hours: 0.00517472 },
+  { releaseDate: '2021-12-01', hours: 0.00527856 },
+  { releaseDate: '2021-12-11', hours: 0.00538559 },
+  { releaseDate: '2021-12-22', hours: 0.00550713 },
+  { releaseDate: '2022-01-01', hours: 0.00562121 },
+  { releaseDate: '2022-01-11', hours: 0.00573882 },
+  { releaseDate: '2022-01-21', hours: 0.0058601 },
+  { releaseDate: '2022-01-31', hours: 0.00598516 },
+  { releaseDate: '2022-02-10', hours: 0.00611414 },
+  { releaseDate: '2022-02-20', hours: 0.00624719 },
+  { releaseDate: '2022-03-03', hours: 0.00639839 },
+  { releaseDate: '2022-03-13', hours: 0.00654043 },
+  { releaseDate: '2022-03-23', hours: 0.006687 },
+  { releaseDate: '2022-04-02', hours: 0.00683824 },
+  { releaseDate: '2022-04-12', hours: 0.00699434 },
+  { releaseDate: '2022-04-22', hours: 0.00715547 },
+  { releaseDate: '2022-05-02', hours: 0.00732181 },
+  { releaseDate: '2022-05-13', hours: 0.00751102 },
+  { releaseDate: '2022-05-23', hours: 0.00768893 },
+  { releaseDate: '2022-06-02', hours: 0.00787267 },
+  { releaseDate: '2022-06-12', hours: 0.00806244 },
+  { releaseDate: '2022-06-22', hours: 0.00825848 },
+  { releaseDate: '2022-07-02', hours: 0.00846102 },
+  { releaseDate: '2022-07-12', hours: 0.0086703 },
+  { releaseDate: '2022-07-23', hours: 0.00890861 },
+  { releaseDate: '2022-08-02', hours: 0.00913288 },
+  { releaseDate: '2022-08-12', hours: 0.00936473 },
+  { releaseDate: '2022-08-22', hours: 0.00960442 },
+  { releaseDate: '2022-09-01', hours: 0.00985227 },
+  { releaseDate: '2022-09-11', hours: 0.0101086 },
+  { releaseDate: '2022-09-21', hours: 0.0103737 },
+  { releaseDate: '2022-10-02', hours: 0.0106759 },
+  { releaseDate: '2022-10-12', hours: 0.0109605 },
+  { releaseDate: '2022-10-22', hours: 0.0112551 },
+  { releaseDate: '2022-11-01', hours: 0.01156 },
+  { releaseDate: '2022-11-11', hours: 0.0118756 },
+  { releaseDate: '2022-11-21', hours: 0.0122022 },
+  { releaseDate: '2022-12-01', hours: 0.0125405 },
+  { releaseDate: '2022-12-12', hours: 0.0129264 },
+  { releaseDate: '2022-12-22', hours: 0.0132904 },
+  { releaseDate: '2023-01-01', hours: 0.0136675 },
+  { releaseDate: '2023-01-11', hours: 0.0140581 },
+  { releaseDate: '2023-01-21', hours: 0.0144629 },
+  { releaseDate: '2023-01-31', hours: 0.0148823 },
+  { releaseDate: '2023-02-10', hours: 0.0153171 },
+  { releaseDate: '2023-02-21', hours: 0.0158138 },
+  { releaseDate: '2023-03-03', hours: 0.0162827 },
+  { releaseDate: '2023-03-13', hours: 0.0167691 },
+  { releaseDate: '2023-03-23', hours: 0.0172734 },
+  { releaseDate: '2023-04-02', hours: 0.0177966 },
+  { releaseDate: '2023-04-12', hours: 0.0183394 },
+  { releaseDate: '2023-04-22', hours: 0.0189026 },
+  { releaseDate: '2023-05-03', hours: 0.0195468 },
+  { releaseDate: '2023-05-13', hours: 0.0201558 },
+  { releaseDate: '2023-05-23', hours: 0.0207879 },
+  { releaseDate: '2023-06-02', hours: 0.0214443 },
+  { releaseDate: '2023-06-12', hours: 0.022126 },
+  { releaseDate: '2023-06-22', hours: 0.022834 },
+  { releaseDate: '2023-07-02', hours: 0.0235695 },
+  { releaseDate: '2023-07-13', hours: 0.0244117 },
+  { releaseDate: '2023-07-23', hours: 0.0252088 },
+  { releaseDate: '2023-08-02', hours: 0.0260373 },
+  { releaseDate: '2023-08-12', hours: 0.0268986 },
+  { releaseDate: '2023-08-22', hours: 0.027794 },
+  { releaseDate: '2023-09-01', hours: 0.0287251 },
+  { releaseDate: '2023-09-11', hours: 0.0296935 },
+  { releaseDate: '2023-09-22', hours: 0.0308037 },
+  { releaseDate: '2023-10-02', hours: 0.0318558 },
+  { releaseDate: '2023-10-12', hours: 0.0329506 },
+  { releaseDate: '2023-10-22', hours: 0.0340901 },
+  { releaseDate: '2023-11-01', hours: 0.0352761 },
+  { releaseDate: '2023-11-11', hours: 0.0365109 },
+  { releaseDate: '2023-11-21', hours: 0.0377967 },
+  { releaseDate: '2023-12-02', hours: 0.0392726 },
+  { releaseDate: '2023-12-12', hours: 0.0406731 },
+  { releaseDate: '2023-12-22', hours: 0.0421322 },
+  { releaseDate: '2024-01-01', hours: 0.0436525 },
+  { releaseDate: '2024-01-11', hours: 0.0452325 },
+  { releaseDate: '2024-01-21', hours: 0.0468793 },
+  { releaseDate: '2024-01-31', hours: 0.0485959 },
+  { releaseDate: '2024-02-11', hours: 0.0505688 },
+  { releaseDate: '2024-02-21', hours: 0.0524429 },
+  { releaseDate: '2024-03-02', hours: 0.0543976 },
+  { releaseDate: '2024-03-12', hours: 0.0564366 },
+  { releaseDate: '2024-03-22', hours: 0.058564 },
+  { releaseDate: '2024-04-01', hours: 0.0607839 },
+  { releaseDate: '2024-04-11', hours: 0.0631008 },
+  { releaseDate: '2024-04-22', hours: 0.065767 },
+  { releaseDate: '2024-05-02', hours: 0.0683031 },
+  { releaseDate: '2024-05-12', hours: 0.0709514 },
+  { releaseDate: '2024-05-22', hours: 0.0737175 },
+  { releaseDate: '2024-06-01', hours: 0.0766069 },
+  { releaseDate: '2024-06-11', hours: 0.0796258 },
+  { releaseDate: '2024-06-21', hours: 0.0827805 },
+  { releaseDate: '2024-07-02', hours: 0.0864156 },
+  { releaseDate: '2024-07-12', hours: 0.0898778 },
+  { releaseDate: '2024-07-22', hours: 0.0934977 },
+  { releaseDate: '2024-08-01', hours: 0.0972832 },
+  { releaseDate: '2024-08-11', hours: 0.101243 },
+  { releaseDate: '2024-08-21', hours: 0.105385 },
+  { releaseDate: '2024-08-31', hours: 0.109718 },
+  { releaseDate: '2024-09-11', hours: 0.114719 },
+  { releaseDate: '2024-09-21', hours: 0.119487 },
+  { releaseDate: '2024-10-01', hours: 0.12448 },
+  { releaseDate: '2024-10-11', hours: 0.129707 },
+  { releaseDate: '2024-10-21', hours: 0.135181 },
+  { releaseDate: '2024-10-31', hours: 0.140915 },
+  { releaseDate: '2024-11-10', hours: 0.146923 },
+  { releaseDate: '2024-11-21', hours: 0.153863 },
+  { releaseDate: '2024-12-01', hours: 0.160491 },
+  { releaseDate: '2024-12-11', hours: 0.167438 },
+  { releaseDate: '2024-12-21', hours: 0.174722 },
+  { releaseDate: '2024-12-31', hours: 0.182359 },
+  { releaseDate: '2025-01-10', hours: 0.19039 },
+  { releaseDate: '2025-01-20', hours: 0.198817 },
+  { releaseDate: '2025-01-31', hours: 0.208568 },
+  { releaseDate: '2025-02-10', hours: 0.217893 },
+  { releaseDate: '2025-02-20', hours: 0.227682 },
+  { releaseDate: '2025-03-02', hours: 0.237959 },
+  { releaseDate: '2025-03-12', hours: 0.248752 },
+  { releaseDate: '2025-03-22', hours: 0.260087 },
+  { releaseDate: '2025-04-01', hours: 0.271994 },
+  { releaseDate: '2025-04-12', hours: 0.291701 },
+  { releaseDate: '2025-04-22', hours: 0.310996 },
+  { releaseDate: '2025-05-02', hours: 0.331676 },
+  { releaseDate: '2025-05-12', hours: 0.353851 },
+  { releaseDate: '2025-05-22', hours: 0.377645 },
+  { releaseDate: '2025-06-01', hours: 0.403192 },
+  { releaseDate: '2025-06-11', hours: 0.43064 },
+  { releaseDate: '2025-06-22', hours: 0.463221 },
+  { releaseDate: '2025-07-02', hours: 0.495205 },
+  { releaseDate: '2025-07-12', hours: 0.529647 },
+  { releaseDate: '2025-07-22', hours: 0.566765 },
+  { releaseDate: '2025-08-01', hours: 0.606801 },
+  { releaseDate: '2025-08-11', hours: 0.650022 },
+  { releaseDate: '2025-08-21', hours: 0.696725 },
+  { releaseDate: '2025-09-01', hours: 0.752514 },
+  { releaseDate: '2025-09-11', hours: 0.807646 },
+  { releaseDate: '2025-09-21', hours: 0.867407 },
+  { releaseDate: '2025-10-01', hours: 0.932259 },
+  { releaseDate: '2025-10-11', hours: 1.00272 },
+  { releaseDate: '2025-10-21', hours: 1.07936 },
+  { releaseDate: '2025-10-31', hours: 1.16283 },
+  { releaseDate: '2025-11-11', hours: 1.26342 },
+  { releaseDate: '2025-11-21', hours: 1.36373 },
+  { releaseDate: '2025-12-01', hours: 1.47347 },
+  { releaseDate: '2025-12-11', hours: 1.59368 },
+  { releaseDate: '2025-12-21', hours: 1.72559 },
+  { releaseDate: '2025-12-31', hours: 1.87057 },
+  { releaseDate: '2026-01-10', hours: 2.03021 },
+  { releaseDate: '2026-01-21', hours: 2.22487 },
+  { releaseDate: '2026-01-31', hours: 2.42143 },
+  { releaseDate: '2026-02-10', hours: 2.63913 },
+  { releaseDate: '2026-02-20', hours: 2.88072 },
+  { releaseDate: '2026-03-02', hours: 3.14943 },
+  { releaseDate: '2026-03-12', hours: 3.44895 },
+  { releaseDate: '2026-03-22', hours: 3.78361 },
+  { releaseDate: '2026-04-02', hours: 4.19837 },
+  { releaseDate: '2026-04-12', hours: 4.62425 },
+  { releaseDate: '2026-04-22', hours: 5.10389 },
+  { releaseDate: '2026-05-02', hours: 5.64556 },
+  { releaseDate: '2026-05-12', hours: 6.25909 },
+  { releaseDate: '2026-05-22', hours: 6.95611 },
+  { releaseDate: '2026-06-01', hours: 7.75048 },
+  { releaseDate: '2026-06-12', hours: 8.75662 },
+  { releaseDate: '2026-06-22', hours: 9.81343 },
+  { releaseDate: '2026-07-02', hours: 11.0308 },
+  { releaseDate: '2026-07-12', hours: 12.4384 },
+  { releaseDate: '2026-07-22', hours: 14.0723 },
+  { releaseDate: '2026-08-01', hours: 15.9768 },
+  { releaseDate: '2026-08-11', hours: 18.2062 },
+  { releaseDate: '2026-08-22', hours: 21.1143 },
+  { releaseDate: '2026-09-01', hours: 24.2637 },
+  { releaseDate: '2026-09-11', hours: 28.0043 },
+  { releaseDate: '2026-09-21', hours: 32.4697 },
+  { releaseDate: '2026-10-01', hours: 37.829 },
+  { releaseDate: '2026-10-11', hours: 44.2973 },
+  { releaseDate: '2026-10-21', hours: 52.1497 },
+  { releaseDate: '2026-11-01', hours: 62.8126 },
+  { releaseDate: '2026-11-11', hours: 74.8537 },
+  { releaseDate: '2026-11-21', hours: 89.7659 },
+  { releaseDate: '2026-12-01', hours: 108.364 },
+  { releaseDate: '2026-12-11', hours: 131.733 },
+  { releaseDate: '2026-12-21', hours: 161.323 },
+  { releaseDate: '2027-01-01', hours: 203.418 },
+];
 
 export const METR_PROGRESS_SNAPSHOT = {
   danielCurveToday: {
@@ -3,7 +3,8 @@ import React, { useState, useEffect, useMemo, useRef, forwardRef, createContext,
 import ReactDOM from 'react-dom/client';
 import { BrowserRouter, Routes, Route, useNavigate, useParams, useLocation } from 'react-router-dom';
 import predictionsData from './data/predictions.json';
-import blogPostsData from './data/blogPosts.json';
+// Summaries only; each post's pre-rendered HTML is fetched when it is opened (see blog_export.py)
+import blogPostsData from './data/blogIndex.json';
 import {
   DANIEL_CURVE_P80_SERIES,
   ECI_EXTRAPOLATED_P80_POINTS,
@@ -12,8 +13,6 @@ import {
   PUBLISHED_METR_P80_POINTS,
   TODAY_REFERENCE_DATE,
 } from './data/metrProgress';
-import ReactMarkdown from 'react-markdown';
-import remarkGfm from 'remark-gfm';
 
 // --- Theme Context ---
 const ThemeContext = createContext();
@@ -1063,6 +1062,23 @@ const BlogPostPage = ({ posts }) => {
   const post = posts.find(p => p.id === id);
   const { activeColors, isDarkMode } = useTheme();
   const navigate = useNavigate();
+  const [html, setHtml] = useState(null);
+  const [loadError, setLoadError] = useState(false);
+
+  useEffect(() => {
+    if (!post) return;
+    let cancelled = false;
+    setHtml(null);
+    setLoadError(false);
+    fetch(`${import.meta.env.BASE_URL}blog-html/${post.html}`)
+      .then(response => {
+        if (!response.ok) throw new Error(`HTTP ${response.status}`);
+        return response.text();
+      })
+      .then(text => { if (!cancelled) setHtml(text); })
+      .catch(() => { if (!cancelled) setLoadError(true); });
+    return () => { cancelled = true; };
+  }, [post]);
 
     if (!post) {
         return (
@@ -1094,10 +1110,14 @@ const BlogPostPage = ({ posts }) => {
                         </div>
                     )}
                 </CardHeader>
-        {/* Use ReactMarkdown with prose styling and GFM plugin */}
+        {/* HTML pre-rendered from the post's Markdown by blog_export.py (raw HTML in posts escaped there), with prose styling */}
         <CardContent className="pt-6">
           <div className={`prose prose-sm sm:prose-base max-w-none ${activeColors.isDarkMode ? 'prose-invert' : ''} dark:prose-headings:text-neutral-100 dark:prose-p:text-neutral-300 dark:prose-a:text-emerald-400 dark:prose-strong:text-neutral-100 dark:prose-ul:text-neutral-300 dark:prose-ol:text-neutral-300 dark:prose-li:text-neutral-300 dark:prose-blockquote:text-neutral-400 dark:prose-code:text-neutral-300 dark:prose-pre:bg-neutral-700 dark:prose-th:text-neutral-100 dark:prose-td:text-neutral-300` }>
-            <ReactMarkdown remarkPlugins={[remarkGfm]}>{post.content || ''}</ReactMarkdown>
+            {html !== null ? (
+              <div dangerouslySetInnerHTML={{ __html: html }} />
+            ) : (
+              <p className={activeColors.textSecondary}>{loadError ? 'Could not load this post.' : 'Loading...'}</p>
+            )}
           </div>
                 </CardContent>
             </Card>
@@ -0,0 +1,30 @@
+"""Where the editor keeps its records.
+
+``json`` (the default) edits the JSON files in ``src/data`` directly, through
+a save journal (journal.JournaledJsonFile). ``sqlite`` keeps them in
+``src/data/content.sqlite`` and exports the JSON files the web app builds
+from (sqlite_storage.SqliteDataFile). ``sharded`` keeps one file per record
+under ``src/data/predictions/`` etc. and assembles the JSON files from them
+(sharded_storage.ShardedDataFile). All return a data file object with the
+same interface: load, read_body, append_many, compact, detect_changes,
+accept_changes and close.
+"""
+import os
+
+from journal import JournaledJsonFile
+
+STORAGE_BACKENDS = ('json', 'sqlite', 'sharded')
+
+
+def open_data_file(path, backend='json', db_path=None):
+    """Data file object for the JSON file at ``path`` under ``backend``."""
+    if backend == 'sqlite':
+        from sqlite_storage import DB_FILE_NAME, SqliteDataFile # sqlite3 is only loaded when used
+        # One database per data directory, shared by its collections
+        return SqliteDataFile(path, db_path or os.path.join(os.path.dirname(os.path.abspath(path)), DB_FILE_NAME))
+    if backend == 'sharded':
+        from sharded_storage import ShardedDataFile
+        return ShardedDataFile(path)
+    if backend != 'json':
+        raise ValueError(f"Unknown storage backend '{backend}', expected one of {STORAGE_BACKENDS}")
+    return JournaledJsonFile(path)
@@ -0,0 +1,229 @@
+"""When predictions are due: parsing ``predictedDate`` phrases and a sorted index over them.
+
+``parse_period`` turns the free-text dates ("Mid 2025", "September 2027",
+"Mid 2026 - Mid 2027", "2025-05-01") into ``(start, end)`` decimal years,
+counted like ``toDecimalYear`` in metrProgress.js. The same few phrases
+recur across hundreds of records, so results are memoized. A prediction
+falls due at the end of its period; ``predictedDate`` is used when it parses,
+else ``timelineSegment``.
+
+``TimelineIndex`` keeps the predictions sorted by period start (for a
+chronological list) and by due date, and answers range queries with bisect.
+Like SearchIndex, it is built from the full records when first queried and
+then kept current by store notifications.
+"""
+import datetime
+import re
+from bisect import bisect_left, bisect_right, insort
+from functools import lru_cache
+
+from tracing import span
+
+MONTHS = {name: number for number, names in enumerate(
+    (('january', 'jan'), ('february', 'feb'), ('march', 'mar'), ('april', 'apr'), ('may',), ('june', 'jun'),
+     ('july', 'jul'), ('august', 'aug'), ('september', 'sep', 'sept'), ('october', 'oct'),
+     ('november', 'nov'), ('december', 'dec')), start=1) for name in names}
+# Part of a year, as fractions of it
+YEAR_PARTS = {
+    'early': (0, 1 / 3), 'start of': (0, 1 / 4), 'beginning of': (0, 1 / 4),
+    'mid': (1 / 3, 2 / 3), 'middle of': (1 / 3, 2 / 3),
+    'late': (2 / 3, 1), 'end of': (3 / 4, 1),
+    'first half of': (0, 1 / 2), 'h1': (0, 1 / 2), 'second half of': (1 / 2, 1), 'h2': (1 / 2, 1),
+    'q1': (0, 1 / 4), 'q2': (1 / 4, 1 / 2), 'q3': (1 / 2, 3 / 4), 'q4': (3 / 4, 1),
+}
+_NOTES = re.compile(r'\([^)]*\)')
+_RANGE = re.compile(r'(.+?)\s+(?:-|–|—|to|through|until)\s+(.+)')
+_AFTER = re.compile(r'(?:post|after|beyond)\s+(.+)')
+_BY = re.compile(r'(?:by|before|in)\s+(.+)')
+_DATE = re.compile(r'(\d{4})-(\d{2})-(\d{2})')
+_MONTH = re.compile(r'([a-z]+)\.?\s+(\d{4})')
+_PART = re.compile(r'(' + '|'.join(sorted(map(re.escape, YEAR_PARTS), key=len, reverse=True)) + r')[\s-]+(\d{4})')
+_YEAR = re.compile(r'(\d{4})')
+
+
+def decimal_year(date):
+    """A date (or ``'2025-05-01'``) as a fractional year, like ``toDecimalYear``."""
+    if isinstance(date, str):
+        date = datetime.date.fromisoformat(date)
+    start = datetime.date(date.year, 1, 1)
+    length = (datetime.date(date.year + 1, 1, 1) - start).days
+    return date.year + (date - start).days / length
+
+
+def _month_period(year, month):
+    start = datetime.date(year, month, 1)
+    end = datetime.date(year + month // 12, month % 12 + 1, 1)
+    return decimal_year(start), decimal_year(end)
+
+
+@lru_cache(maxsize=4096)
+def parse_period(text):
+    """``(start, end)`` decimal years for a date phrase, or None if it isn't one."""
+    if not isinstance(text, str):
+        return None
+    phrase = ' '.join(_NOTES.sub(' ', text).lower().replace(',', ' ').split())
+    match = _RANGE.fullmatch(phrase)
+    if match:
+        first, last = parse_period(match.group(1)), parse_period(match.group(2))
+        return (first[0], last[1]) if first and last and first[0] <= last[1] else None
+    match = _AFTER.fullmatch(phrase)
+    if match:
+        period = parse_period(match.group(1))
+        return (period[1], period[1]) if period else None # Assessable once the named period is over
+    match = _BY.fullmatch(phrase)
+    if match:
+        return parse_period(match.group(1))
+    return _parse_single(phrase)
+
+
+def _parse_single(phrase):
+    try:
+        match = _DATE.fullmatch(phrase)
+        if match:
+            day = datetime.date(*map(int, match.groups()))
+            return decimal_year(day), decimal_year(day + datetime.timedelta(days=1))
+        match = _MONTH.fullmatch(phrase)
+        if match and match.group(1) in MONTHS:
+            return _month_period(int(match.group(2)), MONTHS[match.group(1)])
+    except ValueError:
+        return None # 2025-02-30 and the like
+    match = _PART.fullmatch(phrase)
+    if match:
+        low, high = YEAR_PARTS[match.group(1)]
+        year = int(match.group(2))
+        return float(year + low), float(year + high)
+    match = _YEAR.fullmatch(phrase)
+    if match:
+        year = int(match.group(1))
+        return float(year), float(year + 1)
+    return None
+
+
+def record_period(record):
+    return parse_period(record.get('predictedDate')) or parse_period(record.get('timelineSegment'))
+
+
+def evaluated_year(record):
+    value = record.get('lastEvaluated')
+    try:
+        return decimal_year(value) if isinstance(value, str) else None
+    except ValueError:
+        return None
+
+
+class TimelineIndex:
+    def __init__(self, store):
+        self.store = store
+        self.built = False
+        self._periods = {} # id -> (start, end), for dated records
+        self._evaluated = {} # id -> decimal year of lastEvaluated, or None
+        self._by_start = [] # Sorted (start, end, id)
+        self._by_due = [] # Sorted (end, id)
+        self._undated = set()
+        self._ranks = None # id -> chronological position, rebuilt when asked for after a change
+        store.add_listener(self)
+
+    def build(self):
+        with span('timeline.build', records=len(self.store)) as s:
+            self._clear()
+            for record in self.store.iter_full():
+                self._add(record)
+            self._by_start.sort(key=_sort_key)
+            self._by_due.sort(key=_sort_key)
+            self.built = True
+            s.set(undated=len(self._undated))
+
+    def _ensure_built(self):
+        if not self.built:
+            self.build()
+
+    # Queries
+    def period(self, record_id):
+        self._ensure_built()
+        return self._periods.get(record_id)
+
+    def chronological(self):
+        """Ids by period start (then end), undated ones last in id order."""
+        self._ensure_built()
+        return [record_id for start, end, record_id in self._by_start] + sorted(self._undated, key=str)
+
+    def rank(self, record_id):
+        """Position of ``record_id`` in ``chronological()``, for sorting other lists by it."""
+        if self._ranks is None:
+            self._ranks = {record_id: position for position, record_id in enumerate(self.chronological())}
+        return self._ranks.get(record_id, len(self._ranks))
+
+    def due_between(self, start, end):
+        """Ids whose period ends within ``[start, end]`` (decimal years), by due date."""
+        self._ensure_built()
+        low = bisect_left(self._by_due, start, key=lambda entry: entry[0])
+        high = bisect_right(self._by_due, end, key=lambda entry: entry[0])
+        return [record_id for due, record_id in self._by_due[low:high]]
+
+    def overdue(self, stale_days, today=None):
+        """Ids already due whose ``lastEvaluated`` is missing or more than ``stale_days`` old.
+
+        The due ones are a bisected prefix; only that prefix is checked for staleness.
+        """
+        self._ensure_built()
+        today = today or datetime.date.today()
+        cutoff = decimal_year(today - datetime.timedelta(days=stale_days))
+        due = bisect_right(self._by_due, decimal_year(today), key=lambda entry: entry[0])
+        return [record_id for end, record_id in self._by_due[:due]
+                if self._evaluated.get(record_id) is None or self._evaluated[record_id] < cutoff]
+
+    # ContentStore listener interface
+    def record_changed(self, old, new):
+        if not self.built:
+            return
+        if old is not None:
+            self._remove(old['id'])
+        self._add(new, keep_sorted=True)
+
+    def record_removed(self, record, row):
+        if self.built:
+            self._remove(record['id'])
+
+    def store_reset(self, store):
+        self.built = False
+        self._clear()
+
+    def _clear(self):
+        self._periods.clear()
+        self._evaluated.clear()
+        self._by_start = []
+        self._by_due = []
+        self._undated = set()
+        self._ranks = None
+
+    def _add(self, record, keep_sorted=False):
+        record_id = record['id']
+        self._evaluated[record_id] = evaluated_year(record)
+        self._ranks = None
+        period = record_period(record)
+        if period is None:
+            self._undated.add(record_id)
+            return
+        self._periods[record_id] = period
+        if keep_sorted:
+            insort(self._by_start, (period[0], period[1], record_id), key=_sort_key)
+            insort(self._by_due, (period[1], record_id), key=_sort_key)
+        else:
+            self._by_start.append((period[0], period[1], record_id))
+            self._by_due.append((period[1], record_id))
+
+    def _remove(self, record_id):
+        self._evaluated.pop(record_id, None)
+        self._undated.discard(record_id)
+        self._ranks = None
+        period = self._periods.pop(record_id, None)
+        if period is not None:
+            start_entry = (period[0], period[1], record_id)
+            del self._by_start[bisect_left(self._by_start, _sort_key(start_entry), key=_sort_key)]
+            due_entry = (period[1], record_id)
+            del self._by_due[bisect_left(self._by_due, _sort_key(due_entry), key=_sort_key)]
+
+
+def _sort_key(entry):
+    # Ids may not compare with each other (str vs int), so they sort as strings
+    return entry[:-1] + (str(entry[-1]),)
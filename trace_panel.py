@@ -0,0 +1,97 @@
+"""In-app view of tracing.py stats: p50/p95 per operation, plus trace export."""
+from PyQt6.QtCore import QTimer
+from PyQt6.QtWidgets import (
+    QCheckBox, QDialog, QFileDialog, QHBoxLayout, QHeaderView, QLabel, QMessageBox,
+    QPushButton, QTableWidget, QTableWidgetItem, QVBoxLayout
+)
+
+import tracing
+
+STATS_COLUMNS = (("Operation", None), ("Calls", 'count'), ("p50 ms", 'p50_ms'), ("p95 ms", 'p95_ms'),
+                 ("Max ms", 'max_ms'), ("Records", 'records'))
+REFRESH_MS = 1000
+
+
+class TraceStatsDialog(QDialog):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Trace Statistics")
+        self.resize(640, 420)
+        layout = QVBoxLayout(self)
+
+        self.enabled_check = QCheckBox("Record spans")
+        self.enabled_check.setChecked(tracing.enabled())
+        self.enabled_check.toggled.connect(self._set_enabled)
+        layout.addWidget(self.enabled_check)
+
+        self.table = QTableWidget(0, len(STATS_COLUMNS))
+        self.table.setHorizontalHeaderLabels([title for title, key in STATS_COLUMNS])
+        self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+        self.table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        self.table.verticalHeader().setVisible(False)
+        layout.addWidget(self.table)
+
+        self.summary_label = QLabel()
+        layout.addWidget(self.summary_label)
+
+        buttons = QHBoxLayout()
+        clear_button = QPushButton("Clear")
+        clear_button.clicked.connect(self._clear)
+        export_button = QPushButton("Export Chrome Trace...")
+        export_button.clicked.connect(self.export_trace)
+        buttons.addWidget(clear_button)
+        buttons.addStretch()
+        buttons.addWidget(export_button)
+        layout.addLayout(buttons)
+
+        # Percentiles are recent-window figures, so keep them current while open
+        self.refresh_timer = QTimer(self)
+        self.refresh_timer.setInterval(REFRESH_MS)
+        self.refresh_timer.timeout.connect(self.refresh)
+
+    def showEvent(self, event):
+        self.refresh()
+        self.refresh_timer.start()
+        super().showEvent(event)
+
+    def hideEvent(self, event):
+        self.refresh_timer.stop()
+        super().hideEvent(event)
+
+    def refresh(self):
+        stats = tracing.tracer.stats()
+        self.table.setRowCount(len(stats))
+        for row, (name, summary) in enumerate(stats.items()):
+            for column, (title, key) in enumerate(STATS_COLUMNS):
+                if key is None:
+                    text = name
+                elif key in ('count', 'records'):
+                    text = str(summary.get(key, 0))
+                else:
+                    text = f"{summary.get(key, 0):.2f}"
+                self.table.setItem(row, column, QTableWidgetItem(text))
+        state = "on" if tracing.enabled() else "off"
+        self.summary_label.setText(f"Tracing is {state}; {len(tracing.tracer.events)} spans buffered.")
+
+    def _set_enabled(self, checked):
+        if checked:
+            tracing.enable()
+        else:
+            tracing.disable()
+        self.refresh()
+
+    def _clear(self):
+        tracing.tracer.clear()
+        self.refresh()
+
+    def export_trace(self):
+        path, _ = QFileDialog.getSaveFileName(self, "Export Chrome Trace", "content-editor-trace.json", "JSON (*.json)")
+        if not path:
+            return
+        try:
+            count = tracing.tracer.export(path)
+        except OSError as e:
+            QMessageBox.critical(self, "Error Exporting Trace", f"Could not write {path}:\n{e}")
+            return
+        QMessageBox.information(self, "Trace Exported",
+                                f"Wrote {count} spans to\n{path}\n\nOpen it in chrome://tracing or ui.perfetto.dev.")
@@ -0,0 +1,139 @@
+"""Switchable timing spans around the editor's hot paths.
+
+    from tracing import span
+    with span('journal.load', file=name) as s:
+        records = ...
+        s.set(records=len(records))
+
+While tracing is off, ``span`` hands back one shared do-nothing object, so an
+instrumented call costs a method call and an attribute check. While it is on,
+every span becomes a Chrome trace "complete" event (load the exported file in
+chrome://tracing or ui.perfetto.dev) and feeds a per-name LatencyRecorder for
+p50/p95 stats. Set CONTENT_EDITOR_TRACE=<file> to trace from startup and
+export when the editor exits.
+"""
+import json
+import os
+import threading
+import time
+from collections import deque
+
+from latency import LatencyRecorder
+
+TRACE_ENV = 'CONTENT_EDITOR_TRACE'
+MAX_EVENTS = 200000 # Oldest events are dropped beyond this
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def set(self, **args):
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    __slots__ = ('tracer', 'name', 'args', 'start')
+
+    def __init__(self, tracer, name, args):
+        self.tracer = tracer
+        self.name = name
+        self.args = args
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.tracer._finish(self, time.perf_counter_ns())
+        return False
+
+    def set(self, **args):
+        """Attach values (record counts, sizes) to the span."""
+        self.args.update(args)
+
+
+class Tracer:
+    def __init__(self, max_events=MAX_EVENTS):
+        self.enabled = False
+        self.events = deque(maxlen=max_events)
+        self._stats = {} # name -> [LatencyRecorder, records seen]
+        self._lock = threading.Lock()
+        self._origin = time.perf_counter_ns()
+        self._pid = os.getpid()
+
+    def span(self, name, **args):
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, name, args)
+
+    def _finish(self, span, end):
+        duration_ns = end - span.start
+        event = {
+            "name": span.name,
+            "cat": span.name.split('.', 1)[0],
+            "ph": "X",
+            "ts": (span.start - self._origin) / 1000, # Microseconds
+            "dur": duration_ns / 1000,
+            "pid": self._pid,
+            "tid": threading.get_ident(),
+        }
+        if span.args:
+            event["args"] = span.args
+        with self._lock:
+            self.events.append(event)
+            entry = self._stats.get(span.name)
+            if entry is None:
+                entry = self._stats[span.name] = [LatencyRecorder(), 0]
+            entry[0].record(duration_ns / 1e6)
+            records = span.args.get('records')
+            if isinstance(records, int):
+                entry[1] += records
+
+    def stats(self):
+        """``{name: LatencyRecorder summary + 'records'}``, sorted by name."""
+        with self._lock:
+            return {name: dict(recorder.summary(), records=records)
+                    for name, (recorder, records) in sorted(self._stats.items())}
+
+    def clear(self):
+        with self._lock:
+            self.events.clear()
+            self._stats.clear()
+
+    def chrome_trace(self):
+        with self._lock:
+            events = list(self.events)
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def export(self, path):
+        """Write the recorded spans as Chrome trace JSON. Returns the event count."""
+        from journal import atomic_replace # Deferred: journal pulls in the lazy loader
+        trace = self.chrome_trace()
+        with atomic_replace(path) as f:
+            json.dump(trace, f)
+        return len(trace["traceEvents"])
+
+
+tracer = Tracer()
+span = tracer.span
+
+
+def enable():
+    tracer.enabled = True
+
+
+def disable():
+    tracer.enabled = False
+
+
+def enabled():
+    return tracer.enabled
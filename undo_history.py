@@ -0,0 +1,211 @@
+"""Session-wide undo/redo for saved edits, kept as per-field diffs.
+
+An entry is one action (a form save, a bulk edit) and holds, for each record
+it touched, only the fields that changed. Short values are kept whole. Long
+strings (``analystCommentary``, blog ``content``) are kept as a delta of the
+replaced spans, so fixing a typo in a long post costs a few bytes rather
+than two copies of the post. Adding a record isn't recorded: the data files
+have no way to delete one again.
+
+The history stays within a byte budget, counting each entry at its JSON
+size, by dropping the oldest entries first. It is saved to its own file
+(.editor-history.json), so it survives restarts without growing the data
+files. Undo and redo check that each record still holds what the entry
+expects, so edits merged from disk since are never silently overwritten.
+"""
+import json
+import os
+import time
+from collections import deque
+from difflib import SequenceMatcher
+from itertools import accumulate
+
+from journal import atomic_replace
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+HISTORY_FILE = os.path.join(SCRIPT_DIR, '.editor-history.json')
+HISTORY_VERSION = 1
+DEFAULT_BUDGET_BYTES = 2 * 1024 * 1024
+TEXT_DELTA_MIN = 200 # Strings at least this long are stored as deltas
+
+
+class HistoryConflict(ValueError):
+    """A record no longer holds what an undo or redo would replace."""
+
+
+def text_delta(old, new):
+    """``[old_at, new_at, old_span, new_span]`` for each stretch that differs between two strings.
+
+    Lines are matched first, then each changed run of lines is trimmed to the
+    characters that actually differ.
+    """
+    old_lines, new_lines = old.splitlines(keepends=True), new.splitlines(keepends=True)
+    old_offsets = list(accumulate(map(len, old_lines), initial=0))
+    new_offsets = list(accumulate(map(len, new_lines), initial=0))
+    delta = []
+    for tag, i1, i2, j1, j2 in SequenceMatcher(None, old_lines, new_lines, autojunk=False).get_opcodes():
+        if tag == 'equal':
+            continue
+        old_span, new_span = ''.join(old_lines[i1:i2]), ''.join(new_lines[j1:j2])
+        prefix = 0
+        while prefix < min(len(old_span), len(new_span)) and old_span[prefix] == new_span[prefix]:
+            prefix += 1
+        suffix = 0
+        while (suffix < min(len(old_span), len(new_span)) - prefix
+               and old_span[-1 - suffix] == new_span[-1 - suffix]):
+            suffix += 1
+        delta.append([old_offsets[i1] + prefix, new_offsets[j1] + prefix,
+                      old_span[prefix:len(old_span) - suffix], new_span[prefix:len(new_span) - suffix]])
+    return delta
+
+
+def apply_delta(text, delta, reverse=False):
+    """Turn the old string into the new one (or back, with ``reverse``); HistoryConflict if ``text`` doesn't fit."""
+    pieces = []
+    position = 0
+    for old_at, new_at, old_span, new_span in delta:
+        at, removed, added = (new_at, new_span, old_span) if reverse else (old_at, old_span, new_span)
+        if text[at:at + len(removed)] != removed:
+            raise HistoryConflict(f"text at {at} has changed")
+        pieces += [text[position:at], added]
+        position = at + len(removed)
+    pieces.append(text[position:])
+    return ''.join(pieces)
+
+
+def record_diff(old, new):
+    """Field changes taking ``old`` to ``new``: ``{'field', 'old', 'new'}`` (a missing side left out) or ``{'field', 'delta'}``."""
+    changes = []
+    for field in list(old) + [field for field in new if field not in old]:
+        before, after = old.get(field), new.get(field)
+        if field in old and field in new and before == after:
+            continue
+        if isinstance(before, str) and isinstance(after, str) and max(len(before), len(after)) >= TEXT_DELTA_MIN:
+            changes.append({'field': field, 'delta': text_delta(before, after)})
+            continue
+        change = {'field': field}
+        if field in old:
+            change['old'] = before
+        if field in new:
+            change['new'] = after
+        changes.append(change)
+    return changes
+
+
+def apply_diff(record, changes, reverse=False):
+    """A copy of ``record`` with ``changes`` applied (or undone); HistoryConflict if a field has moved on."""
+    updated = dict(record)
+    expected_key, target_key = ('new', 'old') if reverse else ('old', 'new')
+    for change in changes:
+        field = change['field']
+        if 'delta' in change:
+            value = record.get(field)
+            if not isinstance(value, str):
+                raise HistoryConflict(f"{field}: is no longer text")
+            try:
+                updated[field] = apply_delta(value, change['delta'], reverse)
+            except HistoryConflict as e:
+                raise HistoryConflict(f"{field}: {e}") from None
+            continue
+        if (field in record) != (expected_key in change) or record.get(field) != change.get(expected_key):
+            raise HistoryConflict(f"{field}: has changed since")
+        if target_key in change:
+            updated[field] = change[target_key]
+        else:
+            del updated[field]
+    return updated
+
+
+def _entry_size(entry):
+    return len(json.dumps(entry, ensure_ascii=False))
+
+
+class UndoHistory:
+    """Undo and redo stacks of entries, within ``budget`` bytes and kept in a JSON file between runs.
+
+    An entry is ``{'data': data set name, 'label', 'time', 'records': [{'id', 'previous_id', 'fields'}]}``
+    where ``previous_id`` is the record's id before the change and ``id`` after it.
+    """
+
+    def __init__(self, path=HISTORY_FILE, budget=DEFAULT_BUDGET_BYTES):
+        self.path = path
+        self.budget = budget
+        self._undo = deque() # (size, entry), oldest first
+        self._redo = [] # (size, entry), next to redo last
+        self.size = 0
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') == HISTORY_VERSION:
+                for stack, entries in ((self._undo, data['undo']), (self._redo, data['redo'])):
+                    for entry in entries:
+                        stack.append((_entry_size(entry), entry))
+                self.size = sum(size for size, entry in self._undo) + sum(size for size, entry in self._redo)
+                self._evict()
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            pass # A missing or unreadable history just starts empty
+
+    def __len__(self):
+        return len(self._undo) + len(self._redo)
+
+    def record(self, data_name, label, changes):
+        """Add an entry for ``(old record, new record)`` pairs saved together; clears the redo stack."""
+        records = []
+        for old, new in changes:
+            fields = record_diff(old, new)
+            if fields:
+                records.append({'id': new.get('id'), 'previous_id': old.get('id'), 'fields': fields})
+        if not records:
+            return None
+        entry = {'data': data_name, 'label': label, 'time': time.time(), 'records': records}
+        self.size -= sum(size for size, redo_entry in self._redo)
+        self._redo.clear()
+        size = _entry_size(entry)
+        self._undo.append((size, entry))
+        self.size += size
+        self._evict()
+        return entry
+
+    def _evict(self):
+        # The latest entry stays even on its own over budget, or the last save couldn't be undone
+        while self.size > self.budget and len(self) > 1:
+            size, entry = self._undo.popleft() if self._undo else self._redo.pop(0)
+            self.size -= size
+
+    def next_undo(self):
+        return self._undo[-1][1] if self._undo else None
+
+    def next_redo(self):
+        return self._redo[-1][1] if self._redo else None
+
+    def undo(self, apply):
+        """Call ``apply(entry, reverse=True)`` for the latest entry and move it to the redo stack.
+
+        If ``apply`` raises (HistoryConflict, say), the entry stays where it was.
+        """
+        if not self._undo:
+            return None
+        apply(self._undo[-1][1], reverse=True)
+        item = self._undo.pop()
+        self._redo.append(item)
+        return item[1]
+
+    def redo(self, apply):
+        if not self._redo:
+            return None
+        apply(self._redo[-1][1], reverse=False)
+        item = self._redo.pop()
+        self._undo.append(item)
+        return item[1]
+
+    def save(self):
+        with atomic_replace(self.path) as f:
+            json.dump({'version': HISTORY_VERSION, 'undo': [entry for size, entry in self._undo],
+                       'redo': [entry for size, entry in self._redo]}, f, ensure_ascii=False)
+
+
+def revert_target(record_change, reverse):
+    """``(id to look up, id afterwards)`` for undoing (``reverse``) or redoing one record's change."""
+    if reverse:
+        return record_change['id'], record_change['previous_id']
+    return record_change['previous_id'], record_change['id']
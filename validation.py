@@ -0,0 +1,273 @@
+"""Schema checks for prediction and blog post records.
+
+Each schema is compiled once into a flat list of per-field check functions,
+so checking a record is a loop over closures. ``validate_file`` hashes every
+record's raw bytes and skips records whose hash passed last time, so a
+pre-commit run only parses what changed:
+
+    python validation.py                      # both data files
+    python validation.py src/data/predictions.json
+
+Exit status is 1 if anything fails. Hook it up with e.g.
+``echo 'python validation.py' > .git/hooks/pre-commit``.
+"""
+import argparse
+import datetime
+import hashlib
+import json
+import mmap
+import os
+import re
+import sys
+import time
+
+from lazy_records import scan_records
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+STATUS_FILE = os.path.join(SCRIPT_DIR, 'Status.txt')
+PREDICTIONS_FILE = os.path.join(SCRIPT_DIR, 'src', 'data', 'predictions.json')
+BLOG_POSTS_FILE = os.path.join(SCRIPT_DIR, 'src', 'data', 'blogPosts.json')
+SCHEMA_VERSION = 1 # Bump when the rules change, to drop cached results
+_ISO_DATE = re.compile(r'\d{4}-\d{2}-\d{2}')
+
+
+def load_status_values(path=STATUS_FILE):
+    with open(path, 'r', encoding='utf-8') as f:
+        return [line.strip() for line in f if line.strip()]
+
+
+# Field rules. Each returns a check(value) -> error message or None.
+def string(pattern=None, choices=None, non_empty=False):
+    regex = re.compile(pattern) if pattern else None
+    allowed = frozenset(choices) if choices is not None else None
+    def check(value):
+        if not isinstance(value, str):
+            return f"expected text, got {type(value).__name__}"
+        if non_empty and not value.strip():
+            return "must not be empty"
+        if regex is not None and not regex.fullmatch(value):
+            return f"{value!r} doesn't match {pattern}"
+        if allowed is not None and value not in allowed:
+            return f"{value!r} is not one of {', '.join(sorted(allowed))}"
+        return None
+    return check
+
+
+def iso_date():
+    def check(value):
+        if not isinstance(value, str) or not _ISO_DATE.fullmatch(value):
+            return f"{value!r} is not a YYYY-MM-DD date"
+        try:
+            datetime.date.fromisoformat(value)
+        except ValueError:
+            return f"{value!r} is not a valid date"
+        return None
+    return check
+
+
+def integer(minimum=None, maximum=None):
+    def check(value):
+        if isinstance(value, bool) or not isinstance(value, int):
+            return f"expected a whole number, got {type(value).__name__}"
+        if (minimum is not None and value < minimum) or (maximum is not None and value > maximum):
+            return f"{value} is outside {minimum}-{maximum}"
+        return None
+    return check
+
+
+def optional(rule):
+    return lambda value: None if value is None else rule(value)
+
+
+def list_of(rule):
+    def check(value):
+        if not isinstance(value, list):
+            return f"expected a list, got {type(value).__name__}"
+        for position, item in enumerate(value):
+            error = rule(item)
+            if error:
+                return f"item {position}: {error}"
+        return None
+    return check
+
+
+def obj(**field_rules):
+    def check(value):
+        if not isinstance(value, dict):
+            return f"expected an object, got {type(value).__name__}"
+        for key, rule in field_rules.items():
+            if key not in value:
+                return f"missing '{key}'"
+            error = rule(value[key])
+            if error:
+                return f"{key}: {error}"
+        return None
+    return check
+
+
+class RecordValidator:
+    """A compiled schema: ``{field: rule}`` plus the fields that must be present."""
+
+    def __init__(self, rules, required=('id',), fingerprint=''):
+        self._checks = tuple(rules.items())
+        self.required = tuple(required)
+        # Identifies the rules for the result cache
+        self.fingerprint = hashlib.blake2b(f"{SCHEMA_VERSION}|{fingerprint}".encode('utf-8'), digest_size=8).hexdigest()
+
+    def errors(self, record):
+        """List of ``"field: problem"`` strings; empty when the record is valid."""
+        if not isinstance(record, dict):
+            return ["record must be an object"]
+        errors = [f"{field}: missing" for field in self.required if field not in record]
+        for field, check in self._checks:
+            if field in record:
+                error = check(record[field])
+                if error:
+                    errors.append(f"{field}: {error}")
+        return errors
+
+
+def prediction_validator(status_values=None):
+    if status_values is None:
+        status_values = load_status_values()
+    text = optional(string())
+    rules = {
+        'id': string(pattern=r'P\d{3,}'),
+        'text': string(non_empty=True),
+        'originalScenario': text,
+        'predictedDate': text,
+        'categories': list_of(string(non_empty=True)),
+        'timelineSegment': text,
+        'status': optional(string(choices=status_values)),
+        'accuracyScore': optional(integer(0, 100)),
+        'qualitativeAccuracy': text,
+        'actualOutcome': text,
+        'supportingEvidence': list_of(obj(text=string(), url=string(pattern=r'https?://\S+'))),
+        'lastEvaluated': optional(iso_date()),
+        'analystCommentary': list_of(obj(date=iso_date(), comment=string())),
+    }
+    return RecordValidator(rules, required=('id', 'text'), fingerprint='prediction|' + '|'.join(status_values))
+
+
+def blog_post_validator():
+    rules = {
+        'id': string(pattern=r'B\d{3,}'),
+        'title': string(non_empty=True),
+        'date': iso_date(),
+        'author': string(),
+        'summary': string(),
+        'content': string(),
+        'tags': list_of(string(non_empty=True)),
+    }
+    return RecordValidator(rules, required=('id', 'title', 'date', 'content'), fingerprint='blog')
+
+
+def validator_for(path):
+    return blog_post_validator() if os.path.basename(path).startswith('blog') else prediction_validator()
+
+
+def duplicate_ids(ids):
+    seen = set()
+    duplicates = set()
+    for record_id in ids:
+        if record_id in seen:
+            duplicates.add(record_id)
+        seen.add(record_id)
+    return duplicates
+
+
+def cache_path_for(path):
+    directory, name = os.path.split(os.path.abspath(path))
+    return os.path.join(directory, f".{name}.validation-cache")
+
+
+def _load_cache(cache_path, fingerprint):
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return set()
+    if cache.get('fingerprint') != fingerprint:
+        return set()
+    return set(cache.get('valid', ()))
+
+
+def _raw_records(path):
+    """Yield ``(id, raw_bytes)`` per record, falling back to re-dumping if the layout is unusual."""
+    stubs = scan_records(path, ('id',))
+    if stubs is None:
+        with open(path, 'r', encoding='utf-8') as f:
+            records = json.load(f)
+        if not isinstance(records, list):
+            raise ValueError("expected a JSON array of records")
+        for record in records:
+            record_id = record.get('id') if isinstance(record, dict) else None
+            yield record_id, json.dumps(record, sort_keys=True, ensure_ascii=False).encode('utf-8')
+        return
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        for stub in stubs:
+            start, end = stub.span
+            yield stub.get('id'), data[start:end]
+
+
+def validate_file(path, validator=None, use_cache=True):
+    """Check every record in ``path``.
+
+    Returns ``(errors, stats)``: errors is a list of ``(id, message)``, stats
+    counts checked and cached records. Only records whose bytes changed since
+    the last clean check are parsed.
+    """
+    validator = validator or validator_for(path)
+    cache_path = cache_path_for(path)
+    known_valid = _load_cache(cache_path, validator.fingerprint) if use_cache else set()
+    valid = []
+    errors = []
+    ids = []
+    checked = 0
+    for record_id, raw in _raw_records(path):
+        ids.append(record_id)
+        digest = hashlib.blake2b(raw, digest_size=16).hexdigest()
+        if digest in known_valid:
+            valid.append(digest)
+            continue
+        checked += 1
+        record_errors = validator.errors(json.loads(raw))
+        if record_errors:
+            errors.extend((record_id, message) for message in record_errors)
+        else:
+            valid.append(digest)
+    for record_id in sorted(duplicate_ids(ids), key=str):
+        errors.append((record_id, "id: used by more than one record"))
+    if use_cache and checked:
+        try:
+            with open(cache_path, 'w', encoding='utf-8') as f:
+                json.dump({'fingerprint': validator.fingerprint, 'valid': valid}, f)
+        except OSError as e:
+            print(f"Warning: Could not write validation cache {cache_path}: {e}")
+    return errors, {'records': len(ids), 'checked': checked, 'cached': len(ids) - checked}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Validate prediction and blog post data files.")
+    parser.add_argument('files', nargs='*', default=[PREDICTIONS_FILE, BLOG_POSTS_FILE])
+    parser.add_argument('--no-cache', action='store_true', help="Re-check every record")
+    args = parser.parse_args(argv)
+    failed = False
+    for path in args.files:
+        started = time.perf_counter()
+        try:
+            errors, stats = validate_file(path, use_cache=not args.no_cache)
+        except (OSError, ValueError) as e:
+            print(f"{path}: {e}")
+            failed = True
+            continue
+        for record_id, message in errors:
+            print(f"{path}: {record_id or '-'}: {message}")
+        failed = failed or bool(errors)
+        print(f"{path}: {stats['records']} records, {stats['checked']} checked, {stats['cached']} unchanged, "
+              f"{len(errors)} problem{'s' if len(errors) != 1 else ''} ({(time.perf_counter() - started) * 1000:.0f} ms)")
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,67 @@
+"""Chromium-backed Markdown preview. Imported only when the preview is created."""
+import json
+
+from PyQt6.QtGui import QColor
+from PyQt6.QtWebEngineCore import QWebEngineScript, QWebEngineSettings
+from PyQt6.QtWebEngineWidgets import QWebEngineView
+
+from latency import LatencyRecorder
+from markdown_renderer import BlockRenderer, diff_blocks
+from tracing import span
+
+# Splices rendered blocks into #content. Runs in the application world, so page
+# JavaScript can stay disabled.
+PREVIEW_PATCH_SCRIPT = """
+(function (patch) {
+    var root = document.getElementById('content');
+    for (var i = 0; i < patch.remove; i++) {
+        root.removeChild(root.children[patch.start]);
+    }
+    var ref = root.children[patch.start] || null;
+    for (var j = 0; j < patch.insert.length; j++) {
+        var block = document.createElement('div');
+        block.className = 'md-block';
+        block.innerHTML = patch.insert[j];
+        root.insertBefore(block, ref);
+    }
+})(%s);
+"""
+
+
+class WebEnginePreview(QWebEngineView):
+    def __init__(self, shell_html, background_color, parent=None):
+        super().__init__(parent)
+        self.settings().setAttribute(QWebEngineSettings.WebAttribute.ScrollAnimatorEnabled, True)
+        self.settings().setAttribute(QWebEngineSettings.WebAttribute.JavascriptEnabled, False) # For security
+        self.settings().setAttribute(QWebEngineSettings.WebAttribute.LocalContentCanAccessRemoteUrls, False)
+        self.page().setBackgroundColor(QColor(background_color))
+
+        self.renderer = BlockRenderer()
+        self.render_latency = LatencyRecorder()
+        self._shown_blocks = [] # Blocks currently in the page DOM
+        self._latest_blocks = []
+        self._page_ready = False
+
+        # The shell is loaded once; later updates patch #content in place
+        self.loadFinished.connect(self._on_shell_loaded)
+        self.setHtml(shell_html)
+
+    def _on_shell_loaded(self, ok):
+        self._page_ready = ok
+        if ok:
+            self._shown_blocks = []
+            self._apply_blocks(self._latest_blocks)
+
+    def _apply_blocks(self, blocks):
+        start, remove, insert = diff_blocks(self._shown_blocks, blocks)
+        if remove or insert:
+            with span('preview.patch_dom', records=len(insert), removed=remove):
+                patch = json.dumps({"start": start, "remove": remove, "insert": insert})
+                self.page().runJavaScript(PREVIEW_PATCH_SCRIPT % patch, QWebEngineScript.ScriptWorldId.ApplicationWorld.value)
+        self._shown_blocks = blocks
+
+    def set_markdown_content(self, md_text):
+        with self.render_latency.measure():
+            self._latest_blocks = self.renderer.render_blocks(md_text)
+            if self._page_ready:
+                self._apply_blocks(self._latest_blocks)